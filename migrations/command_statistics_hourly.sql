@@ -0,0 +1,26 @@
+-- Hourly rollups of the command statistics, written by the bot together with the raw statistics.
+-- Run this once before deploying the bot version that writes the rollups, e.g.:
+--   psql "$POSTGRES_DSN" -f migrations/command_statistics_hourly.sql
+-- The backfill reads the whole command_statistics table, run it outside of peak hours.
+
+BEGIN;
+
+-- Commands used outside of guilds are counted with the guild id 0, so the id can be part of the primary key
+CREATE TABLE IF NOT EXISTS command_statistics_hourly (
+    hour timestamp NOT NULL,
+    guild_id bigint NOT NULL,
+    command text NOT NULL,
+    usage integer NOT NULL,
+    PRIMARY KEY (hour, guild_id, command)
+);
+
+CREATE INDEX IF NOT EXISTS command_statistics_hourly_guild_id_idx ON command_statistics_hourly (guild_id, hour);
+
+-- The table is only filled if it is empty, the raw statistics might already have been pruned
+INSERT INTO command_statistics_hourly (hour, guild_id, command, usage)
+SELECT date_trunc('hour', executed_at), coalesce(guild_id, 0), command, count(*)
+FROM command_statistics
+WHERE NOT EXISTS (SELECT 1 FROM command_statistics_hourly)
+GROUP BY 1, 2, 3;
+
+COMMIT;
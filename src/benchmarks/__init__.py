@@ -0,0 +1,5 @@
+"""Offline benchmarks for the hot paths of the bot.
+
+The benchmarks are run from the `src` directory, e.g. `python -m benchmarks.on_message`.
+They do not connect to Discord or Postgres.
+"""
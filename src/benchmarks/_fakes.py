@@ -0,0 +1,339 @@
+"""Lightweight stand-ins for the Discord objects and the database pool used by the benchmarks.
+
+The fakes only implement the attributes and methods the benchmarked code paths access.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import datetime
+import itertools
+import random
+import re
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+import discord
+
+from cache import CacheManager
+from lib.message_cache import MessageCache
+from translation import Translator
+
+type QueryHandler = Callable[..., Any]
+
+_WHITESPACE = re.compile(r"\s+")
+
+# The handler queries are attributed to. Tasks inherit the label of the context they were created in.
+query_label: contextvars.ContextVar[str] = contextvars.ContextVar("query_label", default="other")
+
+_ADMIN_PERMISSIONS = discord.Permissions.all()
+_MEMBER_PERMISSIONS = discord.Permissions(send_messages=True, read_message_history=True)
+
+
+def normalize_query(query: str) -> str:
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+class FakePool:
+    """An in-memory replacement for the parts of `asyncpg.Pool` the bot uses.
+
+    Queries are routed by their prefix, unknown queries raise a `LookupError`, so new
+    queries in the benchmarked paths do not go unnoticed. Every call is counted, optionally
+    with a simulated round trip latency.
+    """
+
+    def __init__(self, *, latency: float = 0.0):
+        self.latency = latency
+        self.queries: Counter[str] = Counter()
+        self.queries_by_label: Counter[str] = Counter()
+
+        self.tables: dict[str, dict[int, dict[str, Any]]] = {
+            "welcome_config": {},
+            "level_config": {},
+            "moderation_config": {},
+            "logging_config": {},
+        }
+        self.logging_settings: dict[int, list[dict[str, Any]]] = {}
+        self.level_user: dict[tuple[int, int], int] = {}
+        self.automoderation_user: dict[tuple[int, int], int] = {}
+
+        self._routes: list[tuple[str, QueryHandler]] = [
+            ("SELECT * FROM welcome_config", self._select_config("welcome_config")),
+            ("SELECT * FROM level_config", self._select_config("level_config")),
+            ("SELECT * FROM logging_config", self._select_config("logging_config")),
+            ("SELECT m.*, w.id as mwh_id", self._select_moderation),
+            ("SELECT l.*, w.id as mwh_id", self._select_logging_settings),
+            ("SELECT user_id, guild_id, xp FROM level_user", self._select_level_user),
+            ("INSERT INTO level_user", self._insert_level_user),
+            ("UPDATE level_user SET xp = xp +", self._update_level_user),
+            ("INSERT INTO automoderation_user", self._insert_points),
+            ("SELECT SUM(points) FROM automoderation_user", self._select_points),
+            ("UPDATE automoderation_user SET expires_at = now()", self._expire_points),
+        ]
+
+    @property
+    def total_queries(self) -> int:
+        return self.queries.total()
+
+    async def _query(self, query: str, args: tuple) -> Any:
+        query = normalize_query(query)
+        self.queries[query] += 1
+        self.queries_by_label[query_label.get()] += 1
+
+        await asyncio.sleep(self.latency)
+
+        for prefix, handler in self._routes:
+            if query.startswith(prefix):
+                return handler(*args)
+
+        raise LookupError(f"No fake handler for query: {query}")
+
+    async def fetch(self, query: str, *args) -> list[dict[str, Any]]:
+        return await self._query(query, args) or []
+
+    async def fetchrow(self, query: str, *args) -> dict[str, Any] | None:
+        return await self._query(query, args)
+
+    async def fetchval(self, query: str, *args) -> Any:
+        return await self._query(query, args)
+
+    async def execute(self, query: str, *args) -> str:
+        await self._query(query, args)
+        return "OK"
+
+    def _select_config(self, table: str) -> QueryHandler:
+        def handler(id: int) -> dict[str, Any] | None:
+            return self.tables[table].get(id)
+
+        return handler
+
+    def _select_moderation(self, id: int) -> dict[str, Any] | None:
+        row = self.tables["moderation_config"].get(id)
+        if row is None:
+            return None
+
+        return row | {"mwh_id": None, "mwh_token": None, "mwh_webhook_channel": None, "mwh_guild_id": None}
+
+    def _select_logging_settings(self, guild_id: int) -> list[dict[str, Any]]:
+        return [
+            setting | {"mwh_id": None, "mwh_token": None, "mwh_webhook_channel": None, "mwh_guild_id": None}
+            for setting in self.logging_settings.get(guild_id, [])
+        ]
+
+    def _select_level_user(self, guild_id: int, user_id: int) -> dict[str, Any] | None:
+        xp = self.level_user.get((guild_id, user_id))
+        if xp is None:
+            return None
+
+        return {"user_id": user_id, "guild_id": guild_id, "xp": xp}
+
+    def _insert_level_user(self, guild_id: int, user_id: int, xp: int) -> None:
+        self.level_user[guild_id, user_id] = xp
+
+    def _update_level_user(self, xp: int, user_id: int, guild_id: int) -> None:
+        self.level_user[guild_id, user_id] += xp
+
+    def _insert_points(self, guild_id: int, user_id: int, _expires_at, points: int, _reason: str) -> None:
+        self.automoderation_user[guild_id, user_id] = self.automoderation_user.get((guild_id, user_id), 0) + points
+
+    def _select_points(self, user_id: int, guild_id: int) -> int | None:
+        return self.automoderation_user.get((guild_id, user_id))
+
+    def _expire_points(self, user_id: int, guild_id: int) -> None:
+        self.automoderation_user.pop((guild_id, user_id), None)
+
+
+class FakeTree:
+    def __init__(self):
+        self.translator = Translator()
+
+    def add_command(self, *args, **kwargs) -> None:
+        pass
+
+    def remove_command(self, *args, **kwargs) -> None:
+        pass
+
+
+class FakeInviteGuild:
+    def __init__(self, id: int):
+        self.id = id
+
+
+class FakeInvite:
+    def __init__(self, code: str, guild_id: int):
+        self.code = code
+        self.guild = FakeInviteGuild(guild_id)
+
+
+class FakeBot:
+    """Implements the attributes of `Plyoox` the message handlers access.
+
+    REST calls made through the fakes are counted in `rest_calls`.
+    """
+
+    def __init__(self, pool: FakePool, *, rest_latency: float = 0.0):
+        self.db = pool
+        self.cache = CacheManager(pool)  # type: ignore
+        self.messages: MessageCache[FakeMessage] = MessageCache(max_length=2500)
+        self.tree = FakeTree()
+        self.imager_url = None
+        self.session = None
+        self.timer = None
+
+        self.rest_latency = rest_latency
+        self.rest_calls: Counter[str] = Counter()
+
+    async def rest(self, route: str) -> None:
+        self.rest_calls[route] += 1
+        await asyncio.sleep(self.rest_latency)
+
+    async def process_commands(self, message: FakeMessage) -> None:
+        pass
+
+    def dispatch(self, event: str, *args, **kwargs) -> None:
+        pass
+
+    async def fetch_invite(self, code: str, **kwargs) -> FakeInvite:
+        await self.rest("fetch_invite")
+
+        # Invites are generated as `<guild id>-<suffix>`
+        return FakeInvite(code, int(code.split("-")[0]))
+
+
+class FakeRole:
+    def __init__(self, id: int):
+        self.id = id
+
+    @property
+    def mention(self) -> str:
+        return f"<@&{self.id}>"
+
+
+class FakeGuild:
+    def __init__(self, bot: FakeBot, id: int, *, locale: discord.Locale):
+        self.id = id
+        self.name = f"Guild {id}"
+        self.preferred_locale = locale
+        self.chunked = True
+
+        self._bot = bot
+        self._roles: dict[int, FakeRole] = {}
+        self._channels: dict[int, FakeChannel] = {}
+        self.me = FakeMember(self, id, bot=True, permissions=_ADMIN_PERMISSIONS)
+
+    def get_role(self, id: int) -> FakeRole | None:
+        return self._roles.get(id)
+
+    def get_channel(self, id: int) -> FakeChannel | None:
+        return self._channels.get(id)
+
+    async def ban(self, user, **kwargs) -> None:
+        await self._bot.rest("ban")
+
+    async def kick(self, user, **kwargs) -> None:
+        await self._bot.rest("kick")
+
+
+class FakeMember:
+    def __init__(
+        self,
+        guild: FakeGuild,
+        id: int,
+        *,
+        bot: bool = False,
+        roles: list[int] | None = None,
+        permissions: discord.Permissions = _MEMBER_PERMISSIONS,
+        premium: bool = False,
+        avatar: bool = True,
+        joined_at: datetime.datetime | None = None,
+    ):
+        self.guild = guild
+        self.id = id
+        self.bot = bot
+        self.name = f"user{id}"
+        self.discriminator = "0"
+        self.avatar = "avatar" if avatar else None
+        self.guild_permissions = permissions
+        self.premium_since = discord.utils.utcnow() if premium else None
+        self.created_at = discord.utils.snowflake_time(id)
+        self.joined_at = joined_at or self.created_at
+        self._roles = roles or []
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    @property
+    def display_name(self) -> str:
+        return self.name
+
+    @property
+    def display_avatar(self) -> str:
+        return f"https://cdn.discordapp.com/avatars/{self.id}/{self.avatar or 'default'}.png"
+
+    @property
+    def roles(self) -> list[FakeRole]:
+        # The default role is always the first role
+        return [FakeRole(self.guild.id), *(FakeRole(id) for id in self._roles)]
+
+    def __str__(self) -> str:
+        return self.name
+
+    async def send(self, *args, **kwargs) -> None:
+        await self.guild._bot.rest("send_dm")
+
+    async def timeout(self, *args, **kwargs) -> None:
+        await self.guild._bot.rest("timeout")
+
+    async def add_roles(self, *roles, **kwargs) -> None:
+        await self.guild._bot.rest("add_roles")
+
+    async def remove_roles(self, *roles, **kwargs) -> None:
+        await self.guild._bot.rest("remove_roles")
+
+
+class FakeChannel:
+    def __init__(self, guild: FakeGuild, id: int, *, category_id: int | None = None):
+        self.guild = guild
+        self.id = id
+        self.category_id = category_id
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    def permissions_for(self, member: FakeMember) -> discord.Permissions:
+        return member.guild_permissions
+
+    async def send(self, *args, **kwargs) -> None:
+        await self.guild._bot.rest("send_message")
+
+
+class FakeMessage:
+    def __init__(self, id: int, *, channel: FakeChannel, author: FakeMember, content: str):
+        self.id = id
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content
+        self.created_at = discord.utils.snowflake_time(id)
+        self.attachments = []
+        self.embeds = []
+
+    async def delete(self, **kwargs) -> None:
+        await self.guild._bot.rest("delete_message")
+
+
+_SNOWFLAKE_COUNTER = itertools.count()
+
+
+def make_snowflake(timestamp: float) -> int:
+    """Creates a unique snowflake for the timestamp."""
+    dt = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+    return discord.utils.time_snowflake(dt) + next(_SNOWFLAKE_COUNTER) % 4096
+
+
+def random_snowflake(rng: random.Random) -> int:
+    return rng.randrange(100000000000000000, 999999999999999999)
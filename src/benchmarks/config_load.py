@@ -0,0 +1,146 @@
+"""Measures the time to decode the moderation config rows into the cache models.
+
+The action columns are `json[]`, so asyncpg decodes every action with the registered codec.
+The rows are decoded with the standard library and the previous action conversion, and
+with the codec of `lib.database` and `cache.manager.decode_moderation_actions`.
+
+Usage (from the `src` directory):
+
+    python -m benchmarks.config_load --rows 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cache.manager import decode_moderation_actions
+from cache.models import AutoModerationAction, AutoModerationCheck, AutoModerationPunishment, ModerationPoints
+from lib import database
+
+type Row = dict[str, list[str]]
+type Loader = Callable[[Row], dict[str, list[AutoModerationAction]]]
+
+ACTION_COLUMNS = ("point_actions", "invite_actions", "link_actions", "caps_actions")
+
+PUNISHMENTS: list[Any] = [
+    "delete",
+    "kick",
+    "ban",
+    {"tempmute": {"duration": 600}},
+    {"tempban": {"duration": 86400}},
+    {"point": {"points": 1, "expires_in": 3600}},
+    {"point": {"points": 3, "expires_in": 86400}},
+]
+
+CHECKS: list[Any] = [None, "no_role", "no_avatar", {"account_age": {"time": 604800}}, {"join_date": {"time": 3600}}]
+
+
+def to_moderation_actions_before(actions: list[dict] | None):
+    if not actions:
+        return []
+
+    formatted_actions = []
+
+    for action in actions:
+        punishment_key = action["punishment"]
+        duration = None
+        points = None
+
+        if isinstance(punishment_key, dict):
+            punishment_key = tuple(punishment_key.keys())[0]
+            duration = action["punishment"][punishment_key].get("duration")
+            amount = action["punishment"][punishment_key].get("points")
+
+            if amount is not None:
+                points = ModerationPoints(
+                    amount=amount,
+                    expires_in=action["punishment"][punishment_key].get("expires_in"),
+                )
+
+        punishment = AutoModerationPunishment(kind=punishment_key, points=points, duration=duration)
+
+        check = action.get("check")
+        if check is not None:
+            check_time = None
+
+            if isinstance(check, dict):
+                check = tuple(check.keys())[0]
+                check_time = action["check"][check].get("time")
+
+            check = AutoModerationCheck(kind=check, time=check_time)
+
+        formatted_actions.append(AutoModerationAction(punishment=punishment, check=check))
+
+    return formatted_actions
+
+
+def load_before(row: Row) -> dict[str, list[AutoModerationAction]]:
+    return {
+        column: to_moderation_actions_before([json.loads(action) for action in row[column]])
+        for column in ACTION_COLUMNS
+    }
+
+
+def load_after(row: Row) -> dict[str, list[AutoModerationAction]]:
+    json_loads = database.json_loads
+    return {
+        column: decode_moderation_actions([json_loads(action) for action in row[column]]) for column in ACTION_COLUMNS
+    }
+
+
+def generate_rows(rng: random.Random, count: int) -> list[Row]:
+    rows = []
+
+    for _index in range(count):
+        row = {}
+        for column in ACTION_COLUMNS:
+            actions = []
+            for _action in range(rng.randint(0, 4)):
+                action: dict[str, Any] = {"punishment": rng.choice(PUNISHMENTS)}
+                if (check := rng.choice(CHECKS)) is not None:
+                    action["check"] = check
+
+                actions.append(json.dumps(action))
+
+            row[column] = actions
+
+        rows.append(row)
+
+    return rows
+
+
+def run(loader: Loader, rows: list[Row]) -> float:
+    start = time.perf_counter()
+
+    for row in rows:
+        loader(row)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rows = generate_rows(random.Random(args.seed), args.rows)
+
+    for row in rows[:1000]:
+        assert repr(load_before(row)) == repr(load_after(row)), row
+
+    before = run(load_before, rows)
+    after = run(load_after, rows)
+
+    print(f"codec: {database.json_loads.__module__}")
+    print(f"{'before':>14}{'after':>14}{'speedup':>10}")
+    print(f"{args.rows / before:>12.0f}/s{args.rows / after:>12.0f}/s{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Measures the time to build the log embeds of member events.
+
+The embeds are built from the per-locale templates and compared with the previous
+implementation, which translated every static string of the embed for each event.
+
+Usage (from the `src` directory):
+
+    python -m benchmarks.embeds --events 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+import discord
+from discord.app_commands import locale_str as _
+
+from extensions import Logging
+from extensions.Moderation import _logging_helper
+from lib import colors, extensions, helper
+from lib.helper import italic
+from translation.translator import translate as global_translate
+
+from ._fakes import FakeBot, FakeGuild, FakeMember, FakePool, random_snowflake
+
+type Builder = Callable[[FakeBot, FakeMember], discord.Embed]
+
+LOCALES = [discord.Locale.german, discord.Locale.american_english, discord.Locale.french]
+
+
+def member_join_before(bot: FakeBot, member: FakeMember) -> discord.Embed:
+    def translate(string: _):
+        return global_translate(string, bot, member.guild.preferred_locale)
+
+    embed = extensions.Embed(
+        description=translate(_("The user {member.display_name} ({member}) has joined the guild.")).format(
+            member=member
+        ),
+        color=Logging.SUCCESS_COLOR,
+    )
+    embed.set_author(name=translate(_("User joined")), icon_url=member.display_avatar)
+    embed.add_field(name=translate(_("Account created at")), value=helper.embed_timestamp_format(member.created_at))
+    embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
+
+    return embed
+
+
+def member_join_after(bot: FakeBot, member: FakeMember) -> discord.Embed:
+    return Logging.MEMBER_JOIN_TEMPLATE.render(
+        bot,
+        member.guild.preferred_locale,
+        description={"member": member},
+        icon_url=member.display_avatar,
+        values=[helper.embed_timestamp_format(member.created_at)],
+        footer=member.id,
+    )
+
+
+def member_leave_before(bot: FakeBot, member: FakeMember) -> discord.Embed:
+    def translate(string: _):
+        return global_translate(string, bot, member.guild.preferred_locale)
+
+    embed = extensions.Embed(
+        description=translate(_("The user {member.display_name} ({member}) has left the guild.")).format(member=member),
+        color=Logging.ERROR_COLOR,
+    )
+    embed.set_author(name=translate(_("Member left")), icon_url=member.display_avatar)
+    embed.add_field(name=translate(_("Account created at")), value=helper.embed_timestamp_format(member.created_at))
+
+    roles = helper.format_roles(member.roles)
+    embed.add_field(name=translate(_("Roles")), value=f"> {roles}" if roles else italic(translate(_("No roles"))))
+
+    embed.add_field(name=translate(_("Joined at")), value=helper.embed_timestamp_format(member.joined_at))
+    embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
+
+    return embed
+
+
+def member_leave_after(bot: FakeBot, member: FakeMember) -> discord.Embed:
+    skeleton = Logging.MEMBER_LEAVE_TEMPLATE.get(bot, member.guild.preferred_locale)
+    return skeleton.render(
+        description={"member": member},
+        icon_url=member.display_avatar,
+        values=[
+            helper.embed_timestamp_format(member.created_at),
+            Logging._format_roles(skeleton, member.roles),
+            helper.embed_timestamp_format(member.joined_at),
+        ],
+        footer=member.id,
+    )
+
+
+def warn_before(bot: FakeBot, member: FakeMember) -> discord.Embed:
+    def translate(string: _):
+        return global_translate(string, bot, member.guild.preferred_locale)
+
+    moderator = member.guild.me
+
+    embed = extensions.Embed(
+        description=translate(
+            _("The user {target.mention} ({target}) has been warned by {moderator.mention} ({moderator}).")
+        ).format(target=member, moderator=moderator),
+        color=colors.POINT_COLOR,
+    )
+    embed.set_author(name=translate(_("User has been warned")), icon_url=member.display_avatar)
+    embed.add_field(name=translate(_("Reason")), value="> Spam")
+    embed.add_field(name=translate(_("Moderator")), value=f"> {moderator} ({moderator.id})")
+    embed.add_field(name=translate(_("Executed at")), value="> " + discord.utils.format_dt(member.created_at))
+    embed.add_field(name=translate(_("Points added")), value="> 3/10 [+1]")
+    embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
+    embed.add_field(name=translate(_("Received DM")), value="> " + translate(_("Yes")))
+
+    return embed
+
+
+def warn_after(bot: FakeBot, member: FakeMember) -> discord.Embed:
+    moderator = member.guild.me
+
+    skeleton = _logging_helper.WARN_TEMPLATE.get(bot, member.guild.preferred_locale)
+    return skeleton.render(
+        description={"target": member, "moderator": moderator},
+        icon_url=member.display_avatar,
+        values=[
+            "> Spam",
+            f"> {moderator} ({moderator.id})",
+            "> " + discord.utils.format_dt(member.created_at),
+            "> 3/10 [+1]",
+            _logging_helper._received_dm(skeleton, True),
+        ],
+        footer=member.id,
+    )
+
+
+BUILDERS: dict[str, tuple[Builder, Builder]] = {
+    "member_join": (member_join_before, member_join_after),
+    "member_leave": (member_leave_before, member_leave_after),
+    "warn": (warn_before, warn_after),
+}
+
+
+def run(bot: FakeBot, builder: Builder, members: list[FakeMember], events: int) -> float:
+    start = time.perf_counter()
+
+    for index in range(events):
+        builder(bot, members[index % len(members)])
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bot = FakeBot(FakePool())
+
+    members = []
+    for locale in LOCALES:
+        guild = FakeGuild(bot, random_snowflake(rng), locale=locale)
+
+        for _index in range(100):
+            roles = [random_snowflake(rng) for _role in range(rng.randint(0, 5))]
+            members.append(FakeMember(guild, random_snowflake(rng), roles=roles))
+
+    rng.shuffle(members)
+
+    print(f"{'event':<14}{'before':>14}{'after':>14}{'speedup':>10}")
+    for name, (before, after) in BUILDERS.items():
+        for member in members:
+            assert before(bot, member).to_dict() == after(bot, member).to_dict(), (name, member.id)
+
+        before_elapsed = run(bot, before, members, args.events)
+        after_elapsed = run(bot, after, members, args.events)
+
+        print(
+            f"{name:<14}{args.events / before_elapsed:>12.0f}/s{args.events / after_elapsed:>12.0f}/s"
+            f"{before_elapsed / after_elapsed:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""Replays a message stream through the `on_message` pipeline.
+
+The message handlers of `Plyoox`, `Leveling` and `Automod` are run for every message against
+fake guilds and an in-memory database. The benchmark reports the throughput, the latency per
+handler and the number of queries per message.
+
+Usage (from the `src` directory):
+
+    python -m benchmarks.on_message --messages 20000 --guilds 50
+    python -m benchmarks.on_message --record stream.jsonl
+    python -m benchmarks.on_message --replay stream.jsonl --db-latency 0.0005
+
+The stream is generated from the seed, so runs with the same arguments are reproducible.
+Recorded streams contain the world parameters in their first line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import discord
+
+from extensions.Leveling import Leveling
+from extensions.Moderation.automod import Automod
+from lib.enums import LoggingKind
+from main import Plyoox
+
+from ._fakes import (
+    FakeBot,
+    FakeChannel,
+    FakeGuild,
+    FakeMember,
+    FakeMessage,
+    FakePool,
+    FakeRole,
+    make_snowflake,
+    query_label,
+    random_snowflake,
+)
+
+type Event = dict[str, Any]
+type Handler = Callable[[FakeMessage], Awaitable[Any]]
+
+WORDS = (
+    "hello there how are you doing today i think this is fine what about the new update "
+    "anyone wants to play later gg wp lol nice that was close see you tomorrow thanks"
+).split()
+
+
+class World:
+    """The guilds, channels and members the stream is generated for."""
+
+    def __init__(self, bot: FakeBot, *, seed: int, guilds: int, members: int, channels: int):
+        self.params = {"seed": seed, "guilds": guilds, "members": members, "channels": channels}
+        self.guilds: dict[int, FakeGuild] = {}
+        self.members: dict[int, dict[int, FakeMember]] = {}
+
+        rng = random.Random(seed)
+
+        for _ in range(guilds):
+            guild = FakeGuild(
+                bot,
+                random_snowflake(rng),
+                locale=discord.Locale.german if rng.random() < 0.5 else discord.Locale.american_english,
+            )
+            self.guilds[guild.id] = guild
+
+            for _ in range(5):
+                role = FakeRole(random_snowflake(rng))
+                guild._roles[role.id] = role
+
+            category_id = random_snowflake(rng)
+            for _ in range(channels):
+                channel = FakeChannel(guild, random_snowflake(rng), category_id=category_id)
+                guild._channels[channel.id] = channel
+
+            role_ids = list(guild._roles)
+            self.members[guild.id] = {}
+            for _ in range(members):
+                member = FakeMember(
+                    guild,
+                    random_snowflake(rng),
+                    bot=rng.random() < 0.02,
+                    roles=rng.sample(role_ids, k=rng.randint(0, 2)),
+                    permissions=discord.Permissions.all() if rng.random() < 0.02 else discord.Permissions.none(),
+                    premium=rng.random() < 0.1,
+                    avatar=rng.random() > 0.1,
+                )
+                self.members[guild.id][member.id] = member
+
+            self._create_config(bot.db, rng, guild)
+
+    @staticmethod
+    def _create_config(pool: FakePool, rng: random.Random, guild: FakeGuild) -> None:
+        role_ids = list(guild._roles)
+        channel_ids = list(guild._channels)
+
+        if rng.random() < 0.8:
+            pool.tables["level_config"][guild.id] = {
+                "id": guild.id,
+                "active": rng.random() < 0.9,
+                "roles": [{"role": role_id, "level": level} for level, role_id in enumerate(role_ids[:3], start=1)],
+                "remove_roles": rng.random() < 0.5,
+                "exempt_role": role_ids[-1],
+                "exempt_channels": channel_ids[:1],
+                "message": None,
+                "channel": None,
+                "booster_xp_multiplier": 2 if rng.random() < 0.3 else None,
+            }
+
+        if rng.random() < 0.7:
+            pool.tables["moderation_config"][guild.id] = {
+                "id": guild.id,
+                "active": rng.random() < 0.85,
+                "logging_channel": None,
+                "notify_user": False,
+                "moderation_roles": role_ids[:1],
+                "ignored_roles": [],
+                "point_actions": [{"punishment": {"tempmute": {"duration": 600}}}],
+                "invite_active": True,
+                "invite_actions": [{"punishment": {"point": {"points": 3, "expires_in": 86400}}}],
+                "invite_exempt_channels": [],
+                "invite_exempt_roles": [],
+                "invite_exempt_guilds": [],
+                "link_active": rng.random() < 0.5,
+                "link_actions": [{"punishment": "delete"}],
+                "link_exempt_channels": channel_ids[-1:],
+                "link_exempt_roles": [],
+                "link_allow_list": ["example.com"],
+                "caps_active": True,
+                "caps_actions": [
+                    {"punishment": {"point": {"points": 1, "expires_in": 3600}}, "check": "no_role"},
+                    {"punishment": "delete"},
+                ],
+                "caps_exempt_channels": [],
+                "caps_exempt_roles": [],
+            }
+
+        if rng.random() < 0.5:
+            active = rng.random() < 0.7
+            pool.tables["logging_config"][guild.id] = {"id": guild.id, "active": active}
+            pool.logging_settings[guild.id] = [
+                {"kind": kind, "active": True, "channel": None, "exempt_channels": [], "exempt_roles": []}
+                for kind in (LoggingKind.message_edit, LoggingKind.message_delete)
+            ]
+
+
+def generate_stream(world: World, *, messages: int, rate: float) -> Iterator[Event]:
+    """Generates a stream of messages. `rate` is the number of messages per second of the stream."""
+    rng = random.Random(world.params["seed"] + 1)
+
+    # Some guilds and members are much more active than others
+    guild_ids = list(world.guilds)
+    guild_weights = [1 / (i + 1) for i in range(len(guild_ids))]
+
+    for index in range(messages):
+        guild_id = rng.choices(guild_ids, weights=guild_weights)[0]
+        guild = world.guilds[guild_id]
+        members = list(world.members[guild_id])
+
+        member_id = members[min(int(rng.expovariate(8 / len(members))), len(members) - 1)]
+        channel_id = rng.choice(list(guild._channels))
+
+        kind = rng.random()
+        words = " ".join(rng.choices(WORDS, k=rng.randint(2, 16)))
+
+        if kind < 0.05:
+            content = words.upper()
+        elif kind < 0.10:
+            content = f"{words} https://site{rng.randint(0, 20)}.net/page"
+        elif kind < 0.12:
+            content = f"{words} discord.gg/{guild_id}-{rng.randint(0, 9)}"
+        elif kind < 0.14:
+            content = f"join discord.gg/{rng.choice(guild_ids)}-{rng.randint(0, 99)}"
+        else:
+            content = words
+
+        yield {"guild": guild_id, "channel": channel_id, "author": member_id, "content": content, "at": index / rate}
+
+
+def _percentile(values: list[int], percentile: float) -> float:
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    return values[min(int(len(values) * percentile), len(values) - 1)]
+
+
+async def replay(world: World, bot: FakeBot, events: list[Event], *, warmup: int) -> dict[str, Any]:
+    pool = bot.db
+    leveling = Leveling(bot)  # type: ignore
+    automod = Automod(bot)  # type: ignore
+
+    handlers: list[tuple[str, Handler]] = [
+        ("bot", functools.partial(Plyoox.on_message, bot)),
+        ("leveling", leveling.on_message),
+        ("automod", automod.on_message),
+    ]
+    latencies: dict[str, list[int]] = {name: [] for name, _ in handlers}
+    message_latencies: list[int] = []
+
+    start_time = time.time()
+    started = 0.0
+
+    for index, event in enumerate(events):
+        if index == warmup:
+            pool.queries.clear()
+            pool.queries_by_label.clear()
+            bot.rest_calls.clear()
+            started = time.perf_counter()
+
+        guild = world.guilds[event["guild"]]
+        message = FakeMessage(
+            make_snowflake(start_time + event["at"]),
+            channel=guild.get_channel(event["channel"]),
+            author=world.members[guild.id][event["author"]],
+            content=event["content"],
+        )
+
+        message_start = time.perf_counter_ns()
+
+        for name, handler in handlers:
+            token = query_label.set(name)
+            handler_start = time.perf_counter_ns()
+
+            try:
+                await handler(message)
+            finally:
+                query_label.reset(token)
+
+            if index >= warmup:
+                latencies[name].append(time.perf_counter_ns() - handler_start)
+
+        if index >= warmup:
+            message_latencies.append(time.perf_counter_ns() - message_start)
+
+    elapsed = time.perf_counter() - started
+
+    # Queued automod actions are not part of the handler latency, but of the query counts.
+    await automod.executor.close(timeout=60)
+    measured = max(len(events) - warmup, 1)
+
+    def summary(values: list[int], label: str | None) -> dict[str, float]:
+        result = {
+            "p50_us": _percentile(values, 0.5) / 1000,
+            "p99_us": _percentile(values, 0.99) / 1000,
+            "max_us": max(values, default=0) / 1000,
+            "mean_us": statistics.fmean(values) / 1000 if values else 0.0,
+        }
+        if label is not None:
+            result["queries_per_message"] = pool.queries_by_label[label] / measured
+
+        return result
+
+    return {
+        "world": world.params,
+        "messages": measured,
+        "elapsed_s": elapsed,
+        "messages_per_s": measured / elapsed if elapsed else 0.0,
+        "handlers": {name: summary(latencies[name], name) for name in latencies},
+        "message": summary(message_latencies, None) | {"queries_per_message": pool.total_queries / measured},
+        "queries": dict(pool.queries.most_common()),
+        "rest_calls": dict(bot.rest_calls),
+        "automod_executor": automod.executor.metrics(),
+        "message_cache_size": len(bot.messages),
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(
+        f"{report['messages']} messages in {report['elapsed_s']:.3f}s "
+        f"({report['messages_per_s']:.0f} messages/s), world: {report['world']}"
+    )
+    print()
+    print(f"{'handler':<12}{'p50 us':>10}{'p99 us':>10}{'max us':>12}{'queries/msg':>14}")
+
+    for name, summary in (*report["handlers"].items(), ("total", report["message"])):
+        print(
+            f"{name:<12}{summary['p50_us']:>10.1f}{summary['p99_us']:>10.1f}"
+            f"{summary['max_us']:>12.1f}{summary['queries_per_message']:>14.3f}"
+        )
+
+    print()
+    print("Queries:")
+    for query, count in report["queries"].items():
+        print(f"{count:>8}  {query[:100]}")
+
+    print()
+    print(f"REST calls: {report['rest_calls']}")
+    print(f"Automod executor: {report['automod_executor']}")
+    print(f"Message cache size: {report['message_cache_size']}")
+
+
+def _read_stream(path: str) -> tuple[dict[str, int], list[Event]]:
+    with open(path, encoding="utf-8") as file:
+        params = json.loads(file.readline())["world"]
+        events = [json.loads(line) for line in file if line.strip()]
+
+    return params, events
+
+
+def _write_stream(path: str, world: World, events: list[Event]) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(json.dumps({"world": world.params}) + "\n")
+
+        for event in events:
+            file.write(json.dumps(event) + "\n")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--guilds", type=int, default=50)
+    parser.add_argument("--members", type=int, default=200, help="Members per guild")
+    parser.add_argument("--channels", type=int, default=8, help="Channels per guild")
+    parser.add_argument("--rate", type=float, default=200, help="Messages per second of the generated stream")
+    parser.add_argument("--warmup", type=int, default=0, help="Messages that are not measured")
+    parser.add_argument("--db-latency", type=float, default=0.0, help="Simulated query latency in seconds")
+    parser.add_argument("--rest-latency", type=float, default=0.0, help="Simulated REST latency in seconds")
+    parser.add_argument("--record", metavar="PATH", help="Write the generated stream to a file")
+    parser.add_argument("--replay", metavar="PATH", help="Replay a recorded stream")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.replay:
+        params, events = _read_stream(args.replay)
+    else:
+        params = {"seed": args.seed, "guilds": args.guilds, "members": args.members, "channels": args.channels}
+        events = None
+
+    # Leveling uses the module level random generator
+    random.seed(params["seed"])
+
+    bot = FakeBot(FakePool(latency=args.db_latency), rest_latency=args.rest_latency)
+    world = World(bot, **params)
+
+    if events is None:
+        events = list(generate_stream(world, messages=args.messages, rate=args.rate))
+
+    if args.record:
+        _write_stream(args.record, world, events)
+
+    report = await replay(world, bot, events, warmup=args.warmup)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
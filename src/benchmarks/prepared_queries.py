@@ -0,0 +1,143 @@
+"""Measures the latency of the level queries on a pool with short-lived connections.
+
+The pool replaces its connections after `--max-queries` queries, every new connection parses
+the queries again on their first call. The queries are run on a pool without and with the
+queries of `lib.queries` prepared by `lib.database.prepare_queries` when the connection is created.
+The time to create the connections is not included in the query latency.
+
+The benchmark needs a PostgreSQL database, the tables are created in the `plyoox_benchmark`
+schema, which is dropped afterwards.
+
+Usage (from the `src` directory):
+
+    POSTGRES_DSN=postgres://... python -m benchmarks.prepared_queries --calls 20000 --max-queries 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+import asyncpg
+
+from lib import database, queries
+
+SCHEMA = "plyoox_benchmark"
+LEVEL_QUERIES = (queries.LEVEL_USER_SELECT, queries.LEVEL_USER_INSERT, queries.LEVEL_USER_ADD_XP)
+
+type Init = Callable[[asyncpg.Connection], Awaitable[None]]
+
+
+async def _init_plain(conn: asyncpg.Connection) -> None:
+    pass
+
+
+async def _init_prepared(conn: asyncpg.Connection) -> None:
+    await database.prepare_queries(conn, LEVEL_QUERIES)
+
+
+async def setup(dsn: str) -> None:
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await conn.execute(f"CREATE SCHEMA {SCHEMA}")
+        await conn.execute(
+            f"CREATE TABLE {SCHEMA}.level_user (guild_id bigint NOT NULL, user_id bigint NOT NULL, "
+            "xp integer NOT NULL, message_count integer NOT NULL, PRIMARY KEY (guild_id, user_id))"
+        )
+    finally:
+        await conn.close()
+
+
+async def teardown(dsn: str) -> None:
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        await conn.close()
+
+
+async def run(dsn: str, init: Init, *, calls: int, max_queries: int, users: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    samples = []
+
+    pool = await asyncpg.create_pool(
+        dsn,
+        min_size=1,
+        max_size=1,
+        max_queries=max_queries,
+        max_cached_statement_lifetime=0,
+        init=init,
+        server_settings={"search_path": SCHEMA},
+    )
+
+    try:
+        await pool.execute("TRUNCATE level_user")
+
+        for _index in range(calls):
+            guild_id = rng.randrange(10)
+            user_id = rng.randrange(users)
+
+            # The connection is acquired first, so new connections are not part of the latency
+            async with pool.acquire() as conn:
+                start = time.perf_counter()
+
+                if await conn.fetchrow(queries.LEVEL_USER_SELECT, guild_id, user_id) is None:
+                    await conn.execute(queries.LEVEL_USER_INSERT, guild_id, user_id, 10)
+                else:
+                    await conn.execute(queries.LEVEL_USER_ADD_XP, 10, user_id, guild_id)
+
+                samples.append(time.perf_counter() - start)
+    finally:
+        await pool.close()
+
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(int(len(samples) * 0.99), len(samples) - 1)]
+
+    print(f"{name:<10}{statistics.fmean(samples) * 1e6:>10.0f}µs{p50 * 1e6:>10.0f}µs{p99 * 1e6:>10.0f}µs")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--max-queries", type=int, default=20, help="queries before a connection is replaced")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dsn = os.getenv("POSTGRES_DSN")
+    if not dsn:
+        sys.exit("POSTGRES_DSN is not set")
+
+    await setup(dsn)
+
+    try:
+        results = {}
+        for name, init in (("plain", _init_plain), ("prepared", _init_prepared)):
+            results[name] = await run(
+                dsn, init, calls=args.calls, max_queries=args.max_queries, users=args.users, seed=args.seed
+            )
+    finally:
+        await teardown(dsn)
+
+    print(f"{'':<10}{'mean':>12}{'p50':>12}{'p99':>12}")
+    for name, samples in results.items():
+        report(name, samples)
+
+    plain, prepared = statistics.fmean(results["plain"]), statistics.fmean(results["prepared"])
+    print(f"saved per call: {(plain - prepared) * 1e6:.0f}µs ({plain / prepared:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""Measures the translations per second of the translator.
+
+The current translator is compared with the previous implementation, which loaded the
+catalogs with `gettext.translation` for every translated string.
+
+Usage (from the `src` directory):
+
+    python -m benchmarks.translation --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gettext
+import time
+
+import discord
+from discord.app_commands import TranslationContext, TranslationContextLocation
+from discord.app_commands import locale_str as _
+
+from translation import Translator
+from translation.translator import DOMAIN, EmptyTranslations, _LOCALES_PATH, get_locale
+
+# The labels of the duration autocomplete and some common log labels
+STRINGS = [
+    _("minutes"),
+    _("hours"),
+    _("day"),
+    _("days"),
+    _("month"),
+    _("Reason"),
+    _("User Id"),
+    _("Executed at"),
+    _("Received DM"),
+    _("Yes"),
+    _("No"),
+]
+LOCALES = [discord.Locale.german, discord.Locale.american_english, discord.Locale.french]
+
+
+def translate_uncached(string: _, locale: discord.Locale) -> str:
+    """The previous implementation of `GettextTranslator.translate`."""
+    t = gettext.translation(domain=DOMAIN, localedir=str(_LOCALES_PATH), languages=(get_locale(locale), "en_US"))
+    t.add_fallback(EmptyTranslations())
+
+    return t.gettext(string.message)
+
+
+def run(name: str, translate, iterations: int) -> float:
+    start = time.perf_counter()
+
+    for index in range(iterations):
+        translate(STRINGS[index % len(STRINGS)], LOCALES[index % len(LOCALES)])
+
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10}{iterations / elapsed:>14.0f} translations/s")
+
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    translator = Translator()
+    context = TranslationContext(location=TranslationContextLocation.other, data=None)
+
+    for string in STRINGS:
+        for locale in LOCALES:
+            expected = translate_uncached(string, locale)
+            assert translator.translate(string, locale, context) == expected, (string, locale)
+
+    before = run("before", translate_uncached, args.iterations)
+    after = run("after", lambda string, locale: translator.translate(string, locale, context), args.iterations)
+
+    print(f"speedup   {before / after:>14.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Iterable
 from typing import Literal
 
 from discord import utils
@@ -6,6 +7,7 @@ from discord import utils
 import asyncpg
 from lru import LRU
 
+from lib import queries
 from lib.enums import LoggingKind
 
 from .models import (
@@ -29,6 +31,43 @@ type CacheType = Literal["wel", "log", "lvl", "mod", "automod", "punishment"]
 type Falsify = None | bool
 
 
+def decode_moderation_actions(actions: list[dict] | None) -> list[AutoModerationAction]:
+    """Converts the decoded JSON of an action list into the action models.
+
+    A punishment or check is either its kind, or an object with the kind as the only key
+    and the options as value, e.g. `{"tempmute": {"duration": 600}}`.
+    """
+    if not actions:
+        return []
+
+    formatted_actions = []
+
+    for action in actions:
+        punishment = action["punishment"]
+        if isinstance(punishment, dict):
+            kind, options = next(iter(punishment.items()))
+
+            amount = options.get("points")
+            points = (
+                ModerationPoints(amount=amount, expires_in=options.get("expires_in")) if amount is not None else None
+            )
+            punishment = AutoModerationPunishment(kind=kind, points=points, duration=options.get("duration"))
+        else:
+            punishment = AutoModerationPunishment(kind=punishment, points=None, duration=None)
+
+        check = action.get("check")
+        if check is not None:
+            if isinstance(check, dict):
+                kind, options = next(iter(check.items()))
+                check = AutoModerationCheck(kind=kind, time=options.get("time"))
+            else:
+                check = AutoModerationCheck(kind=check, time=None)
+
+        formatted_actions.append(AutoModerationAction(punishment=punishment, check=check))
+
+    return formatted_actions
+
+
 class CacheManager:
     __slots__ = (
         "_pool",
@@ -39,6 +78,7 @@ class CacheManager:
         "_automoderation",
         "_automoderation_queue",
         "_punishment_cache",
+        "_generations",
     )
 
     def __init__(self, pool: asyncpg.Pool, cache_size: int = 128):
@@ -54,44 +94,11 @@ class CacheManager:
         self._logging = LRU(cache_size * 2)
         self._moderation = LRU(cache_size * 2)
 
-    @staticmethod
-    def __to_moderation_actions(actions: list[dict] | None):
-        if not actions:
-            return []
-
-        formatted_actions = []
-
-        for action in actions:
-            punishment_key = action["punishment"]
-            duration = None
-            points = None
-
-            if isinstance(punishment_key, dict):
-                punishment_key = tuple(punishment_key.keys())[0]
-                duration = action["punishment"][punishment_key].get("duration")
-                amount = action["punishment"][punishment_key].get("points")
-
-                if amount is not None:
-                    points = ModerationPoints(
-                        amount=amount,
-                        expires_in=action["punishment"][punishment_key].get("expires_in"),
-                    )
-
-            punishment = AutoModerationPunishment(kind=punishment_key, points=points, duration=duration)
-
-            check = action.get("check")
-            if check is not None:
-                check_time = None
-
-                if isinstance(check, dict):
-                    check = tuple(check.keys())[0]
-                    check_time = action["check"][check].get("time")
-
-                check = AutoModerationCheck(kind=check, time=check_time)
-
-            formatted_actions.append(AutoModerationAction(punishment=punishment, check=check))
-
-        return formatted_actions
+        # Incremented when entries of the store are removed, results that have been fetched
+        # before an invalidation are not cached, because they might be outdated
+        self._generations: dict[CacheType, int] = dict.fromkeys(
+            ("wel", "log", "lvl", "mod", "automod", "punishment"), 0
+        )
 
     async def get_welcome(self, id: int) -> WelcomeModel | Falsify:
         """
@@ -104,19 +111,22 @@ class CacheManager:
         if guild_cache is not utils.MISSING:
             return guild_cache
 
-        result = await self._pool.fetchrow("SELECT * FROM welcome_config WHERE id = $1", id)
+        generation = self._generations["wel"]
+
+        result = await queries.fetch_welcome_config(self._pool, id)
         if result is None:
-            self._welcome[id] = False
+            self._set("wel", id, False, generation)
             return None
 
         if not result["active"]:
-            self._welcome[id] = False
+            self._set("wel", id, False, generation)
             return False
 
         result = dict(result)
         del result["id"], result["active"]
 
-        self._welcome[id] = model = WelcomeModel(**result)
+        model = WelcomeModel(**result)
+        self._set("wel", id, model, generation)
 
         return model
 
@@ -130,13 +140,15 @@ class CacheManager:
         if guild_cache is not utils.MISSING:
             return guild_cache
 
-        result = await self._pool.fetchrow("SELECT * FROM level_config WHERE id = $1", id)
+        generation = self._generations["lvl"]
+
+        result = await queries.fetch_level_config(self._pool, id)
         if result is None:
-            self._leveling[id] = None
+            self._set("lvl", id, None, generation)
             return
 
         if not result["active"]:
-            self._leveling[id] = False
+            self._set("lvl", id, False, generation)
             return False
 
         result = dict(result)
@@ -153,7 +165,7 @@ class CacheManager:
             channel=result["channel"],
             booster_xp_multiplier=result["booster_xp_multiplier"],
         )
-        self._leveling[id] = model
+        self._set("lvl", id, model, generation)
 
         return model
 
@@ -163,14 +175,11 @@ class CacheManager:
         if guild_cache:
             return guild_cache
 
-        result = await self._pool.fetchrow(
-            "SELECT m.*, w.id as mwh_id, w.token as mwh_token, w.webhook_channel as mwh_webhook_channel, "
-            "w.guild_id as mwh_guild_id FROM moderation_config m LEFT JOIN public.maybe_webhook w "
-            "ON w.id = m.logging_channel WHERE m.id = $1",
-            id,
-        )
+        generation = self._generations["mod"]
+
+        result = await queries.fetch_moderation_config(self._pool, id)
         if result is None:
-            self._moderation[id] = None
+            self._set("mod", id, None, generation)
             return None
 
         if result["logging_channel"]:
@@ -185,28 +194,28 @@ class CacheManager:
 
         model = ModerationModel(
             active=result["active"],
-            invite_actions=self.__to_moderation_actions(result["invite_actions"]),
+            invite_actions=decode_moderation_actions(result["invite_actions"]),
             invite_active=result["invite_active"],
             invite_exempt_channels=result["invite_exempt_channels"] or [],
             invite_exempt_roles=result["invite_exempt_roles"] or [],
             invite_exempt_guilds=result["invite_exempt_guilds"] or [],
-            caps_actions=self.__to_moderation_actions(result["caps_actions"]),
+            caps_actions=decode_moderation_actions(result["caps_actions"]),
             caps_active=result["caps_active"],
             caps_exempt_roles=result["caps_exempt_roles"] or [],
             caps_exempt_channels=result["caps_exempt_channels"] or [],
             logging_channel=logging_channel,
-            point_actions=self.__to_moderation_actions(result["point_actions"]),
+            point_actions=decode_moderation_actions(result["point_actions"]),
             link_allow_list=result["link_allow_list"] or [],
             link_active=result["link_active"],
             link_exempt_channels=result["link_exempt_channels"] or [],
             link_exempt_roles=result["link_exempt_roles"] or [],
-            link_actions=self.__to_moderation_actions(result["link_actions"]),
+            link_actions=decode_moderation_actions(result["link_actions"]),
             moderation_roles=result["moderation_roles"] or [],
             notify_user=result["notify_user"],
             ignored_roles=result["ignored_roles"] or [],
         )
 
-        self._moderation[id] = model
+        self._set("mod", id, model, generation)
 
         return model
 
@@ -220,21 +229,18 @@ class CacheManager:
         if guild_cache is not utils.MISSING:
             return guild_cache
 
-        result = await self._pool.fetchrow("SELECT * FROM logging_config WHERE id = $1", id)
+        generation = self._generations["log"]
+
+        result = await queries.fetch_logging_config(self._pool, id)
         if result is None:
-            self._logging[id] = None
+            self._set("log", id, None, generation)
             return None
 
         if not result["active"]:
-            self._logging[id] = False
+            self._set("log", id, False, generation)
             return False
 
-        settings_query = await self._pool.fetch(
-            "SELECT l.*, w.id as mwh_id, w.token as mwh_token, w.webhook_channel as mwh_webhook_channel, "
-            " w.guild_id as mwh_guild_id FROM logging_settings l LEFT JOIN maybe_webhook w ON w.id = l.channel "
-            "WHERE l.guild_id = $1 AND active = true",
-            id,
-        )
+        settings_query = await queries.fetch_logging_settings(self._pool, id)
         settings: dict[LoggingKind, LoggingSettings] = {}
 
         for setting in settings_query:
@@ -262,7 +268,7 @@ class CacheManager:
             settings[setting["kind"]] = current_setting
 
         model = LoggingModel(settings=settings)
-        self._logging[id] = model
+        self._set("log", id, model, generation)
 
         return model
 
@@ -271,9 +277,9 @@ class CacheManager:
         if punishment_cache is not utils.MISSING:
             return punishment_cache
 
-        rows = await self._pool.fetch(
-            "SELECT id, actions, enabled, name, reason FROM moderation_punishment WHERE guild_id = $1", id
-        )
+        generation = self._generations["punishment"]
+
+        rows = await queries.fetch_moderation_punishments(self._pool, id)
 
         punishments = dict()
 
@@ -283,14 +289,14 @@ class CacheManager:
 
             punishment = Punishment(
                 id=row["id"],
-                actions=self.__to_moderation_actions(row["actions"]),
+                actions=decode_moderation_actions(row["actions"]),
                 name=row["name"],
                 reason=row["reason"],
             )
 
             punishments[row["id"]] = punishment
 
-        self._punishment_cache[id] = punishments
+        self._set("punishment", id, punishments, generation)
 
         return punishments
 
@@ -302,16 +308,21 @@ class CacheManager:
 
         if event := self._automoderation_queue.get(rule_id):
             await event.wait()
-            return self._automoderation.get(rule_id, None)
+
+            rule_cache = self._automoderation.get(rule_id, utils.MISSING)
+            if rule_cache is not utils.MISSING:
+                return rule_cache
+
+            # The rule has been invalidated while it was fetched
+            return await self.get_moderation_rule(rule_id)
 
         self._automoderation_queue[rule_id] = event = asyncio.Event()
+        generation = self._generations["automod"]
 
-        result = await self._pool.fetchrow(
-            "SELECT actions, guild_id, reason FROM automoderation_rule WHERE rule_id = $1", rule_id
-        )
+        result = await queries.fetch_automoderation_rule(self._pool, rule_id)
         # Rule does not exist
         if result is None:
-            self._automoderation[rule_id] = None
+            self._set("automod", rule_id, None, generation)
             del self._automoderation_queue[rule_id]
             event.set()
 
@@ -319,17 +330,16 @@ class CacheManager:
 
         # If the rule has no actions, there is no need to store it
         if not result["actions"]:
-            self._automoderation[rule_id] = False
+            self._set("automod", rule_id, False, generation)
             del self._automoderation_queue[rule_id]
             event.set()
 
             return False
 
-        rule_actions = self.__to_moderation_actions(result["actions"])
+        rule_actions = decode_moderation_actions(result["actions"])
 
-        self._automoderation[rule_id] = rule = ModerationRule(
-            guild_id=result["guild_id"], actions=rule_actions, reason=result["reason"]
-        )
+        rule = ModerationRule(guild_id=result["guild_id"], actions=rule_actions, reason=result["reason"])
+        self._set("automod", rule_id, rule, generation)
 
         del self._automoderation_queue[rule_id]
         event.set()
@@ -350,11 +360,43 @@ class CacheManager:
         elif cache == "punishment":
             return self._punishment_cache
 
+    def stats(self) -> dict[CacheType, tuple[int, int, int]]:
+        """Returns the number of entries, hits and misses of every store."""
+        stats = {}
+
+        for store_key in ("wel", "log", "lvl", "mod", "automod", "punishment"):
+            store = self._get_store(store_key)
+            hits, misses = store.get_stats()
+
+            stats[store_key] = (len(store), hits, misses)
+
+        return stats
+
+    def _set(self, store_key: CacheType, id: int, value, generation: int) -> None:
+        """Caches the value, unless the store has been invalidated since `generation` was read."""
+        if self._generations[store_key] == generation:
+            self._get_store(store_key)[id] = value
+
     def remove_cache(self, id: int, store_key: CacheType) -> None:
+        self._generations[store_key] += 1
+
         store = self._get_store(store_key)
-        if store.get(id, None):
+        if id in store:
             del store[id]
 
+    def remove_many(self, ids: Iterable[int], store_key: CacheType) -> None:
+        self._generations[store_key] += 1
+        store = self._get_store(store_key)
+
+        for id in ids:
+            if id in store:
+                del store[id]
+
+    def flush(self, store_key: CacheType) -> None:
+        """Removes all entries of the store."""
+        self._generations[store_key] += 1
+        self._get_store(store_key).clear()
+
     def edit_cache(self, id: int, store: Literal["wel", "log", "lvl", "mod"], **kwargs) -> None:
         store = self._get_store(store)
         guild_cache = store.get(id, None)
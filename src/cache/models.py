@@ -124,3 +124,17 @@ class Punishment(RecordClass):
     name: str
     reason: str | None
     actions: list[AutoModerationAction]
+
+
+class NotificationSubscription(RecordClass):
+    guild_id: int
+    channel: int
+    message: str | None
+
+
+class TwitchStreamerModel(RecordClass):
+    user_id: int
+    login: str
+    display_name: str
+    profile_image_url: str
+    subscriptions: list[NotificationSubscription]
@@ -4,7 +4,9 @@ import datetime
 import logging
 import os
 import re
+import threading
 import traceback
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import discord
@@ -23,6 +25,98 @@ LOGGING_COLORS = {
 
 RESUME_REGEX = re.compile(r"Shard ID (\d|None) has successfully RESUMED session.+")
 
+_log = logging.getLogger(__name__)
+
+
+# Limits of a single webhook message
+MAX_EMBEDS = 10
+MAX_MESSAGE_LENGTH = 6000
+MAX_DESCRIPTION_LENGTH = 4096
+
+# Webhooks allow 30 messages per minute, the shipper runs every 10 seconds
+MAX_MESSAGES_PER_RUN = 3
+
+
+def _record_key(record: logging.LogRecord) -> tuple:
+    # The messages are formatted with f-strings, so they are not part of the key
+    return record.name, record.levelno, record.pathname, record.lineno
+
+
+class _BufferedRecord:
+    __slots__ = ("record", "count", "first", "last")
+
+    def __init__(self, record: logging.LogRecord):
+        self.record = record
+        self.count = 1
+        self.first = record.created
+        self.last = record.created
+
+
+class LogRecordBuffer:
+    """A bounded buffer of log records. Records can be added from any thread.
+
+    Repeated records (same logger, level and call site) are combined into one entry with a counter,
+    the entry keeps the latest record.
+    If the buffer is full, the oldest entry is dropped and counted.
+    """
+
+    def __init__(self, max_records: int = 500):
+        self._max_records = max_records
+        self._records: OrderedDict[tuple, _BufferedRecord] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record: logging.LogRecord) -> None:
+        key = _record_key(record)
+
+        with self._lock:
+            entry = self._records.get(key)
+            if entry is not None:
+                entry.record = record
+                entry.count += 1
+                entry.last = record.created
+                return
+
+            if len(self._records) >= self._max_records:
+                self._records.popitem(last=False)
+                self.dropped += 1
+
+            self._records[key] = _BufferedRecord(record)
+
+    def take(self, count: int) -> tuple[list[_BufferedRecord], int]:
+        """Removes the oldest entries from the buffer. Returns the entries
+        and the number of records that have been dropped since the last call.
+        """
+        with self._lock:
+            entries = [self._records.popitem(last=False)[1] for _ in range(min(count, len(self._records)))]
+
+            dropped = self.dropped
+            self.dropped = 0
+
+        return entries, dropped
+
+    def put_back(self, entries: list[_BufferedRecord]) -> None:
+        """Adds entries that could not be sent back to the front of the buffer."""
+        with self._lock:
+            for entry in reversed(entries):
+                key = _record_key(entry.record)
+
+                if (existing := self._records.get(key)) is not None:
+                    existing.count += entry.count
+                    existing.first = entry.first
+                    continue
+
+                if len(self._records) >= self._max_records:
+                    self.dropped += entry.count
+                    continue
+
+                self._records[key] = entry
+                self._records.move_to_end(key, last=False)
+
 
 class DiscordNotificationLoggingHandler(logging.Handler):
     def __init__(self, cog: EventHandlerCog):
@@ -36,16 +130,51 @@ class DiscordNotificationLoggingHandler(logging.Handler):
         elif hasattr(record, "message") and RESUME_REGEX.match(record.message):
             return False
 
+        # Only forward the event loop lag that crossed the alert level
+        elif record.name == "lib.loop_monitor" and record.levelno < logging.WARNING:
+            return False
+
         return True
 
     def emit(self, record: logging.LogRecord) -> None:
+        # The record is formatted when it is sent
         self.cog.add_logging_record(record)
 
 
+def _format_record(entry: _BufferedRecord) -> discord.Embed:
+    record = entry.record
+
+    embed = discord.Embed(
+        title=record.name,
+        color=LOGGING_COLORS[record.levelno],
+        timestamp=datetime.datetime.fromtimestamp(entry.last, datetime.timezone.utc),
+    )
+
+    description = record.getMessage()
+    if record.exc_info:
+        err_type, err_value, err_traceback = record.exc_info
+        formatted = "".join(traceback.format_exception(err_type, err_value, err_traceback))
+
+        # Keep the end of the traceback, which contains the error
+        available = MAX_DESCRIPTION_LENGTH - len(description) - 12
+        if len(formatted) > available:
+            formatted = "..." + formatted[-(available - 3) :]
+
+        description = f"{description}: ```py\n{formatted}```"
+
+    embed.description = description[:MAX_DESCRIPTION_LENGTH]
+
+    if entry.count > 1:
+        first = datetime.datetime.fromtimestamp(entry.first, datetime.timezone.utc)
+        embed.set_footer(text=f"Repeated {entry.count} times since {first:%Y-%m-%d %H:%M:%S} UTC")
+
+    return embed
+
+
 class EventHandlerCog(commands.Cog):
     def __init__(self, bot: Plyoox, webhook: discord.Webhook | None):
         self.bot = bot
-        self._logging_data: list[logging.LogRecord] = []
+        self._logging_data = LogRecordBuffer()
         self._logging_webhook = webhook
 
         if webhook is not None:
@@ -54,37 +183,52 @@ class EventHandlerCog(commands.Cog):
     def cog_unload(self):
         self.send_logging_data.cancel()
 
+    @property
+    def queue_depth(self) -> int:
+        """The number of log records that have not been sent yet."""
+        return len(self._logging_data)
+
     def add_logging_record(self, record: logging.LogRecord) -> None:
-        self._logging_data.append(record)
+        self._logging_data.add(record)
 
-    @tasks.loop(seconds=60)
+    @tasks.loop(seconds=10)
     async def send_logging_data(self):
-        if not self._logging_data:
-            return
-
-        embeds = []
-        message_length = 0
-
-        for record in self._logging_data[:10]:
-            embed = discord.Embed(
-                title=record.name,
-                color=LOGGING_COLORS[record.levelno],
-                timestamp=datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc),
-            )
-
-            if record.exc_info:
-                err_type, err_value, err_traceback = record.exc_info
-                embed.description = f"{record.message}: ```py\n{''.join(traceback.format_exception(err_type, err_value, err_traceback))}```"
-            else:
-                embed.description = record.message
-
-            if message_length + len(embed) <= 6000:
+        for _ in range(MAX_MESSAGES_PER_RUN):
+            if not self._logging_data and not self._logging_data.dropped:
+                return
+
+            entries, dropped = self._logging_data.take(MAX_EMBEDS)
+
+            embeds = []
+            sent = []
+            message_length = 0
+
+            if dropped:
+                embed = discord.Embed(
+                    description=f"{dropped} log records have been dropped because the buffer was full.",
+                    color=LOGGING_COLORS[logging.WARNING],
+                )
                 embeds.append(embed)
-                self._logging_data.remove(record)
-            else:
-                break
+                message_length += len(embed)
+
+            for index, entry in enumerate(entries):
+                embed = _format_record(entry)
 
-        await self._logging_webhook.send(embeds=embeds)
+                if len(embeds) == MAX_EMBEDS or message_length + len(embed) > MAX_MESSAGE_LENGTH:
+                    self._logging_data.put_back(entries[index:])
+                    break
+
+                embeds.append(embed)
+                sent.append(entry)
+                message_length += len(embed)
+
+            try:
+                await self._logging_webhook.send(embeds=embeds)
+            except discord.HTTPException as e:
+                # Repeated errors are combined by the buffer, so this does not flood it
+                _log.warning(f"Could not send {len(embeds)} log records: {e}")
+                self._logging_data.put_back(sent)
+                return
 
     @send_logging_data.before_loop
     async def before_send_logging_data(self):
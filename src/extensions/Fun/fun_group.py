@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import random
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
 import discord
@@ -14,6 +15,8 @@ from lib import extensions
 if TYPE_CHECKING:
     from main import Plyoox
 
+GIFS_PATH = Path(__file__).parent / "gifs.json"
+
 
 @app_commands.guild_only
 class Fun(commands.GroupCog, group_name="fun", group_description=_("Provides fun commands.")):
@@ -23,7 +26,7 @@ class Fun(commands.GroupCog, group_name="fun", group_description=_("Provides fun
         self.bot = bot
 
     async def cog_load(self) -> None:
-        with open("src/extensions/Fun/gifs.json") as f:
+        with open(GIFS_PATH) as f:
             self.gifs = json.load(f)
 
     @app_commands.command(name="coinflip", description=_("Flip a coin."))
@@ -22,13 +22,8 @@ class GuildGroup(app_commands.Group):
         roles = guild.roles
 
         # Due to not chunking the guild, the owner might not be cached.
-        if guild.owner is None:
-            if (owner := interaction.client.get_user(guild.owner_id)) is None:
-                # guild.query_members uses the gateway, so members are cached.
-                queried_user = await guild.query_members(user_ids=[guild.owner_id])
-                owner = queried_user[0] if queried_user else None
-        else:
-            owner = guild.owner
+        if (owner := guild.owner or interaction.client.get_user(guild.owner_id)) is None:
+            owner = await interaction.client.member_resolver.get_member(guild, guild.owner_id)
 
         embed = extensions.Embed(title=interaction.translate(_("Guild information")))
         embed.set_thumbnail(url=guild.icon)
@@ -72,12 +67,11 @@ class GuildGroup(app_commands.Group):
         """
         guild = interaction.guild
 
-        if not guild.chunked:
-            await guild.chunk(cache=True)
-
+        # All members are needed to count the joins
+        members = await interaction.client.member_resolver.chunk(guild)
         joined = 0
 
-        for member in guild.members:
+        for member in members:
             if (discord.utils.utcnow() - member.joined_at).total_seconds() <= 86400:
                 joined += 1
 
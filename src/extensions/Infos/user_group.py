@@ -111,9 +111,9 @@ class UserGroup(app_commands.Group):
         if not interaction.guild.chunked:
             interaction.extras["deferred"] = True
             await interaction.response.defer()
-            await interaction.guild.chunk()
 
-        members = [member for member in interaction.guild.members]
+        # The join position can only be calculated with all members
+        members = list(await interaction.client.member_resolver.chunk(interaction.guild))
         members.sort(key=self.sort)
 
         try:
@@ -135,9 +135,9 @@ class UserGroup(app_commands.Group):
         if not interaction.guild.chunked:
             interaction.extras["deferred"] = True
             await interaction.response.defer(ephemeral=True)
-            await interaction.guild.chunk(cache=True)
 
-        members = [member for member in interaction.guild.members]
+        # The join position can only be calculated with all members
+        members = list(await interaction.client.member_resolver.chunk(interaction.guild))
         members.sort(key=self.sort)
         position = members.index(current_member) + 1
 
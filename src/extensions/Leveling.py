@@ -11,7 +11,7 @@ from discord import app_commands, ui
 from discord.app_commands import locale_str as _
 from discord.ext import commands
 
-from lib import formatting, helper, extensions
+from lib import formatting, helper, extensions, queries
 
 if TYPE_CHECKING:
     from main import Plyoox
@@ -91,29 +91,15 @@ class Leveling(commands.Cog):
 
     async def _fetch_member_data(self, member: discord.Member) -> LevelUserData:
         """Fetches the leveling data of a member."""
-        return await self.bot.db.fetchrow(
-            "SELECT user_id, guild_id, xp FROM level_user WHERE guild_id = $1 AND user_id = $2",
-            member.guild.id,
-            member.id,
-        )
+        return await queries.fetch_level_user(self.bot.db, member.guild.id, member.id)
 
     async def _create_member_data(self, member: discord.Member, xp: int) -> None:
         """Creates a database entry for the member."""
-        await self.bot.db.execute(
-            "INSERT INTO level_user (guild_id, user_id, xp, message_count) VALUES ($1, $2, $3, 1)",
-            member.guild.id,
-            member.id,
-            xp,
-        )
+        await queries.insert_level_user(self.bot.db, member.guild.id, member.id, xp)
 
     async def _update_member_data(self, user_id: int, guild_id: int, xp: int) -> None:
         """Adds a specific amount of xp to the user in the database."""
-        await self.bot.db.execute(
-            "UPDATE level_user SET xp = xp + $1, message_count = message_count + 1 WHERE user_id = $2 AND guild_id = $3",
-            xp,
-            user_id,
-            guild_id,
-        )
+        await queries.add_level_user_xp(self.bot.db, guild_id, user_id, xp)
 
     async def cog_unload(self) -> None:
         self.bot.tree.remove_command(self.ctx_menu.name, type=self.ctx_menu.type)
@@ -417,9 +403,6 @@ class Leveling(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
 
-        if not guild.chunked:
-            await guild.chunk(cache=True)
-
         top_users = []
         offset = 0
 
@@ -432,8 +415,13 @@ class Leveling(commands.Cog):
 
             offset += 25
 
+            # Only the members of the current page are resolved, users that left the guild are skipped
+            members = await bot.member_resolver.get_members(
+                guild, [level_user["user_id"] for level_user in level_users]
+            )
+
             for level_user in level_users:
-                member = guild.get_member(level_user["user_id"])
+                member = members.get(level_user["user_id"])
 
                 if member is not None:
                     current_level, current_xp = get_level_from_xp(level_user["xp"])
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import io
+import functools
 import logging
 from typing import TYPE_CHECKING
 
@@ -25,6 +25,65 @@ WARN_COLOR = discord.Color.orange()
 SUCCESS_COLOR = discord.Color.green()
 INFO_COLOR = discord.Color.blue()
 
+MEMBER_JOIN_TEMPLATE = extensions.EmbedTemplate(
+    color=SUCCESS_COLOR,
+    author=_("User joined"),
+    description=_("The user {member.display_name} ({member}) has joined the guild."),
+    fields=[_("Account created at")],
+    footer=_("User Id"),
+)
+MEMBER_LEAVE_TEMPLATE = extensions.EmbedTemplate(
+    color=ERROR_COLOR,
+    author=_("Member left"),
+    description=_("The user {member.display_name} ({member}) has left the guild."),
+    fields=[_("Account created at"), _("Roles"), _("Joined at")],
+    footer=_("User Id"),
+    strings={"no_roles": _("No roles")},
+)
+MEMBER_BAN_TEMPLATE = extensions.EmbedTemplate(
+    color=ERROR_COLOR,
+    author=_("User banned"),
+    description=_("The user {member.display_name} ({member}) has been banned."),
+    fields=[_("Account created at"), _("Joined at"), _("Roles")],
+    footer=_("User Id"),
+    strings={"no_roles": _("No roles")},
+)
+MEMBER_UNBAN_TEMPLATE = extensions.EmbedTemplate(
+    color=WARN_COLOR,
+    author=_("Member unbanned"),
+    description=_("The user {user.display_name} ({user}) has been unbanned."),
+    fields=[_("Account created at")],
+    footer=_("User Id"),
+)
+MEMBER_ROLES_TEMPLATE = extensions.EmbedTemplate(
+    color=INFO_COLOR,
+    author=_("Member roles changed"),
+    description=_("The user {member.display_name} ({member}) has updated their roles."),
+    fields=[_("New roles"), _("Old roles")],
+    footer=_("User Id"),
+    strings={"no_roles": _("No roles")},
+)
+MEMBER_RENAME_TEMPLATE = extensions.EmbedTemplate(
+    color=INFO_COLOR,
+    author=_("Member renamed"),
+    description=_("The user {member.display_name} ({member}) has updated their name."),
+    fields=[_("Previous name"), _("New name")],
+    footer=_("User Id"),
+)
+
+BULK_DELETE_TEMPLATE = extensions.EmbedTemplate(
+    color=ERROR_COLOR,
+    author=_("Bulk message delete"),
+    description=_("{count} messages have been deleted from {channel}."),
+    fields=[(_("Logged messages"), True), (_("Authors"), True)],
+    footer=_("Channel Id"),
+)
+
+
+def _format_roles(skeleton: extensions.EmbedSkeleton, roles: list[discord.Role]) -> str:
+    formatted_roles = helper.format_roles(roles)
+    return f"> {formatted_roles}" if formatted_roles else italic(skeleton.strings["no_roles"])
+
 
 class LoggingEvents(commands.Cog):
     def __init__(self, bot: Plyoox):
@@ -52,42 +111,19 @@ class LoggingEvents(commands.Cog):
         file: discord.File = utils.MISSING,
         embeds: list[discord.Embed] = utils.MISSING,
     ):
-        # Normally all logging channels should be webhook channels,
-        # but just in case (e.g., manual insertion)
-        if cache.channel.token is None:
-            channel = guild.get_channel(cache.channel.id)  # channel is a text channel
-            if channel is None or not channel.permissions_for(guild.me).send_messages:
-                _log.info(f"Deleted logging channel {cache.channel} due to missing permissions")
-
-                await self.bot.db.execute(
-                    "DELETE FROM maybe_webhook WHERE id = $1 AND guild_id = $2",
-                    cache.channel.id,
-                    guild.id,
-                )
-
-                self.bot.cache.remove_cache(guild.id, "log")
-            else:
-                try:
-                    await channel.send(file=file, embeds=embeds)
-                except Exception as e:
-                    _log.error(f"Could not logging message to channel {channel}", exc_info=e)
-        else:
-            webhook = discord.Webhook.partial(cache.channel.id, cache.channel.token, session=self.bot.session)
-
-            try:
-                await webhook.send(embeds=embeds, file=file)
-            except discord.NotFound:
-                _log.info(f"Deleted logging webhook {repr(cache.channel)} due to missing webhook")
-
-                await self.bot.db.execute("DELETE FROM maybe_webhook WHERE id = $1", cache.channel.id)
+        destination = self.bot.webhook_registry.resolve(guild, cache.channel)
+        if destination is None:
+            return
 
-                self.bot.cache.remove_cache(guild.id, "log")
+        self.bot.webhook_queue.send(
+            destination,
+            embeds=embeds,
+            file=file,
+            on_not_found=functools.partial(self.bot.webhook_registry.mark_dead, guild.id, cache.channel.id),
+        )
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
-        def translate(string: _):
-            return global_translate(string, self.bot, guild.preferred_locale)
-
         guild = member.guild
 
         cache = await self._get_setting(guild.id, LoggingKind.member_join)
@@ -99,26 +135,19 @@ class LoggingEvents(commands.Cog):
         if any(role in cache.exempt_roles for role in member.roles):
             return
 
-        embed = extensions.Embed(
-            description=translate(_("The user {member.display_name} ({member}) has joined the guild.")).format(
-                member=member
-            ),
-            color=SUCCESS_COLOR,
-        )
-        embed.set_author(name=translate(_("User joined")), icon_url=member.display_avatar)
-        embed.add_field(
-            name=translate(_("Account created at")),
-            value=helper.embed_timestamp_format(member.created_at),
+        embed = MEMBER_JOIN_TEMPLATE.render(
+            self.bot,
+            guild.preferred_locale,
+            description={"member": member},
+            icon_url=member.display_avatar,
+            values=[helper.embed_timestamp_format(member.created_at)],
+            footer=member.id,
         )
-        embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
 
         await self._send_message(guild, cache, embeds=[embed])
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
-        def translate(string: _):
-            return global_translate(string, self.bot, member.guild.preferred_locale)
-
         guild = member.guild
 
         cache = await self._get_setting(guild.id, LoggingKind.member_leave)
@@ -128,28 +157,22 @@ class LoggingEvents(commands.Cog):
         if any(role in cache.exempt_roles for role in member.roles):
             return
 
-        embed = extensions.Embed(
-            description=translate(_("The user {member.display_name} ({member}) has left the guild.")).format(
-                member=member
-            ),
-            color=ERROR_COLOR,
+        skeleton = MEMBER_LEAVE_TEMPLATE.get(self.bot, guild.preferred_locale)
+        embed = skeleton.render(
+            description={"member": member},
+            icon_url=member.display_avatar,
+            values=[
+                helper.embed_timestamp_format(member.created_at),
+                _format_roles(skeleton, member.roles),
+                helper.embed_timestamp_format(member.joined_at),
+            ],
+            footer=member.id,
         )
-        embed.set_author(name=translate(_("Member left")), icon_url=member.display_avatar)
-        embed.add_field(name=translate(_("Account created at")), value=helper.embed_timestamp_format(member.created_at))
-
-        roles = helper.format_roles(member.roles)
-        embed.add_field(name=translate(_("Roles")), value=f"> {roles}" if roles else italic(translate(_("No roles"))))
-
-        embed.add_field(name=translate(_("Joined at")), value=helper.embed_timestamp_format(member.joined_at))
-        embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
 
         await self._send_message(member.guild, cache, embeds=[embed])
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: discord.User | discord.Member):
-        def translate(string: _):
-            return global_translate(string, self.bot, guild.preferred_locale)
-
         cache = await self._get_setting(guild.id, LoggingKind.member_ban)
         if cache is None:
             return
@@ -157,51 +180,41 @@ class LoggingEvents(commands.Cog):
         if isinstance(user, discord.Member) and any(role in cache.exempt_roles for role in user.roles):
             return
 
-        embed = extensions.Embed(
-            color=ERROR_COLOR,
-            description=translate(_("The user {member.display_name} ({member}) has been banned.")).format(member=user),
-        )
-        embed.add_field(name=translate(_("Account created at")), value=helper.embed_timestamp_format(user.created_at))
-        embed.set_footer(text=f"{global_translate(_('User Id'), self.bot, guild.preferred_locale)}: {user.id}")
+        skeleton = MEMBER_BAN_TEMPLATE.get(self.bot, guild.preferred_locale)
+        joined_at = roles = None
 
         if isinstance(user, discord.Member):
-            embed.set_author(name=translate(_("User banned")), icon_url=user.display_avatar)
-            embed.add_field(name=translate(_("Joined at")), value=helper.embed_timestamp_format(user.joined_at))
-
-            roles = helper.format_roles(user.roles)
-            embed.add_field(
-                name=translate(_("Roles")), value=f"> {roles}" if roles else italic(translate(_("No roles")))
-            )
-
-        else:
-            embed.set_author(name=translate(_("User banned")), icon_url=user.display_avatar)
+            joined_at = helper.embed_timestamp_format(user.joined_at)
+            roles = _format_roles(skeleton, user.roles)
+
+        embed = skeleton.render(
+            description={"member": user},
+            icon_url=user.display_avatar,
+            values=[helper.embed_timestamp_format(user.created_at), joined_at, roles],
+            footer=user.id,
+        )
 
         await self._send_message(guild, cache, embeds=[embed])
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: discord.User):
-        def translate(string: _):
-            return global_translate(string, self.bot, guild.preferred_locale)
-
         cache = await self._get_setting(guild.id, LoggingKind.member_unban)
         if cache is None:
             return
 
-        embed = extensions.Embed(
-            color=WARN_COLOR,
-            description=translate(_("The user {user.display_name} ({user}) has been unbanned.")).format(user=user),
+        embed = MEMBER_UNBAN_TEMPLATE.render(
+            self.bot,
+            guild.preferred_locale,
+            description={"user": user},
+            icon_url=user.display_avatar,
+            values=[helper.embed_timestamp_format(user.created_at)],
+            footer=user.id,
         )
-        embed.set_author(name=translate(_("Member unbanned")), icon_url=user.display_avatar)
-        embed.set_footer(text=f"{translate(_('User Id'))}: {user.id}")
-        embed.add_field(name=translate(_("Account created at")), value=helper.embed_timestamp_format(user.created_at))
 
         await self._send_message(guild, cache, embeds=[embed])
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
-        def translate(string: _):
-            return global_translate(string, self.bot, guild.preferred_locale)
-
         guild = after.guild
 
         if before.roles != after.roles:
@@ -212,25 +225,12 @@ class LoggingEvents(commands.Cog):
             if any(role in cache.exempt_roles for role in after.roles):
                 return
 
-            embed = extensions.Embed(
-                color=INFO_COLOR,
-                description=translate(_("The user {member.display_name} ({member}) has updated their roles.")).format(
-                    member=after
-                ),
-            )
-            embed.set_author(name=translate(_("Member roles changed")), icon_url=before.display_avatar)
-            embed.set_footer(text=f"{translate(_('User Id'))}: {before.id}")
-
-            new_roles = helper.format_roles(after.roles)
-            embed.add_field(
-                name=translate(_("New roles")),
-                value=f"> {new_roles}" if new_roles else italic(translate(_("No roles"))),
-            )
-
-            old_roles = helper.format_roles(before.roles)
-            embed.add_field(
-                name=translate(_("Old roles")),
-                value=f"> {old_roles}" if old_roles else italic(translate(_("No roles"))),
+            skeleton = MEMBER_ROLES_TEMPLATE.get(self.bot, guild.preferred_locale)
+            embed = skeleton.render(
+                description={"member": after},
+                icon_url=before.display_avatar,
+                values=[_format_roles(skeleton, after.roles), _format_roles(skeleton, before.roles)],
+                footer=before.id,
             )
 
             await self._send_message(guild, cache, embeds=[embed])
@@ -242,23 +242,13 @@ class LoggingEvents(commands.Cog):
             if any(role in cache.exempt_roles for role in after.roles):
                 return
 
-            embed = extensions.Embed(
-                color=INFO_COLOR,
-                description=translate(_("The user {member.display_name} ({member}) has updated their name.")).format(
-                    member=after
-                ),
-            )
-            embed.set_author(name=translate(_("Member renamed")), icon_url=after.display_avatar)
-            embed.set_footer(text=f"{translate(_('User Id'))}: {before.id}")
-
-            embed.add_field(
-                name=translate(_("Previous name")),
-                value=f"> {before.display_name}",
-            )
-
-            embed.add_field(
-                name=translate(_("New name")),
-                value=f"> {after.display_name}",
+            embed = MEMBER_RENAME_TEMPLATE.render(
+                self.bot,
+                guild.preferred_locale,
+                description={"member": after},
+                icon_url=after.display_avatar,
+                values=[f"> {before.display_name}", f"> {after.display_name}"],
+                footer=before.id,
             )
 
             await self._send_message(guild, cache, embeds=[embed])
@@ -421,9 +411,9 @@ class LoggingEvents(commands.Cog):
 
     @commands.Cog.listener()
     async def on_custom_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
-        def translate(string: _):
-            return global_translate(string, self.bot, guild.preferred_locale)
-
+        """Logs all deleted messages of a bulk delete as one message. The cached messages are
+        attached as a text file instead of sending an embed per message.
+        """
         guild = self.bot.get_guild(payload.guild_id)
         if guild is None:
             _log.warning(f"Could not find guild with id {payload.guild_id}")
@@ -453,28 +443,26 @@ class LoggingEvents(commands.Cog):
             if webhook_channel.webhook_channel == payload.channel_id:
                 return
 
-        embed = extensions.Embed(
-            title=translate(_("Bulk message delete")),
-            color=ERROR_COLOR,
-            description=translate(_("{count} messages have been deleted from {channel}.")).format(
-                count=len(payload.message_ids),
-                channel=f"<#{payload.channel_id}>",
-            ),
+        # Messages without content or attachments are not logged, oldest message first
+        deleted = helper.MessageLog()
+        deleted.add_many(
+            sorted(
+                (message for message in payload.cached_messages if message.content or message.attachments),
+                key=lambda message: message.id,
+            )
         )
 
-        file = discord.utils.MISSING
-
-        if len(payload.cached_messages):
-            messages = [
-                f"{msg.author} ({msg.author.id}):\t\t{msg.content}" for msg in payload.cached_messages if msg.content
-            ]
-
-            if len(messages) > 0:
-                _file = io.BytesIO()
-                _file.write("\n".join([msg for msg in messages]).encode("utf-8"))
-                _file.seek(0)
+        embed = BULK_DELETE_TEMPLATE.render(
+            self.bot,
+            guild.preferred_locale,
+            description={"count": len(payload.message_ids), "channel": f"<#{payload.channel_id}>"},
+            values=[f"> {deleted.count}", f"> {len(deleted.authors)}" if deleted.count else None],
+            footer=payload.channel_id,
+        )
 
-                file = discord.File(_file, filename="deleted_messages.txt")
+        file = discord.utils.MISSING
+        if deleted.count:
+            file = deleted.to_file("deleted_messages.txt")
 
         await self._send_message(guild, cache, embeds=[embed], file=file)
 
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from lib import utils
+
+_log = logging.getLogger(__name__)
+
+type ActionJob = Callable[[], Awaitable[Any]]
+
+
+class _QueuedAction:
+    __slots__ = ("member_id", "job", "future")
+
+    def __init__(self, member_id: int, job: ActionJob, future: asyncio.Future):
+        self.member_id = member_id
+        self.job = job
+        self.future = future
+
+
+class _GuildQueue:
+    __slots__ = ("guild_id", "pending", "running", "running_members", "punished", "wakeup", "worker")
+
+    def __init__(self, guild_id: int):
+        self.guild_id = guild_id
+        self.pending: deque[_QueuedAction] = deque()
+        self.running = 0
+        self.running_members: set[int] = set()
+        self.punished: set[int] = set()
+        self.wakeup = asyncio.Event()
+        self.worker: asyncio.Task | None = None
+
+    def has_member(self, member_id: int) -> bool:
+        return member_id in self.running_members or any(action.member_id == member_id for action in self.pending)
+
+
+class ActionExecutor:
+    """Executes automod actions through a work queue per guild.
+
+    Actions of the same member are executed in the order they were submitted, actions of
+    different members run concurrently. The concurrency is bounded per guild and globally.
+
+    A member can be marked as punished while they have queued actions. Further punishments
+    are skipped until all actions of the member have been executed and for `punished_ttl`
+    seconds afterwards, messages sent before the punishment can still arrive in that time.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 32,
+        guild_concurrency: int = 4,
+        max_queue_size: int = 250,
+        punished_ttl: float = 3.0,
+    ):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._guild_concurrency = guild_concurrency
+        self._max_queue_size = max_queue_size
+        self._guilds: dict[int, _GuildQueue] = {}
+        self._tasks: set[asyncio.Task] = set()
+        # (guild id, member id) of punished members whose queue has been drained
+        self._recently_punished: dict[tuple[int, int], bool] = utils.ExpiringCache(seconds=punished_ttl)
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.deduplicated = 0
+
+    def submit(
+        self, guild_id: int, member_id: int, job: ActionJob, *, punishment: bool = False
+    ) -> asyncio.Future | None:
+        """Queues a job for the member. Returns a future that resolves once the job has been executed
+        or `None` if the queue of the guild is full.
+
+        If `punishment` is set, the member is marked as punished until shortly after their queue is drained.
+        """
+        queue = self._guilds.get(guild_id)
+        if queue is None:
+            self._guilds[guild_id] = queue = _GuildQueue(guild_id)
+            queue.worker = asyncio.create_task(self._worker(guild_id, queue), name=f"automod-queue-{guild_id}")
+
+        if len(queue.pending) >= self._max_queue_size:
+            self.dropped += 1
+            _log.warning(f"Automod queue of guild {guild_id} is full, dropping action for {member_id}")
+            return None
+
+        future = asyncio.get_running_loop().create_future()
+        queue.pending.append(_QueuedAction(member_id, job, future))
+
+        if punishment:
+            queue.punished.add(member_id)
+
+        self.submitted += 1
+        queue.wakeup.set()
+
+        return future
+
+    def is_punished(self, guild_id: int, member_id: int) -> bool:
+        """Returns if the member has a pending punishment or has been punished in the last seconds.
+
+        The caller that skips the punishment because of this should count it in `deduplicated`.
+        """
+        queue = self._guilds.get(guild_id)
+        if queue is not None and member_id in queue.punished:
+            return True
+
+        return (guild_id, member_id) in self._recently_punished
+
+    def mark_punished(self, guild_id: int, member_id: int) -> bool:
+        """Marks the member as punished. Returns `False` if the member has already been marked.
+
+        This is intended to be called from a running job, otherwise the mark is not kept.
+        """
+        if self.is_punished(guild_id, member_id):
+            self.deduplicated += 1
+            return False
+
+        queue = self._guilds.get(guild_id)
+        if queue is not None:
+            queue.punished.add(member_id)
+
+        return True
+
+    @property
+    def queue_depths(self) -> dict[int, int]:
+        """The number of queued (not yet running) actions per guild."""
+        return {guild_id: len(queue.pending) for guild_id, queue in self._guilds.items()}
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "guilds": len(self._guilds),
+            "queued": sum(len(queue.pending) for queue in self._guilds.values()),
+            "running": sum(queue.running for queue in self._guilds.values()),
+            "max_guild_depth": max((len(queue.pending) for queue in self._guilds.values()), default=0),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "deduplicated": self.deduplicated,
+        }
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Waits for the queued actions to finish and cancels the remaining ones after the timeout."""
+        workers = [queue.worker for queue in self._guilds.values() if queue.worker is not None]
+        if workers:
+            _done, pending = await asyncio.wait(workers, timeout=timeout)
+
+            for task in (*pending, *self._tasks):
+                task.cancel()
+
+    async def _worker(self, guild_id: int, queue: _GuildQueue) -> None:
+        try:
+            while queue.pending or queue.running:
+                action = self._next_action(queue)
+
+                if action is None:
+                    queue.wakeup.clear()
+                    await queue.wakeup.wait()
+                    continue
+
+                queue.running += 1
+                queue.running_members.add(action.member_id)
+
+                task = asyncio.create_task(self._run(queue, action))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            self._guilds.pop(guild_id, None)
+
+            for action in queue.pending:
+                action.future.cancel()
+
+    def _next_action(self, queue: _GuildQueue) -> _QueuedAction | None:
+        """Returns the first queued action whose member has no running action."""
+        if queue.running >= self._guild_concurrency:
+            return None
+
+        for index, action in enumerate(queue.pending):
+            if action.member_id not in queue.running_members:
+                del queue.pending[index]
+                return action
+
+        return None
+
+    async def _run(self, queue: _GuildQueue, action: _QueuedAction) -> None:
+        try:
+            async with self._semaphore:
+                result = await action.job()
+        except asyncio.CancelledError:
+            action.future.cancel()
+            raise
+        except Exception as e:
+            self.failed += 1
+            _log.error(f"Error while executing automod action for {action.member_id}", exc_info=e)
+
+            if not action.future.done():
+                action.future.set_result(None)
+        else:
+            self.completed += 1
+
+            if not action.future.done():
+                action.future.set_result(result)
+        finally:
+            queue.running -= 1
+            queue.running_members.discard(action.member_id)
+
+            if not queue.has_member(action.member_id) and action.member_id in queue.punished:
+                queue.punished.discard(action.member_id)
+                self._recently_punished[queue.guild_id, action.member_id] = True
+
+            queue.wakeup.set()
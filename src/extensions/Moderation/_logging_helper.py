@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import datetime
-import io
+import functools
 import logging
 from typing import TYPE_CHECKING
 
@@ -21,6 +21,46 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+_STRINGS = {"yes": _("Yes"), "no": _("No"), "no_reason": _("No reason")}
+
+PUNISH_COMMAND_TEMPLATE = extensions.EmbedTemplate(
+    color=colors.COMMAND_LOG_COLOR,
+    fields=[_("Reason"), (_("Executed at"), True), (_("Punished until"), True), _("Received DM")],
+    footer=_("User Id"),
+    strings=_STRINGS,
+)
+AUTOMOD_TEMPLATE = extensions.EmbedTemplate(
+    color=colors.AUTOMOD_COLOR,
+    description=_("The user {target.mention} ({target}) has been punished by {moderator.mention} ({moderator})"),
+    fields=[
+        _("Action"),
+        _("Reason"),
+        (_("Executed at"), True),
+        (_("Punished until"), True),
+        _("Points added"),
+        _("Received DM"),
+        _("Message"),
+    ],
+    footer=_("User Id"),
+    strings=_STRINGS | {"punished": _("User has been punished")},
+)
+AUTOMOD_FINAL_TEMPLATE = extensions.EmbedTemplate(
+    color=colors.AUTOMOD_COLOR,
+    author=_("Automod: Maximum points reached"),
+    description=_("The user {target.mention} ({target}) has reached the maximum number of points."),
+    fields=[_("Action"), (_("Executed at"), True), (_("Punished until"), True), _("Received DM")],
+    footer=_("User Id"),
+    strings=_STRINGS,
+)
+WARN_TEMPLATE = extensions.EmbedTemplate(
+    color=colors.POINT_COLOR,
+    author=_("User has been warned"),
+    description=_("The user {target.mention} ({target}) has been warned by {moderator.mention} ({moderator})."),
+    fields=[_("Reason"), _("Moderator"), _("Executed at"), _("Points added"), _("Received DM")],
+    footer=_("User Id"),
+    strings=_STRINGS,
+)
+
 
 async def _get_log_channel(
     bot: Plyoox, cache: ModerationModel, guild: discord.Guild
@@ -28,49 +68,30 @@ async def _get_log_channel(
     if cache.logging_channel is None:
         return None
 
-    if cache.logging_channel.webhook_channel is not None:
-        return discord.Webhook.partial(cache.logging_channel.id, cache.logging_channel.token, session=bot.session)
-
-    channel = guild.get_channel(cache.logging_channel.id)
-    if channel is None or not channel.permissions_for(guild.me).send_messages:
-        _log.info(f"Cannot send log message to {cache.logging_channel.id} ({repr(channel)})")
-
-        # Remove the channel from the database
-        await bot.db.execute(
-            "DELETE FROM maybe_webhook WHERE id = $1 AND guild_id = $2",
-            cache.logging_channel.id,
-            guild.id,
-        )
-
-        # Remove the channel from the cache
-        # Moderation and Logging config can have the same webhook,
-        # so it needs to be removed from both
-        bot.cache.edit_cache(guild.id, "mod", logging_channel=None)
-        bot.cache.remove_cache(guild.id, "log")
-
-    return channel
+    return bot.webhook_registry.resolve(guild, cache.logging_channel)
 
 
 async def _send_webhook(
     bot: Plyoox,
     guild_id: int,
-    webhook: discord.Webhook,
+    webhook: discord.Webhook | discord.TextChannel,
     embeds: list[discord.Embed] = utils.MISSING,
     file: discord.File = utils.MISSING,
 ) -> None:
-    try:
-        await webhook.send(embeds=embeds, file=file)
-    except discord.NotFound:
-        _log.info(f"Log channel {webhook.id} not found, deleting...")
-        await bot.db.execute("DELETE FROM maybe_webhook WHERE id = $1 AND guild_id = $2", webhook.id, guild_id)
+    """Queues the log message. The messages are sent in batches by the webhook queue."""
+    bot.webhook_queue.send(
+        webhook,
+        embeds=embeds,
+        file=file,
+        on_not_found=functools.partial(bot.webhook_registry.mark_dead, guild_id, webhook.id),
+    )
 
-        # Remove the channel from the cache
-        # Moderation and Logging config can have the same webhook,
-        # so it needs to be removed from both
-        bot.cache.edit_cache(guild_id, "mod", logging_channel=None)
-        bot.cache.remove_cache(guild_id, "log")
-    except discord.HTTPException as e:
-        _log.error(f"Error while sending log message in {webhook.id} ({type(webhook)}): {e}")
+
+def _received_dm(skeleton: extensions.EmbedSkeleton, notified_user: bool | None) -> str | None:
+    if notified_user is None:
+        return None
+
+    return "> " + skeleton.strings["yes" if notified_user else "no"]
 
 
 async def log_simple_punish_command(
@@ -107,25 +128,25 @@ async def log_simple_punish_command(
 
     title, description = _get_dynamic_log_description(translate, moderator=interaction.user, target=target, kind=kind)
 
-    embed = extensions.Embed(description=description, color=colors.COMMAND_LOG_COLOR)
-    embed.set_author(name=title, icon_url=target.display_avatar)
-    embed.add_field(name=translate(_("Reason")), value=f"> {reason}" if reason else italic(translate(_("No reason"))))
-    embed.add_field(name=translate(_("Executed at")), value="> " + utils.format_dt(utils.utcnow()), inline=True)
-    embed.set_footer(text=f"{translate(_('User Id'))}: {target.id}")
-
-    if until is not None:
-        embed.add_field(name=translate(_("Punished until")), value=helper.embed_timestamp_format(until), inline=True)
-
-    if notified_user is not None:
-        embed.add_field(
-            name=translate(_("Received DM")), value="> " + translate(_("Yes") if notified_user else _("No"))
-        )
+    skeleton = PUNISH_COMMAND_TEMPLATE.get(interaction.client, interaction.guild.preferred_locale)
+    embed = skeleton.render(
+        description=description,
+        author=title,
+        icon_url=target.display_avatar,
+        values=[
+            f"> {reason}" if reason else italic(skeleton.strings["no_reason"]),
+            "> " + utils.format_dt(utils.utcnow()),
+            helper.embed_timestamp_format(until) if until is not None else None,
+            _received_dm(skeleton, notified_user),
+        ],
+        footer=target.id,
+    )
 
     await _send_webhook(interaction.client, interaction.guild.id, webhook, embeds=[embed])
 
 
 async def log_clear_command(
-    interaction: discord.Interaction, *, reason: str | None, total: int, deleted_messages: list[discord.Message]
+    interaction: discord.Interaction, *, reason: str | None, total: int, deleted: helper.MessageLog
 ) -> None:
     cache = await interaction.client.cache.get_moderation(interaction.guild.id)
     if cache is None or not cache.active:
@@ -137,7 +158,7 @@ async def log_clear_command(
     if webhook is None:
         return
 
-    deleted_count = len(deleted_messages)
+    deleted_count = deleted.count
 
     embed = extensions.Embed(
         description=translate(
@@ -160,17 +181,47 @@ async def log_clear_command(
         embed.insert_field_at(0, name=translate(_("Reason")), value=f"> {reason}")
 
     file = utils.MISSING
-    if len(deleted_messages):
-        messages = [f"{msg.author} ({msg.author.id}):\t{msg.content}" for msg in deleted_messages if msg.content]
+    if deleted_count:
+        file = deleted.to_file("cleared_messages.txt")
 
-        if len(messages) > 0:
-            _file = io.BytesIO()
-            _file.write("\n".join([msg for msg in messages]).encode("utf-8"))
-            _file.seek(0)
+    await _send_webhook(interaction.client, interaction.guild.id, webhook, embeds=[embed], file=file)
 
-            file = discord.File(_file, filename="cleared_messages.txt")
 
-    await _send_webhook(interaction.client, interaction.guild.id, webhook, embeds=[embed], file=file)
+async def automod_notify(
+    bot: Plyoox,
+    data: AutoModerationActionData,
+    *,
+    until: datetime.datetime | None = None,
+    points: str | None = None,
+) -> bool | None:
+    """Sends the punishment message to the member. Returns `None` if the guild
+    has disabled user notifications, otherwise if the message could be sent.
+    """
+
+    def translate(string: _):
+        return global_translate(string, bot, guild.preferred_locale)
+
+    guild = data.guild
+
+    cache = await bot.cache.get_moderation(guild.id)
+    if not cache or not cache.notify_user:
+        return None
+
+    timestamp = utils.format_dt(until) if until is not None else None
+    embed = _get_dynamic_log_user_message(
+        translate,
+        guild=guild,
+        reason=data.trigger_reason,
+        timestamp=timestamp,
+        kind=data.trigger_action.punishment.kind,
+        points=points,
+    )
+
+    try:
+        await data.member.send(embed=embed)
+        return True
+    except discord.HTTPException:
+        return False
 
 
 async def automod_log(
@@ -179,6 +230,7 @@ async def automod_log(
     *,
     until: datetime.datetime | None = None,
     points: str | None = None,
+    notified_user: bool | None = utils.MISSING,
 ) -> None:
     def translate(string: _):
         return global_translate(string, bot, guild.preferred_locale)
@@ -190,29 +242,15 @@ async def automod_log(
     if not cache:
         return
 
-    notified_user = None
-    if cache.notify_user:
-        timestamp = utils.format_dt(until) if until is not None else None
-        embed = _get_dynamic_log_user_message(
-            translate,
-            guild=guild,
-            reason=data.trigger_reason,
-            timestamp=timestamp,
-            kind=data.trigger_action.punishment.kind,
-            points=points,
-        )
-
-        try:
-            await member.send(embed=embed)
-            notified_user = True
-        except discord.HTTPException:
-            notified_user = False
+    # The member has not been notified before the punishment was executed
+    if notified_user is utils.MISSING:
+        notified_user = await automod_notify(bot, data, until=until, points=points)
 
     webhook = await _get_log_channel(bot, cache, guild)
     if webhook is None:
         return
 
-    embed = extensions.Embed()
+    skeleton = AUTOMOD_TEMPLATE.get(bot, guild.preferred_locale)
 
     # data.moderator is only set when using the punishment command
     if data.moderator:
@@ -220,49 +258,47 @@ async def automod_log(
             translate, moderator=data.moderator, target=member, kind=data.trigger_action.punishment.kind
         )
 
-        title = translate(_("User has been punished"))
-
-        embed.description = translate(
-            _("The user {target.mention} ({target}) has been punished by {moderator.mention} ({moderator})")
-        ).format(target=member, moderator=data.moderator)
-        embed.color = colors.PUNISHMENT_COLOR
-
-        embed.add_field(name=translate(_("Action")), value=f"> {action}")
+        title = skeleton.strings["punished"]
+        description = {"target": member, "moderator": data.moderator}
+        color = colors.PUNISHMENT_COLOR
+        action = f"> {action}"
     else:
         title, description = _get_dynamic_auto_moderation_description(
             translate, kind=data.trigger_action.punishment.kind, target=member
         )
 
-        embed.description = description
-        embed.color = colors.AUTOMOD_COLOR
-
-    embed.set_author(name=title, icon_url=member.display_avatar)
-    embed.add_field(name=translate(_("Reason")), value=f"> {data.trigger_reason}")
-    embed.add_field(name=translate(_("Executed at")), value="> " + utils.format_dt(utils.utcnow()), inline=True)
-    embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
-
-    if until is not None:
-        embed.add_field(name=translate(_("Punished until")), value=helper.embed_timestamp_format(until), inline=True)
-    elif points is not None:
-        embed.add_field(name=translate(_("Points added")), value="> " + points)
-
-    if notified_user is not None:
-        embed.add_field(
-            name=translate(_("Received DM")), value="> " + translate(_("Yes") if notified_user else _("No"))
-        )
+        color = action = None
+
+    message = None
+    if data.trigger_content and len(data.trigger_content) <= 1024:
+        message = data.trigger_content
+
+    embed = skeleton.render(
+        description=description,
+        author=title,
+        icon_url=member.display_avatar,
+        color=color,
+        values=[
+            action,
+            f"> {data.trigger_reason}",
+            "> " + utils.format_dt(utils.utcnow()),
+            helper.embed_timestamp_format(until) if until is not None else None,
+            "> " + points if until is None and points is not None else None,
+            _received_dm(skeleton, notified_user),
+            message,
+        ],
+        footer=member.id,
+    )
 
     embeds = [embed]
 
-    if data.trigger_content:
-        if len(data.trigger_content) <= 1024:
-            embed.add_field(name=translate(_("Message")), value=data.trigger_content)
-        else:
-            message_embed = extensions.Embed(
-                title=translate(_("Message")),
-                description=data.trigger_content,
-                color=colors.AUTOMOD_COLOR,
-            )
-            embeds.append(message_embed)
+    if data.trigger_content and message is None:
+        message_embed = extensions.Embed(
+            title=skeleton.fields[-1][0],
+            description=data.trigger_content,
+            color=colors.AUTOMOD_COLOR,
+        )
+        embeds.append(message_embed)
 
     await _send_webhook(bot, guild.id, webhook, embeds=embeds)
 
@@ -305,24 +341,18 @@ async def automod_final_log(
 
     (title, _description) = _get_dynamic_auto_moderation_description(translate, kind=action, target=member, final=True)
 
-    embed = extensions.Embed(
-        description=translate(
-            _("The user {target.mention} ({target}) has reached the maximum number of points.")
-        ).format(target=member),
-        color=colors.AUTOMOD_COLOR,
+    skeleton = AUTOMOD_FINAL_TEMPLATE.get(bot, guild.preferred_locale)
+    embed = skeleton.render(
+        description={"target": member},
+        icon_url=member.display_avatar,
+        values=[
+            f"> {title}",
+            "> " + utils.format_dt(utils.utcnow()),
+            helper.embed_timestamp_format(until) if until is not None else None,
+            _received_dm(skeleton, notified_user),
+        ],
+        footer=member.id,
     )
-    embed.set_author(name=translate(_("Automod: Maximum points reached")), icon_url=member.display_avatar)
-    embed.add_field(name=translate(_("Action")), value=f"> {title}")
-    embed.add_field(name=translate(_("Executed at")), value="> " + utils.format_dt(utils.utcnow()), inline=True)
-    embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
-
-    if until is not None:
-        embed.add_field(name=translate(_("Punished until")), value=helper.embed_timestamp_format(until), inline=True)
-
-    if notified_user is not None:
-        embed.add_field(
-            name=translate(_("Received DM")), value="> " + translate(_("Yes") if notified_user else _("No"))
-        )
 
     await _send_webhook(bot, guild.id, webhook, embeds=[embed])
 
@@ -360,23 +390,19 @@ async def warn_log(bot: Plyoox, member: discord.Member, moderator: discord.Membe
     if webhook is None:
         return
 
-    embed = extensions.Embed(
-        description=translate(
-            _("The user {target.mention} ({target}) has been warned by {moderator.mention} ({moderator}).")
-        ).format(target=member, moderator=moderator),
-        color=colors.POINT_COLOR,
+    skeleton = WARN_TEMPLATE.get(bot, guild.preferred_locale)
+    embed = skeleton.render(
+        description={"target": member, "moderator": moderator},
+        icon_url=member.display_avatar,
+        values=[
+            f"> {reason}",
+            f"> {moderator} ({moderator.id})",
+            "> " + utils.format_dt(utils.utcnow()),
+            f"> {points}",
+            _received_dm(skeleton, notified_user),
+        ],
+        footer=member.id,
     )
-    embed.set_author(name=translate(_("User has been warned")), icon_url=member.display_avatar)
-    embed.add_field(name=translate(_("Reason")), value=f"> {reason}")
-    embed.add_field(name=translate(_("Moderator")), value=f"> {moderator} ({moderator.id})")
-    embed.add_field(name=translate(_("Executed at")), value="> " + utils.format_dt(utils.utcnow()))
-    embed.add_field(name=translate(_("Points added")), value=f"> {points}")
-    embed.set_footer(text=f"{translate(_('User Id'))}: {member.id}")
-
-    if notified_user is not None:
-        embed.add_field(
-            name=translate(_("Received DM")), value="> " + translate(_("Yes") if notified_user else _("No"))
-        )
 
     await _send_webhook(bot, guild.id, webhook, embeds=[embed])
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import io
+import logging
+import time
 from typing import TYPE_CHECKING
 
 import discord
@@ -12,6 +15,14 @@ if TYPE_CHECKING:
     from main import Plyoox
     from lib.types import Infractions
 
+_log = logging.getLogger(__name__)
+
+# Discord accepts up to 200 users per bulk ban request
+BULK_BAN_SIZE = 200
+# The massban is stopped after this number of users could not be banned one by one due to missing permissions
+MAX_BAN_ERRORS = 5
+PROGRESS_UPDATE_INTERVAL = 2
+
 
 class MemberView(extensions.PaginatedEphemeralView):
     MEMBERS_PER_PAGE = 50
@@ -75,31 +86,97 @@ class MassbanView(extensions.EphemeralView):
             _("{user_count} users will be banned..."), translation_data={"user_count": len(self.members)}
         )
 
+        guild = interaction.guild
+        members = {member.id: member for member in self.members}
+        failed: list[discord.abc.Snowflake] = []
         error_count = 0
         ban_count = 0
+        last_update = time.monotonic()
+
+        # Bulk bans require the manage guild permission, otherwise the users are banned one by one
+        bulk = guild.me.guild_permissions.manage_guild
+        chunk_size = BULK_BAN_SIZE if bulk else 1
+
+        for index in range(0, len(self.members), chunk_size):
+            chunk = self.members[index : index + chunk_size]
 
-        for member in self.members:
             try:
-                await interaction.guild.ban(member, reason=self.reason)
-                ban_count += 1
+                if bulk:
+                    result = await guild.bulk_ban(chunk, reason=self.reason)
+                else:
+                    await guild.ban(chunk[0], reason=self.reason)
             except discord.Forbidden:
+                if bulk:
+                    # The bot cannot ban members anymore, the remaining chunks would fail as well
+                    failed.extend(self.members[index:])
+                    await self._stop_ban(
+                        interaction,
+                        _("The bot is not allowed to ban users. {user_count} users have been banned."),
+                        ban_count,
+                        failed,
+                    )
+                    return
+
+                # A single ban also fails if the user is above the bot in the role hierarchy
                 error_count += 1
-                if error_count == 5:
-                    await interaction.edit_original_response(
-                        content=interaction.translate(
-                            _("Too many errors occurred while banning users. {user_count} users have been banned."),
-                            data={"user_count": ban_count},
-                        )
+                failed.append(chunk[0])
+
+                if error_count >= MAX_BAN_ERRORS:
+                    failed.extend(self.members[index + 1 :])
+                    await self._stop_ban(
+                        interaction,
+                        _("Too many errors occurred while banning users. {user_count} users have been banned."),
+                        ban_count,
+                        failed,
                     )
                     return
-            except discord.HTTPException:
-                pass
+            except discord.HTTPException as e:
+                _log.warning(f"Could not ban {len(chunk)} users in {interaction.guild_id}: {e}")
+                failed.extend(chunk)
+            else:
+                if bulk:
+                    # Users that are already banned or cannot be banned due to the role hierarchy
+                    ban_count += len(result.banned)
+                    failed.extend(members.get(user.id, user) for user in result.failed)
+                else:
+                    ban_count += 1
+
+            # Discord rate limits message edits, so the progress is only updated periodically
+            if time.monotonic() - last_update >= PROGRESS_UPDATE_INTERVAL:
+                last_update = time.monotonic()
+                await interaction.edit_original_response(
+                    content=interaction.translate(
+                        _("Banned {ban_count} of {user_count} users..."),
+                        data={"ban_count": ban_count, "user_count": len(self.members)},
+                    )
+                )
+
+        content = interaction.translate(_("Successfully banned {user_count} users."), data={"user_count": ban_count})
+        if failed:
+            content += "\n" + interaction.translate(
+                _("{user_count} users could not be banned."), data={"user_count": len(failed)}
+            )
 
         await interaction.edit_original_response(
-            content=interaction.translate(_("Successfully banned {user_count} users."), data={"user_count": ban_count}),
+            content=content,
+            attachments=[self._failed_users_file(failed)] if failed else [],
             view=None,
         )
 
+    async def _stop_ban(
+        self, interaction: discord.Interaction, message: _, ban_count: int, failed: list[discord.abc.Snowflake]
+    ) -> None:
+        await interaction.edit_original_response(
+            content=interaction.translate(message, data={"user_count": ban_count}),
+            attachments=[self._failed_users_file(failed)],
+            view=None,
+        )
+
+    @staticmethod
+    def _failed_users_file(users: list[discord.abc.Snowflake]) -> discord.File:
+        content = "\n".join(f"{user} ({user.id})" for user in users)
+        return discord.File(io.BytesIO(content.encode()), filename="failed_bans.txt")
+
     @ui.button(emoji=emojis.users)
     async def member_view(self, interaction: discord.Interaction, _b: discord.Button):
         await interaction.response.defer()
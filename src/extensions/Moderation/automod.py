@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
 import logging
 import re
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING
 
 import discord
@@ -11,7 +13,7 @@ from discord.app_commands import locale_str as _
 from discord.ext import commands
 
 from cache.models import ModerationModel, AutoModerationAction, ModerationPoints
-from lib import utils
+from lib import queries, utils
 from lib.enums import (
     AutoModerationPunishmentKind,
     AutoModerationCheckKind,
@@ -21,6 +23,7 @@ from lib.enums import (
 )
 from translation import translate as global_translate
 from . import _logging_helper as _logging
+from ._action_executor import ActionExecutor
 
 if TYPE_CHECKING:
     from main import Plyoox
@@ -94,9 +97,12 @@ class Automod(commands.Cog):
     def __init__(self, bot: Plyoox):
         self.bot = bot
         self.invite_cache: dict[str, discord.Invite | None] = utils.ExpiringCache(seconds=600)
-        self.punished_members: dict[tuple[int, int], bool] = utils.ExpiringCache(seconds=3)
+        self.executor = ActionExecutor()
         self._invite_requests: dict[str, asyncio.Event] = {}
 
+    async def cog_unload(self) -> None:
+        await self.executor.close()
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         await self._run_automod(message)
@@ -135,10 +141,7 @@ class Automod(commands.Cog):
         if not cache:  # Not configured or no actions
             return
 
-        if not guild.chunked:
-            await guild.chunk()
-
-        member = execution.member
+        member = execution.member or await self.bot.member_resolver.get_member(guild, execution.user_id)
         if member is None:
             _log.warning(f"Member {execution.user_id} not found in guild {guild.id}")
             return
@@ -149,8 +152,8 @@ class Automod(commands.Cog):
                     _("Violating a Discord moderation rule"), self.bot, guild.preferred_locale
                 )
 
-                await self._execute_action(
-                    data=AutoModerationActionData(
+                self._queue_action(
+                    AutoModerationActionData(
                         action=action,
                         member=member,
                         reason=reason,
@@ -268,7 +271,7 @@ class Automod(commands.Cog):
                     message=message, reason=reason, action_taken=action, bot=self.bot
                 )
 
-                await self._execute_action(data, message=message)
+                self._queue_action(data, message=message)
                 break
 
     async def _handle_final_action(self, member: discord.Member, actions: list[AutoModerationAction]):
@@ -301,10 +304,8 @@ class Automod(commands.Cog):
 
         guild = member.guild
 
-        if self.punished_members.get((member.id, member.guild.id)):
+        if not self.executor.mark_punished(guild.id, member.id):
             return
-        else:
-            self.punished_members[(member.id, member.guild.id)] = True
 
         if action.punishment.kind == AutomodFinalActionEnum.kick:
             if guild.me.guild_permissions.kick_members:
@@ -322,8 +323,8 @@ class Automod(commands.Cog):
                 timers = self.bot.timer
                 if timers is not None:
                     await timers.create_timer(
-                        guild.id,
                         member.id,
+                        guild.id,
                         TimerEnum.temp_ban,
                         banned_until,
                     )
@@ -337,39 +338,90 @@ class Automod(commands.Cog):
 
                 await member.timeout(muted_until)
 
-    async def _execute_action(self, data: AutoModerationActionData, message: discord.Message = None) -> None:
+    def _queue_action(
+        self, data: AutoModerationActionData, message: discord.Message | None = None
+    ) -> asyncio.Future | None:
+        """Queues the action for execution, so the listener does not have to wait for it.
+
+        Returns a future that resolves once the action has been executed or `None`
+        if there was nothing to execute.
+        """
         guild = data.guild
         member = data.member
-        automod_action = data.trigger_action
+        punishment_kind = data.trigger_action.punishment.kind
 
-        punishment_kind = automod_action.punishment.kind
-
-        if message is not None:
-            if punishment_kind in [
+        delete_message = (
+            message is not None
+            and punishment_kind
+            in [
                 AutoModerationPunishmentKind.kick,
                 AutoModerationPunishmentKind.tempmute,
                 AutoModerationPunishmentKind.point,
                 AutoModerationPunishmentKind.delete,
-            ]:
-                if message.channel.permissions_for(guild.me).manage_messages:
-                    await message.delete()
+            ]
+            and message.channel.permissions_for(guild.me).manage_messages
+        )
 
-        if punishment_kind != AutoModerationPunishmentKind.delete:
-            # Check if the member is already punished
-            if self.punished_members.get((member.id, member.guild.id)):
-                return
-            else:
-                if punishment_kind != AutoModerationPunishmentKind.point:
-                    self.punished_members[(member.id, member.guild.id)] = True
+        # Members that already have a queued punishment should not be punished again,
+        # but their messages still need to be deleted.
+        punish = punishment_kind == AutoModerationPunishmentKind.delete or not self.executor.is_punished(
+            guild.id, member.id
+        )
+        if not punish:
+            self.executor.deduplicated += 1
+
+        if not delete_message and not punish:
+            return None
+
+        return self.executor.submit(
+            guild.id,
+            member.id,
+            functools.partial(self._execute_action, data, message=message if delete_message else None, punish=punish),
+            punishment=punish
+            and punishment_kind not in [AutoModerationPunishmentKind.delete, AutoModerationPunishmentKind.point],
+        )
+
+    async def _execute_action(
+        self, data: AutoModerationActionData, message: discord.Message | None = None, *, punish: bool = True
+    ) -> None:
+        """Executes the action. Deleting the message does not depend on the punishment,
+        so both are run concurrently.
+        """
+        steps = []
+
+        if message is not None:
+            steps.append(message.delete())
+
+        if punish:
+            steps.append(self._execute_punishment(data))
+
+        await self._run_steps(*steps)
+
+    async def _execute_punishment(self, data: AutoModerationActionData) -> None:
+        guild = data.guild
+        member = data.member
+        automod_action = data.trigger_action
 
+        punishment_kind = automod_action.punishment.kind
+
+        # The member is notified before the punishment is executed, because a
+        # removed member cannot receive a direct message from the bot anymore.
         if punishment_kind == AutoModerationPunishmentKind.ban:
             if guild.me.guild_permissions.ban_members:
-                await guild.ban(member, reason=data.trigger_reason)
-                await _logging.automod_log(self.bot, data)
+                notified_user = await _logging.automod_notify(self.bot, data)
+
+                await self._run_steps(
+                    guild.ban(member, reason=data.trigger_reason),
+                    _logging.automod_log(self.bot, data, notified_user=notified_user),
+                )
         elif punishment_kind == AutoModerationPunishmentKind.kick:
             if guild.me.guild_permissions.kick_members:
-                await guild.kick(member, reason=data.trigger_reason)
-                await _logging.automod_log(self.bot, data)
+                notified_user = await _logging.automod_notify(self.bot, data)
+
+                await self._run_steps(
+                    guild.kick(member, reason=data.trigger_reason),
+                    _logging.automod_log(self.bot, data, notified_user=notified_user),
+                )
         elif punishment_kind == AutoModerationPunishmentKind.delete:
             await _logging.automod_log(self.bot, data)
         elif punishment_kind == AutoModerationPunishmentKind.tempban:
@@ -378,20 +430,39 @@ class Automod(commands.Cog):
 
                 timers = self.bot.timer
                 if timers is not None:
-                    await timers.create_timer(guild.id, member.id, TimerEnum.temp_ban, banned_until)
-                    await _logging.automod_log(self.bot, data)
-                    await guild.ban(member, reason=data.trigger_reason)
+                    await timers.create_timer(member.id, guild.id, TimerEnum.temp_ban, banned_until)
+                    notified_user = await _logging.automod_notify(self.bot, data)
+
+                    await self._run_steps(
+                        guild.ban(member, reason=data.trigger_reason),
+                        _logging.automod_log(self.bot, data, notified_user=notified_user),
+                    )
                 else:
                     _log.warning("Timer Plugin is not initialized")
         elif punishment_kind == AutoModerationPunishmentKind.tempmute:
             if guild.me.guild_permissions.mute_members:
                 muted_until = discord.utils.utcnow() + datetime.timedelta(seconds=automod_action.punishment.duration)
 
-                await member.timeout(muted_until)
-                await _logging.automod_log(self.bot, data, until=muted_until)
+                await self._run_steps(
+                    member.timeout(muted_until),
+                    _logging.automod_log(self.bot, data, until=muted_until),
+                )
         elif punishment_kind == AutoModerationPunishmentKind.point:
             await self._handle_points(data)
 
+    @staticmethod
+    async def _run_steps(*steps: Awaitable) -> None:
+        """Runs independent steps of an action concurrently. A failing step does not cancel the others."""
+        results = await asyncio.gather(*steps, return_exceptions=True)
+
+        for result in results:
+            # The message or member might have already been removed by someone else
+            if isinstance(result, discord.NotFound):
+                continue
+
+            if isinstance(result, Exception):
+                _log.error("Error while executing automod step", exc_info=result)
+
     @staticmethod
     def _is_affected(message: discord.Message, cache: ModerationModel, kind: AutoModerationExecutionKind) -> bool:
         """This function checks if the automod should be executed on the message.
@@ -471,7 +542,12 @@ class Automod(commands.Cog):
                 _log.warning(f"{guild.id} has no moderation cache")
                 return
 
-            await self._handle_final_action(member, cache.point_actions)
+            # The final action has to be queued, so it is ordered with other actions of the member
+            future = self.executor.submit(
+                guild.id, member.id, functools.partial(self._handle_final_action, member, cache.point_actions)
+            )
+            if future is not None:
+                await future
 
     async def __add_points(self, *, member: discord.Member, points: ModerationPoints, reason: str) -> int:
         """Add points to a member and returns the currently active points."""
@@ -482,17 +558,6 @@ class Automod(commands.Cog):
         if points.expires_in:
             expires_at = discord.utils.utcnow().replace(tzinfo=None) + datetime.timedelta(seconds=points.expires_in)
 
-        await self.bot.db.execute(
-            "INSERT INTO automoderation_user (guild_id, user_id, expires_at, points, reason) VALUES ($1, $2, $3, $4, $5)",
-            guild.id,
-            member.id,
-            expires_at,
-            points.amount,
-            reason,
-        )
+        await queries.insert_automoderation_points(self.bot.db, guild.id, member.id, points.amount, expires_at, reason)
 
-        return await self.bot.db.fetchval(
-            "SELECT SUM(points) FROM automoderation_user WHERE user_id = $1 AND guild_id = $2 AND (expires_at IS NULL OR (now() AT TIME ZONE 'utc') < expires_at)",
-            member.id,
-            guild.id,
-        )
+        return await queries.fetch_automoderation_points(self.bot.db, guild.id, member.id)
@@ -1,6 +1,7 @@
 import asyncio
 import re
 import time
+from collections.abc import AsyncIterator
 from typing import Optional, Callable
 
 import discord
@@ -8,10 +9,13 @@ from discord import app_commands
 from discord.ext import commands
 from discord.app_commands import locale_str as _
 
-from lib import extensions
+from lib import extensions, helper
+from lib.message_cache import MessageCache
 from . import _logging_helper
 
 LINK_REGEX = re.compile(r"https?://(?:[-\w.]|%[\da-fA-F]{2})+", re.IGNORECASE)
+# Discord accepts up to 100 messages per bulk delete request
+BULK_DELETE_SIZE = 100
 
 
 class CooldownByInteraction(commands.CooldownMapping):
@@ -46,40 +50,103 @@ class ClearGroup(app_commands.Group):
 
         raise app_commands.CommandOnCooldown(bucket, retry_after)
 
+    @staticmethod
+    async def _history(
+        channel: discord.TextChannel, cache: MessageCache[discord.Message], *, limit: int, after: int
+    ) -> AsyncIterator[discord.Message]:
+        """Yields the latest messages of the channel, newest first. If the cache contains the
+        recent history of the channel, only the older messages are fetched.
+        """
+        before = None
+
+        cached = cache.channel_history(channel.id)
+        if cached is not None:
+            watermark, messages = cached
+
+            for message in messages:
+                if limit == 0 or message.id <= after:
+                    return
+
+                limit -= 1
+                yield message
+
+            if watermark <= after:
+                return
+
+            before = discord.Object(id=watermark)
+
+        if limit == 0:
+            return
+
+        async for message in channel.history(
+            limit=limit, before=before, after=discord.Object(id=after), oldest_first=False
+        ):
+            yield message
+
+    @staticmethod
+    async def _collect_batches(
+        messages: AsyncIterator[discord.Message],
+        check: Callable[[discord.Message], bool],
+        queue: asyncio.Queue[list[discord.Message] | None],
+    ) -> None:
+        """Puts the messages to delete in batches into the queue. `None` marks the end."""
+        batch = []
+
+        try:
+            async for message in messages:
+                if not check(message):
+                    continue
+
+                batch.append(message)
+                if len(batch) == BULK_DELETE_SIZE:
+                    await queue.put(batch)
+                    batch = []
+
+            if batch:
+                await queue.put(batch)
+        except Exception:
+            await queue.put(None)
+            raise
+
+        await queue.put(None)
+
     @staticmethod
     async def _purge_helper(
         channel: discord.TextChannel,
+        cache: MessageCache[discord.Message],
         *,
         limit: Optional[int] = 100,
         check: Callable[[discord.Message], bool],
         reason: Optional[str] = None,
-    ) -> list[discord.Message]:
+    ) -> helper.MessageLog:
         oldest_message_id = int((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
 
-        iterator = channel.history(limit=limit, after=discord.Object(id=oldest_message_id), oldest_first=False)
-        ret: list[discord.Message] = []
-        count = 0
+        deleted = helper.MessageLog()
 
-        async for message in iterator:
-            if count == 100:
-                to_delete = ret[-100:]
-                await channel.delete_messages(to_delete, reason=reason)
-                count = 0
-                await asyncio.sleep(1)
+        # The next messages are fetched while the previous batch is deleted.
+        # Rate limits of both routes are handled by the http client.
+        queue: asyncio.Queue[list[discord.Message] | None] = asyncio.Queue(maxsize=2)
+        producer = asyncio.create_task(
+            ClearGroup._collect_batches(
+                ClearGroup._history(channel, cache, limit=limit, after=oldest_message_id), check, queue
+            )
+        )
 
-            if not check(message):
-                continue
+        try:
+            while (batch := await queue.get()) is not None:
+                if len(batch) == 1:
+                    await batch[0].delete()
+                else:
+                    await channel.delete_messages(batch, reason=reason)
 
-            count += 1
-            ret.append(message)
+                deleted.add_many(batch)
+        except BaseException:
+            producer.cancel()
+            raise
 
-        if count >= 2:
-            to_delete = ret[-count:]
-            await channel.delete_messages(to_delete, reason=reason)
-        elif count == 1:
-            await ret[-1].delete()
+        await producer
 
-        return ret
+        return deleted
 
     async def do_removal(
         self,
@@ -94,8 +161,10 @@ class ClearGroup(app_commands.Group):
         channel = interaction.channel
 
         # delete the messages
-        deleted_messages = await self._purge_helper(channel, limit=limit, check=predicate, reason=reason)
-        deleted_count = len(deleted_messages)
+        deleted = await self._purge_helper(
+            channel, interaction.client.messages, limit=limit, check=predicate, reason=reason
+        )
+        deleted_count = deleted.count
 
         if deleted_count == 0:
             await interaction.followup.send(
@@ -103,7 +172,7 @@ class ClearGroup(app_commands.Group):
             )
             return
 
-        affected_users = set(m.author.id for m in deleted_messages)  # list of affected users
+        affected_users = deleted.authors
 
         embed = extensions.Embed(title=interaction.translate(_("Messages deleted")))
 
@@ -121,9 +190,7 @@ class ClearGroup(app_commands.Group):
             embed=embed,
         )
 
-        await _logging_helper.log_clear_command(
-            interaction, reason=reason, deleted_messages=deleted_messages, total=limit
-        )
+        await _logging_helper.log_clear_command(interaction, reason=reason, deleted=deleted, total=limit)
 
     @app_commands.command(name="all", description=_("Clear all messages in a channel."))
     @app_commands.describe(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
 import re
@@ -414,7 +415,7 @@ class Moderation(commands.Cog):
         joined_before_days=_("Only users that joined before this (in days)."),
     )
     @app_commands.guild_only
-    @app_commands.checks.bot_has_permissions(read_messages=True)
+    @app_commands.checks.bot_has_permissions(read_messages=True, ban_members=True)
     @app_commands.default_permissions(administrator=True)
     @app_commands.checks.cooldown(2, 60, key=lambda i: (i.guild.id, i.user.id))
     async def massban(
@@ -465,14 +466,18 @@ class Moderation(commands.Cog):
                 else:
                     predicates.append(lambda m: not len(m.attachments))
 
+            authors = {}
             async for message in channel.history(limit=amount, before=before, after=after):
                 if all(p(message) for p in predicates):
-                    members.append(message.author)
-        else:
-            if not interaction.guild.chunked:
-                await interaction.guild.chunk(cache=True)
+                    authors[message.author.id] = message.author
 
-            members = interaction.guild.members
+            # Authors of fetched messages are users if the member is not cached.
+            # Users that are no longer members of the guild are kept, so they can still be banned.
+            resolved = await interaction.client.member_resolver.get_members(interaction.guild, authors.keys())
+            members = [resolved.get(user_id, author) for user_id, author in authors.items()]
+        else:
+            # Without a channel, all members of the guild are checked
+            members = await interaction.client.member_resolver.chunk(interaction.guild)
 
         # member filters
         predicates = [
@@ -679,13 +684,18 @@ class Moderation(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
 
+        # Actions of a member are executed in order, so they can be queued at once
+        futures = []
         for action in punishment.actions:
             if automod._handle_checks(member, action):
                 data = AutoModerationActionData(
                     action=action, member=member, reason=punishment.reason, moderator=interaction.user
                 )
 
-                await automod._execute_action(data)
+                if (future := automod._queue_action(data)) is not None:
+                    futures.append(future)
+
+        await asyncio.gather(*futures)
 
         await interaction.followup.send(interaction.translate(_("The user has been punished.")), ephemeral=True)
 
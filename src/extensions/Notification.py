@@ -1,27 +1,192 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import functools
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Literal
 
 import discord
 from discord import utils
 from discord.ext import commands
 from discord.app_commands import locale_str as _
+from lru import LRU
 
+from cache.models import NotificationSubscription, TwitchStreamerModel
 from lib import emojis, extensions, helper
+from lib.fanout import FanOut, ResultCallback
 from translation import translate as global_translate
 
 if TYPE_CHECKING:
     from main import Plyoox
-    from lib.types import TwitchLiveNotification, Translate, TwitchOfflineNotification, YoutubeVideoNotification
+    from lib.types import (
+        TwitchLiveNotification,
+        Translate,
+        TwitchOfflineNotification,
+        YoutubeVideoNotification,
+        NotificationDeliveryStatus,
+    )
 
 _log = logging.getLogger(__name__)
 
+type QueuedNotification = (
+    tuple[Literal["twitch"], TwitchLiveNotification] | tuple[Literal["youtube"], YoutubeVideoNotification]
+)
+
+NOTIFICATION_QUEUE_SIZE = 1000
+NOTIFICATION_WORKERS = 4
+# Status updates are dropped for listeners that do not keep up
+STATUS_QUEUE_SIZE = 1000
+
 
 class Notification(commands.Cog):
     def __init__(self, bot: Plyoox):
         self.bot = bot
+        self.fanout = FanOut()
+
+        self._queue: asyncio.Queue[QueuedNotification] = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        self._workers: list[asyncio.Task] = []
+        self._status_listeners: set[asyncio.Queue[NotificationDeliveryStatus]] = set()
+
+        # The subscriptions are invalidated by the notification services when they are changed
+        self._twitch_subscriptions: LRU = LRU(1024)
+        self._youtube_subscriptions: LRU = LRU(1024)
+
+    async def cog_load(self) -> None:
+        self._workers = [
+            asyncio.create_task(self._notification_worker(), name=f"notification-worker-{index}")
+            for index in range(NOTIFICATION_WORKERS)
+        ]
+
+    async def cog_unload(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of queued notifications."""
+        return self._queue.qsize()
+
+    async def enqueue_notification(self, notification: QueuedNotification) -> None:
+        """Queues a notification. This only waits if the queue is full."""
+        await self._queue.put(notification)
+
+    async def _notification_worker(self) -> None:
+        while True:
+            kind, data = await self._queue.get()
+
+            try:
+                if kind == "twitch":
+                    await self.send_twitch_notification(data)
+                else:
+                    await self.send_youtube_notification(data)
+            except Exception as e:
+                _log.error(f"Error while sending {kind} notification", exc_info=e)
+            finally:
+                self._queue.task_done()
+
+    async def listen_delivery_status(
+        self, kind: Literal["twitch", "youtube"]
+    ) -> AsyncIterator[NotificationDeliveryStatus]:
+        """Yields the delivery status of every notification of the kind sent to a channel."""
+        queue: asyncio.Queue[NotificationDeliveryStatus] = asyncio.Queue(maxsize=STATUS_QUEUE_SIZE)
+        self._status_listeners.add(queue)
+
+        try:
+            while True:
+                status = await queue.get()
+                if status["kind"] == kind:
+                    yield status
+        finally:
+            self._status_listeners.discard(queue)
+
+    def _status_callback(
+        self, kind: Literal["twitch", "youtube"], id: int | str, subscriptions: list[NotificationSubscription]
+    ) -> ResultCallback:
+        def callback(index: int, error: Exception | None, latency: float) -> None:
+            if not self._status_listeners:
+                return
+
+            status: NotificationDeliveryStatus = {
+                "kind": kind,
+                "id": id,
+                "guild_id": subscriptions[index].guild_id,
+                "channel_id": subscriptions[index].channel,
+                "delivered": error is None,
+                "error": repr(error) if error is not None else None,
+                "latency": latency,
+            }
+
+            for listener in self._status_listeners:
+                if not listener.full():
+                    listener.put_nowait(status)
+
+        return callback
+
+    def invalidate_twitch_subscriptions(self, user_id: int) -> None:
+        if user_id in self._twitch_subscriptions:
+            del self._twitch_subscriptions[user_id]
+
+    def invalidate_youtube_subscriptions(self, youtube_id: str) -> None:
+        if youtube_id in self._youtube_subscriptions:
+            del self._youtube_subscriptions[youtube_id]
+
+    async def get_twitch_subscriptions(self, user_id: int) -> TwitchStreamerModel | None:
+        """Returns the streamer and the guilds that subscribed to them."""
+        if user_id in self._twitch_subscriptions:
+            return self._twitch_subscriptions[user_id]
+
+        records = await self.bot.db.fetch(
+            "SELECT gs.guild_id, gs.channel, gs.message, ts.login, ts.display_name, ts.profile_image_url "
+            "FROM twitch.guild_streamer gs INNER JOIN twitch.twitch_streamer ts on ts.user_id = gs.user_id "
+            "WHERE gs.user_id = $1",
+            user_id,
+        )
+
+        streamer = None
+        if records:
+            streamer = TwitchStreamerModel(
+                user_id=user_id,
+                login=records[0]["login"],
+                display_name=records[0]["display_name"],
+                profile_image_url=records[0]["profile_image_url"],
+                subscriptions=[
+                    NotificationSubscription(
+                        guild_id=record["guild_id"], channel=record["channel"], message=record["message"]
+                    )
+                    for record in records
+                ],
+            )
+
+        self._twitch_subscriptions[user_id] = streamer
+        return streamer
+
+    async def get_youtube_subscriptions(self, youtube_id: str) -> list[NotificationSubscription]:
+        """Returns the guilds that subscribed to the YouTube channel."""
+        if youtube_id in self._youtube_subscriptions:
+            return self._youtube_subscriptions[youtube_id]
+
+        records = await self.bot.db.fetch(
+            "SELECT guild_id, channel, message FROM youtube.youtube_notification WHERE youtube_channel = $1",
+            youtube_id,
+        )
+
+        subscriptions = [NotificationSubscription(**record) for record in records]
+
+        self._youtube_subscriptions[youtube_id] = subscriptions
+        return subscriptions
+
+    def _get_channel(self, subscription: NotificationSubscription) -> discord.abc.Messageable | None:
+        guild = self.bot.get_guild(subscription.guild_id)
+        if guild is None:
+            return None
+
+        channel = guild.get_channel(subscription.channel)
+        if channel is None or not channel.permissions_for(guild.me).send_messages:
+            return None
+
+        return channel
 
     @staticmethod
     def _get_stream_embed(
@@ -82,40 +247,39 @@ class Notification(commands.Cog):
         )
 
     async def send_twitch_notification(self, data: TwitchLiveNotification):
-        def translate(string: _) -> str:
-            return global_translate(string, self.bot, guild.preferred_locale)
+        streamer = await self.get_twitch_subscriptions(data["user_id"])
+        if streamer is None:
+            return
 
-        notification = await self.bot.db.fetchrow(
-            "SELECT gs.user_id, guild_id, channel, ts.display_name, ts.login, gs.message, ts.profile_image_url, ts.display_name "
-            "FROM twitch.guild_streamer gs INNER JOIN twitch.twitch_streamer ts on ts.user_id = gs.user_id WHERE gs.user_id = $1",
-            data["user_id"],
-        )
+        # The embed and button label only depend on the locale of the guild
+        translated: dict[discord.Locale, tuple[discord.Embed, str]] = {}
 
-        if notification is None:
-            return
+        def get_translated(locale: discord.Locale) -> tuple[discord.Embed, str]:
+            if locale not in translated:
 
-        guild = self.bot.get_guild(notification["guild_id"])
-        if guild is None:
-            return
+                def translate(string: _) -> str:
+                    return global_translate(string, self.bot, locale)
 
-        channel = guild.get_channel(notification["channel"])
+                embed = self._get_stream_embed(
+                    data=data,
+                    login=streamer.login,
+                    translate=translate,
+                    image_url=streamer.profile_image_url,
+                    display_name=streamer.display_name,
+                )
+                translated[locale] = (embed, translate(_("Go to Twitch")))
 
-        if channel.permissions_for(guild.me).send_messages:
-            message_content = notification["message"]
-            embed = self._get_stream_embed(
-                data=data,
-                login=notification["login"],
-                translate=translate,
-                image_url=notification["profile_image_url"],
-                display_name=notification["display_name"],
-            )
+            return translated[locale]
+
+        async def send(channel: discord.TextChannel, message_content: str | None) -> int:
+            embed, label = get_translated(channel.guild.preferred_locale)
 
             view = discord.ui.View()
             view.add_item(
                 discord.ui.Button(
-                    label=translate(_("Go to Twitch")),
+                    label=label,
                     style=discord.ButtonStyle.gray,
-                    url=f"https://twitch.tv/{notification['login']}",
+                    url=f"https://twitch.tv/{streamer.login}",
                     emoji=emojis.twitch,
                 )
             )
@@ -127,11 +291,38 @@ class Notification(commands.Cog):
                 embed=embed,
             )
 
-            await self.bot.db.execute(
-                "UPDATE twitch.live_stream SET message_id = $1 WHERE stream_id = $2 AND guild_id = $3",
-                message.id,
-                data["stream_id"],
-                guild.id,
+            return message.id
+
+        deliveries = []
+        delivered_to = []
+
+        for subscription in streamer.subscriptions:
+            # The notification is sent for a single guild if the guild is set
+            if data["guild_id"] and subscription.guild_id != data["guild_id"]:
+                continue
+
+            channel = self._get_channel(subscription)
+            if channel is None:
+                continue
+
+            deliveries.append((channel.id, functools.partial(send, channel, subscription.message)))
+            delivered_to.append(subscription)
+
+        message_ids = await self.fanout.run(
+            f"twitch notification {data['stream_id']}",
+            deliveries,
+            on_result=self._status_callback("twitch", data["stream_id"], delivered_to),
+        )
+
+        updates = [
+            (message_id, data["stream_id"], subscription.guild_id)
+            for message_id, subscription in zip(message_ids, delivered_to)
+            if message_id is not None
+        ]
+
+        if updates:
+            await self.bot.db.executemany(
+                "UPDATE twitch.live_stream SET message_id = $1 WHERE stream_id = $2 AND guild_id = $3", updates
             )
 
     async def twitch_offline_edit(self, data: TwitchOfflineNotification):
@@ -184,35 +375,35 @@ class Notification(commands.Cog):
         await self._delete_guild_notification(data["stream_id"], data["guild_id"])
 
     async def send_youtube_notification(self, data: YoutubeVideoNotification):
-        notifications = await self.bot.db.fetch(
-            "SELECT guild_id, channel, message FROM youtube.youtube_notification WHERE youtube_channel = $1",
-            data["user_id"],
-        )
-
-        if not notifications:
+        subscriptions = await self.get_youtube_subscriptions(data["user_id"])
+        if not subscriptions:
             return
 
-        for notification in notifications:
-            guild = self.bot.get_guild(notification["guild_id"])
-            if guild is None:
-                continue
+        async def send(channel: discord.TextChannel, message_content: str | None) -> None:
+            if message_content:
+                message = f"{message_content} https://youtu.be/{data['video_id']}"
+            else:
+                message = f"https://youtu.be/{data['video_id']}"
 
-            channel = guild.get_channel(notification["channel"])
-            if channel is None:
-                continue
+            await channel.send(
+                message,
+                allowed_mentions=discord.AllowedMentions(everyone=True, roles=True, users=True),
+            )
 
-            if channel.permissions_for(guild.me).send_messages:
-                message_content = notification["message"]
+        deliveries = []
+        delivered_to = []
 
-                if message_content:
-                    message = f"{message_content} https://youtu.be/{data['video_id']}"
-                else:
-                    message = f"https://youtu.be/{data['video_id']}"
+        for subscription in subscriptions:
+            channel = self._get_channel(subscription)
+            if channel is not None:
+                deliveries.append((channel.id, functools.partial(send, channel, subscription.message)))
+                delivered_to.append(subscription)
 
-                await channel.send(
-                    message,
-                    allowed_mentions=discord.AllowedMentions(everyone=True, roles=True, users=True),
-                )
+        await self.fanout.run(
+            f"youtube notification {data['video_id']}",
+            deliveries,
+            on_result=self._status_callback("youtube", data["video_id"], delivered_to),
+        )
 
 
 async def setup(bot: Plyoox):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import datetime
 import importlib
 import io
 import json
@@ -12,6 +13,7 @@ import discord
 from discord.ext import commands
 
 from lib import extensions
+from lib.loop_monitor import LAG_BUCKETS
 
 if TYPE_CHECKING:
     from main import Plyoox
@@ -160,6 +162,16 @@ class Owner(commands.Cog):
         else:
             await ctx.message.add_reaction("✅")
 
+    @commands.command(name="reload-translations")
+    @commands.is_owner()
+    async def reload_translations(self, ctx: commands.Context):
+        try:
+            ctx.bot.tree.translator.reload()
+        except Exception as e:
+            await ctx.send(f"```py\n{e}{traceback.format_exc()}\n```")
+        else:
+            await ctx.message.add_reaction("✅")
+
     @commands.command()
     @commands.guild_only()
     @commands.is_owner()
@@ -169,6 +181,9 @@ class Owner(commands.Cog):
         guilds: commands.Greedy[discord.Object],
         spec: Optional[Literal["~", "*", "^"]] = None,
     ) -> None:
+        # Otherwise the commands of the lazy extensions would be removed
+        await ctx.bot.load_lazy_plugins()
+
         if not guilds:
             if spec == "~":
                 synced = await ctx.bot.tree.sync(guild=ctx.guild)
@@ -208,6 +223,119 @@ class Owner(commands.Cog):
 
         await ctx.send("\n".join([f"{emoji} - `{emoji}`" for emoji in emojis]))
 
+    @commands.command(name="db-stats")
+    @commands.is_owner()
+    async def db_stats(self, ctx: commands.Context, count: int = 10, reset: bool = False):
+        pool = ctx.bot.db
+        metrics = pool.metrics()
+
+        lines = []
+        for statement in pool.statements()[:count]:
+            lines.append(
+                f"{statement.total:.2f}s total, {statement.calls} calls, "
+                f"avg {statement.total / statement.calls * 1000:.1f}ms, p99 {statement.p99 * 1000:.1f}ms, "
+                f"{statement.rows} rows, {statement.errors} errors\n{textwrap.shorten(statement.query, 300)}\n"
+            )
+
+        description = "\n".join(lines) or "No queries recorded."
+        embed = extensions.Embed(title="Database statistics", description=f"```sql\n{description[:4000]}\n```")
+        embed.add_field(name="Statements", value=f"{metrics['statements']} ({metrics['calls']} calls)")
+        embed.add_field(
+            name="Acquire wait",
+            value=f"avg {metrics['acquire_avg'] * 1000:.1f}ms, p99 {metrics['acquire_p99'] * 1000:.1f}ms",
+        )
+        embed.add_field(name="Pool", value=f"{pool.get_size() - pool.get_idle_size()}/{pool.get_max_size()} in use")
+
+        if reset:
+            pool.reset()
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name="profile-listeners")
+    @commands.is_owner()
+    async def profile_listeners(self, ctx: commands.Context, action: Literal["on", "off", "reset"] | None = None):
+        profiler = ctx.bot.listener_profiler
+
+        if action is not None:
+            if action == "reset":
+                profiler.reset()
+            else:
+                profiler.enabled = action == "on"
+
+            await ctx.message.add_reaction("✅")
+            return
+
+        listeners = profiler.stats()
+        if not listeners:
+            await ctx.send(f"No listeners measured, profiling is {'enabled' if profiler.enabled else 'disabled'}.")
+            return
+
+        lines = []
+        for stats in listeners[:15]:
+            lines.append(
+                f"{stats.cog}.{stats.event}: {stats.total:.2f}s total, {stats.calls} calls, {stats.errors} errors, "
+                f"avg {stats.total / stats.calls * 1000:.1f}ms, p99 <= {stats.percentile(0.99) * 1000:g}ms, "
+                f"max {stats.max * 1000:.1f}ms"
+            )
+
+        # Total time per shard and the cog that takes the most time on it
+        shards: dict[int, dict[str, float]] = {}
+        for stats in listeners:
+            for shard_id, total in stats.shards.items():
+                cogs = shards.setdefault(shard_id, {})
+                cogs[stats.cog] = cogs.get(stats.cog, 0.0) + total
+
+        lines.append("")
+        for shard_id, cogs in sorted(shards.items()):
+            cog, total = max(cogs.items(), key=lambda item: item[1])
+            shard = f"Shard {shard_id}" if shard_id != -1 else "No guild"
+            lines.append(f"{shard}: {sum(cogs.values()):.2f}s total, {cog} {total:.2f}s")
+
+        description = "\n".join(lines)
+        embed = extensions.Embed(
+            title=f"Listener profile ({'enabled' if profiler.enabled else 'disabled'})",
+            description=f"```\n{description[:4000]}\n```",
+        )
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name="loop-lag")
+    @commands.is_owner()
+    async def loop_lag(self, ctx: commands.Context):
+        monitor = ctx.bot.loop_monitor
+        metrics = monitor.metrics()
+
+        lines = [
+            f"Current: {metrics['lag'] * 1000:.1f}ms",
+            f"p50: {metrics['lag_p50'] * 1000:.1f}ms, p99: {metrics['lag_p99'] * 1000:.1f}ms",
+            f"Max: {metrics['lag_max'] * 1000:.1f}ms",
+            "",
+        ]
+
+        for bound, count in zip((*LAG_BUCKETS, None), monitor.histogram):
+            label = f"<= {bound * 1000:g}ms" if bound is not None else f"> {LAG_BUCKETS[-1] * 1000:g}ms"
+            lines.append(f"{label:>10}: {count}")
+
+        description = "\n".join(lines)
+        embed = extensions.Embed(title="Event loop lag", description=f"```\n{description}\n```")
+
+        file = discord.utils.MISSING
+        if monitor.slow_callbacks:
+            for report in list(monitor.slow_callbacks)[-5:]:
+                blocked_at = datetime.datetime.fromtimestamp(report.timestamp, datetime.timezone.utc)
+                embed.add_field(
+                    name=f"{report.lag:.2f}s",
+                    value=f"{discord.utils.format_dt(blocked_at, 'R')}\n`{report.task}`",
+                    inline=False,
+                )
+
+            stacks = "\n\n".join(
+                f"{report.lag:.2f}s in {report.task}:\n{''.join(report.stack)}" for report in monitor.slow_callbacks
+            )
+            file = discord.File(io.BytesIO(stacks.encode()), filename="slow_callbacks.txt")
+
+        await ctx.send(embed=embed, file=file)
+
 
 async def setup(bot: Plyoox):
     await bot.add_cog(Owner(bot))
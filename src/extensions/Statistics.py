@@ -1,82 +1,87 @@
 from __future__ import annotations
 
+import datetime
 import io
+import logging
+import os
 from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from lib.statistics_writer import CommandStatisticsWriter
+
 if TYPE_CHECKING:
-    import datetime
-    from typing import TypedDict, Union, NotRequired
+    from typing import TypedDict, Union
 
     from main import Plyoox
 
-    class CommandStatistic(TypedDict):
+    class CommandUsage(TypedDict):
         command: str
-        guild_id: int
-        user_id: int
-        executed_at: datetime.datetime
-        usage: NotRequired[int]
+        usage: int
+
+
+_log = logging.getLogger(__name__)
 
 
 class Statistics(commands.Cog):
     def __init__(self, bot: Plyoox):
         self.bot = bot
-        self._command_statistics: list[CommandStatistic] = []
-        self._insert_command_statistics.start()
+        self._command_statistics = CommandStatisticsWriter(bot.db)
 
-    async def cog_unload(self) -> None:
-        self._insert_command_statistics.stop()
+        # Raw statistics older than this are deleted, the hourly rollups are kept
+        retention_days = os.getenv("COMMAND_STATISTICS_RETENTION_DAYS")
+        self._retention = datetime.timedelta(days=int(retention_days)) if retention_days else None
 
-    @tasks.loop(seconds=60)
-    async def _insert_command_statistics(self):
-        def map_values(val: CommandStatistic) -> tuple:
-            return val["command"], val["guild_id"], val["user_id"], val["executed_at"]
+    @property
+    def queue_depth(self) -> int:
+        """The number of command usages that have not been written yet."""
+        return len(self._command_statistics)
 
-        if not self._command_statistics:
-            return
+    async def cog_load(self) -> None:
+        if await self.bot.db.fetchval("SELECT to_regclass('command_statistics_hourly')") is None:
+            _log.error("Table command_statistics_hourly does not exist, run migrations/command_statistics_hourly.sql")
+            self._command_statistics.rollups = False
 
-        values = list(map(map_values, self._command_statistics))
+        self._command_statistics.start()
 
-        self._command_statistics.clear()
+        if self._retention is not None:
+            self._prune_command_statistics.start()
 
-        await self.bot.db.executemany(
-            "INSERT INTO command_statistics (command, guild_id, user_id, executed_at) VALUES ($1, $2, $3, $4)",
-            values,
-        )
+    async def cog_unload(self) -> None:
+        self._prune_command_statistics.cancel()
+        await self._command_statistics.close()
 
-    @commands.Cog.listener()
-    async def on_app_command_completion(
-        self, interaction: discord.Interaction, command: Union[app_commands.Command, app_commands.ContextMenu]
-    ):
-        statistics: CommandStatistic = {
-            "command": command.qualified_name,
-            "guild_id": interaction.guild_id,  # type: ignore
-            "executed_at": discord.utils.utcnow().replace(tzinfo=None),
-            "user_id": interaction.user.id,
-        }
+    @tasks.loop(hours=24)
+    async def _prune_command_statistics(self):
+        before = discord.utils.utcnow().replace(tzinfo=None) - self._retention
+        result = await self.bot.db.execute("DELETE FROM command_statistics WHERE executed_at < $1", before)
 
-        self._command_statistics.append(statistics)
+        _log.info(f"Pruned command statistics before {before}: {result}")
 
-    @commands.group(name="stats")
-    @commands.is_owner()
-    async def stats(self, ctx: commands.Context):
-        pass
+    async def _reply_command_usage(self, ctx: commands.Context, guild_id: int | None, days: int | None) -> None:
+        # Include the statistics that are not written yet
+        await self._command_statistics.flush()
 
-    @stats.command(name="all")
-    @commands.is_owner()
-    async def stats_all(self, ctx: commands.Context, days: int | None):
-        if days is None:
-            command_stats: list[CommandStatistic] = await self.bot.db.fetch(
-                "SELECT command, count(*) as usage FROM command_statistics GROUP BY command ORDER BY usage DESC"
-            )
-        else:
-            command_stats: list[CommandStatistic] = await self.bot.db.fetch(
-                "SELECT name, count(*) as usage FROM command_statistics WHERE "
-                f"used_at > (CURRENT_TIMESTAMP - INTERVAL '{days} days') GROUP BY name ORDER BY usage DESC",
-            )
+        conditions = []
+        args = []
+
+        if guild_id is not None:
+            args.append(guild_id)
+            conditions.append(f"guild_id = ${len(args)}")
+
+        if days is not None:
+            since = discord.utils.utcnow().replace(tzinfo=None) - datetime.timedelta(days=days)
+            args.append(since.replace(minute=0, second=0, microsecond=0))
+            conditions.append(f"hour >= ${len(args)}")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        command_stats: list[CommandUsage] = await self.bot.db.fetch(
+            f"SELECT command, sum(usage) AS usage FROM command_statistics_hourly {where} "
+            "GROUP BY command ORDER BY usage DESC",
+            *args,
+        )
 
         embed = discord.Embed(title="Command stats", description="")
 
@@ -91,33 +96,31 @@ class Statistics(commands.Cog):
 
         await ctx.reply(embed=embed)
 
-    @stats.command(name="guild")
-    @commands.is_owner()
-    async def statistics_guild(self, ctx: commands.Context, days: int | None):
-        if days is None:
-            command_stats: list = await self.bot.db.fetch(
-                "SELECT command, count(*) as usage FROM command_statistics WHERE guild_id = $1 GROUP BY command ORDER BY usage DESC",
-                ctx.guild.id,
-            )
-        else:
-            command_stats: list[CommandStatistic] = await self.bot.db.fetch(
-                "SELECT name, count(*) as usage FROM command_statistics WHERE guild_id = $1 AND used_at"
-                f" > (CURRENT_TIMESTAMP - INTERVAL '{days} days') GROUP BY name ORDER BY usage DESC",
-                ctx.guild.id,
-            )
-
-        embed = discord.Embed(title="Command stats", description="")
-
-        for stat in command_stats:
-            embed.description += f"{stat['command']}: {stat['usage']}\n"
+    @commands.Cog.listener()
+    async def on_app_command_completion(
+        self, interaction: discord.Interaction, command: Union[app_commands.Command, app_commands.ContextMenu]
+    ):
+        self._command_statistics.add(
+            command.qualified_name,
+            interaction.guild_id,
+            interaction.user.id,
+            discord.utils.utcnow().replace(tzinfo=None),
+        )
 
-            if len(embed.description) >= 4000:
-                break
+    @commands.group(name="stats")
+    @commands.is_owner()
+    async def stats(self, ctx: commands.Context):
+        pass
 
-        if not embed.description:
-            embed.description = "No commands executed."
+    @stats.command(name="all")
+    @commands.is_owner()
+    async def stats_all(self, ctx: commands.Context, days: int | None):
+        await self._reply_command_usage(ctx, None, days)
 
-        await ctx.reply(embed=embed)
+    @stats.command(name="guild")
+    @commands.is_owner()
+    async def statistics_guild(self, ctx: commands.Context, days: int | None):
+        await self._reply_command_usage(ctx, ctx.guild.id, days)
 
     @commands.command(name="servers")
     @commands.is_owner()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import heapq
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -12,6 +13,7 @@ from discord.ext import commands
 from discord.app_commands import locale_str as _
 
 from cache.models import TimerModel
+from lib import queries
 
 
 from translation import translate
@@ -25,12 +27,45 @@ if TYPE_CHECKING:
 _log = logging.getLogger("Timer")
 
 
+# Timers expiring within this window are kept in memory
+TIMER_WINDOW = datetime.timedelta(hours=1)
+
+# Maximum number of expired timers that are claimed at once
+CLAIM_BATCH_SIZE = 200
+# Maximum number of timers of a guild that are handled at the same time
+GUILD_CONCURRENCY = 5
+
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 30
+
+
 class Timer(commands.Cog):
+    """Dispatches timers when they expire.
+
+    The timers of the next hour are loaded into a heap, so the dispatcher can sleep until the next
+    timer expires. New timers within the window are added to the heap directly. The database is
+    only queried again when the window is exhausted.
+
+    Expired timers are claimed from the database in batches, so multiple processes can share the
+    work, and handled concurrently with a limit per guild. Timers whose handler fails are
+    inserted again with an exponential backoff.
+    """
+
     def __init__(self, bot: Plyoox):
         self.bot = bot
-        self._current_timer: TimerModel | None = None
+        self._heap: list[tuple[datetime.datetime, int, TimerModel]] = []
+        self._scheduled: set[int] = set()
+        self._window_end: datetime.datetime | None = None
+        # Timers created while the window is loaded, they are scheduled after the window has been replaced
+        self._loading: list[TimerModel] | None = None
+        self._wakeup = asyncio.Event()
         self._task = None
 
+        self._handlers: set[asyncio.Task] = set()
+        # guild id -> (semaphore, number of handlers using it)
+        self._guild_semaphores: dict[int, tuple[asyncio.Semaphore, int]] = {}
+        self._retries: dict[int, int] = {}
+
     @commands.Cog.listener()
     async def on_ready(self):
         if self._task is None:
@@ -41,56 +76,186 @@ class Timer(commands.Cog):
             self._task.cancel()
             self._task = None
 
-        self._current_timer = None
+        # The handlers are cancelled and insert their timers again, the timers have been
+        # removed from the database when they were claimed
+        handlers = list(self._handlers)
+        for task in handlers:
+            task.cancel()
 
-    async def get_timer(self, *, days: int = 7) -> TimerModel | None:
-        record = await self.bot.db.fetchrow(
-            "SELECT * FROM timer WHERE expires < (CURRENT_DATE + $1::interval) ORDER BY expires LIMIT 1",
-            datetime.timedelta(days=days),
-        )
+        if handlers:
+            await asyncio.wait(handlers, timeout=5)
 
-        return TimerModel(**record) if record else None
+        self._heap.clear()
+        self._scheduled.clear()
+        self._window_end = None
 
-    async def call_timer(self, timer: TimerModel) -> None:
-        await self.bot.db.execute("DELETE FROM timer WHERE id = $1", timer.id)
+    def metrics(self) -> dict[str, int]:
+        return {"scheduled": len(self._heap), "running": len(self._handlers)}
+
+    async def load_timers(self) -> None:
+        """Loads the timers that expire within the next window from the database."""
+        window_end = utils.utcnow().replace(tzinfo=None) + TIMER_WINDOW
+        self._loading = loading = []
+
+        try:
+            records = await self.bot.db.fetch("SELECT * FROM timer WHERE expires < $1 ORDER BY expires", window_end)
+        finally:
+            self._loading = None
+
+        # The list is already sorted by the expiry date, so it is a valid heap
+        self._heap = [(record["expires"], record["id"], TimerModel(**record)) for record in records]
+        self._scheduled = {record["id"] for record in records}
+        self._window_end = window_end
+
+        # Timers created while the query ran might not be part of the records
+        for timer in loading:
+            if timer.expires < window_end:
+                self._schedule(timer)
+
+    def _add_timer(self, timer: TimerModel) -> None:
+        if self._loading is not None:
+            self._loading.append(timer)
+        # Timers after the window are loaded with the next window
+        elif self._window_end is not None and timer.expires < self._window_end:
+            self._schedule(timer)
+            self._wakeup.set()
+
+    def _schedule(self, timer: TimerModel) -> None:
+        if timer.id in self._scheduled:
+            return
+
+        heapq.heappush(self._heap, (timer.expires, timer.id, timer))
+        self._scheduled.add(timer.id)
+
+    async def claim_timers(self, now: datetime.datetime) -> list[TimerModel]:
+        """Removes the expired timers from the database and returns them. Timers that are
+        claimed by another process at the same time are skipped.
+        """
+        records = await queries.claim_timers(self.bot.db, now, CLAIM_BATCH_SIZE)
+
+        return [TimerModel(**record) for record in records]
+
+    async def expire_timers(self, now: datetime.datetime) -> bool:
+        """Claims the expired timers and starts their handlers. Returns `True` if there
+        might be more expired timers.
+        """
+        timers = await self.claim_timers(now)
+
+        # Timers that have not been claimed have been removed (e.g. by a manual unban)
+        # or claimed by another process
+        while self._heap and self._heap[0][0] <= now:
+            _expires, id, _timer = heapq.heappop(self._heap)
+            self._scheduled.discard(id)
+
+        for timer in timers:
+            self._scheduled.discard(timer.id)
+
+            task = self.bot.loop.create_task(self.call_timer(timer))
+            self._handlers.add(task)
+            task.add_done_callback(self._handlers.discard)
+
+        return len(timers) == CLAIM_BATCH_SIZE
 
+    async def call_timer(self, timer: TimerModel) -> None:
         func = getattr(self, f"on_{timer.kind.replace('_', '')}_expire", None)
-        if func is not None:
-            await func(timer)
+        if func is None:
+            _log.error(f"Could not dispatch timer {timer.kind} with id {timer.id}")
+            return
+
+        semaphore, users = self._guild_semaphores.get(timer.guild_id, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(GUILD_CONCURRENCY)
+
+        self._guild_semaphores[timer.guild_id] = (semaphore, users + 1)
+
+        try:
+            async with semaphore:
+                await func(timer)
+        except asyncio.CancelledError:
+            try:
+                await self._insert_timer(timer)
+            except Exception as e:
+                _log.error(f"Could not insert cancelled timer {timer.kind} with id {timer.id} again", exc_info=e)
+
+            raise
+        except Exception as e:
+            await self._retry_timer(timer, e)
         else:
-            _log.error(f"Could not dispatch timer {timer.type} with id {timer.id}")
+            self._retries.pop(timer.id, None)
+        finally:
+            semaphore, users = self._guild_semaphores[timer.guild_id]
+            if users == 1:
+                del self._guild_semaphores[timer.guild_id]
+            else:
+                self._guild_semaphores[timer.guild_id] = (semaphore, users - 1)
+
+    async def _retry_timer(self, timer: TimerModel, error: Exception) -> None:
+        retries = self._retries.pop(timer.id, 0) + 1
+        if retries > MAX_RETRIES:
+            _log.error(f"Timer {timer.kind} with id {timer.id} failed {MAX_RETRIES} times", exc_info=error)
+            return
+
+        expires = utils.utcnow().replace(tzinfo=None) + datetime.timedelta(
+            seconds=RETRY_BASE_DELAY * 2 ** (retries - 1)
+        )
+        _log.warning(f"Timer {timer.kind} with id {timer.id} failed, retrying at {expires} ({error!r})")
+
+        timer.expires = expires
+        await self._insert_timer(timer)
+
+        self._retries[timer.id] = retries
+        self._add_timer(timer)
+
+    async def _insert_timer(self, timer: TimerModel) -> None:
+        """Inserts a claimed timer again. The timer keeps its id, so the retries can be counted."""
+        await self.bot.db.execute(
+            "INSERT INTO timer (id, target_id, guild_id, kind, expires, data) VALUES ($1, $2, $3, $4, $5, $6)",
+            timer.id,
+            timer.target_id,
+            timer.guild_id,
+            timer.kind,
+            timer.expires,
+            timer.data,
+        )
 
     async def dispatch_timers(self) -> None:
         try:
+            more_expired = False
+
             while not self.bot.is_closed():
-                timer = await self.get_timer(days=1)
+                now = utils.utcnow().replace(tzinfo=None)
 
-                if timer is None:
-                    await asyncio.sleep(30)
-                    continue
+                if self._window_end is None or now >= self._window_end:
+                    await self.load_timers()
 
-                now = utils.utcnow().replace(tzinfo=None)
+                if more_expired or (self._heap and self._heap[0][0] <= now):
+                    more_expired = await self.expire_timers(now)
+                    continue
 
-                if timer.expires >= now:
-                    to_sleep = (timer.expires - now).total_seconds()
-                    await asyncio.sleep(to_sleep)
+                next_wakeup = self._heap[0][0] if self._heap else self._window_end
 
-                await self.call_timer(timer)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=(next_wakeup - now).total_seconds())
+                except asyncio.TimeoutError:
+                    pass
         except asyncio.CancelledError:
             raise
         except (OSError, discord.ConnectionClosed, asyncpg.PostgresConnectionError):
-            self._task.cancel()
+            self._window_end = None
             self._task = self.bot.loop.create_task(self.dispatch_timers())
 
     async def create_timer(
         self, target_id: int, guild_id: int, kind: TimerEnum, expires: datetime.datetime, data: dict[str, Any] = None
     ) -> None:
+        expires = expires.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
         timer_id = await self.bot.db.fetchval(
             "INSERT INTO timer (target_id, guild_id, kind, expires, data) VALUES ($1, $2, $3, $4, $5) RETURNING id",
             target_id,
             guild_id,
             kind,
-            expires.replace(tzinfo=None),
+            expires,
             data,
         )
 
@@ -103,10 +268,7 @@ class Timer(commands.Cog):
             data=data,
         )
 
-        if self._current_timer and self._current_timer.expires < timer.expires:
-            self._current_timer = None
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+        self._add_timer(timer)
 
     async def on_tempban_expire(self, timer: TimerModel):
         guild = self.bot.get_guild(timer.guild_id)
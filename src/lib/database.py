@@ -1,7 +1,62 @@
 import json
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
 
 import asyncpg
 
+from lib import queries
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+type JsonEncoder = Callable[[Any], str]
+type JsonDecoder = Callable[[str | bytes], Any]
+
+_log = logging.getLogger(__name__)
+
+
+def _orjson_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+# orjson is installed with discord.py[speed], the standard library is the fallback
+if orjson is not None:
+    json_dumps: JsonEncoder = _orjson_dumps
+    json_loads: JsonDecoder = orjson.loads
+else:
+    json_dumps: JsonEncoder = json.dumps
+    json_loads: JsonDecoder = json.loads
+
 
 async def _init_db_connection(conn: asyncpg.Connection):
-    await conn.set_type_codec("json", encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(type_name, encoder=json_dumps, decoder=json_loads, schema="pg_catalog")
+
+    await prepare_queries(conn, queries.HOT_QUERIES.values())
+
+
+async def prepare_queries(conn: asyncpg.Connection, statements: Iterable[str]) -> None:
+    """Prepares the queries into the statement cache of the connection.
+
+    Queries that use the cache of the connection (`fetch`, `execute`, ...) with the same text
+    then skip the parse and type introspection on their first call. This only lasts as long as the
+    statements stay cached: the pool has to be created with `max_cached_statement_lifetime=0`,
+    otherwise they expire after 5 minutes, and they are evicted if more than `statement_cache_size`
+    other queries are used on the connection. asyncpg prepares the statement again when the schema
+    changed. The codecs must be registered before, the prepared statements use the codecs of the
+    time they are prepared.
+
+    asyncpg has no public API to fill the statement cache, this uses the private `_prepare` of
+    asyncpg 0.29 (pinned in requirements.txt). If it is not available, the queries are not prepared.
+    """
+    for query in statements:
+        try:
+            await conn._prepare(query, use_cache=True)
+        except asyncpg.PostgresError as e:
+            _log.warning(f"Could not prepare query ({e}): {query}")
+        except (AttributeError, TypeError) as e:
+            _log.warning(f"Cannot prepare queries with asyncpg {asyncpg.__version__}: {e!r}")
+            return
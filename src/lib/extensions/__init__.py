@@ -1,10 +1,13 @@
 from .embed import Embed
+from .embed_template import EmbedTemplate, EmbedSkeleton
 from .command_tree import CommandTree
 from .view import PrivateView, EphemeralView, PaginatedEphemeralView
 
 
 __all__ = (
     "Embed",
+    "EmbedTemplate",
+    "EmbedSkeleton",
     "CommandTree",
     "PrivateView",
     "EphemeralView",
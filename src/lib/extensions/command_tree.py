@@ -19,6 +19,13 @@ class CommandTree(app_commands.CommandTree):
     def __init__(self, bot: Plyoox):
         super().__init__(bot)
 
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # The commands of lazy extensions are only added to the tree once the extension is loaded
+        if interaction.type in (discord.InteractionType.application_command, discord.InteractionType.autocomplete):
+            await self.client.load_lazy_plugin(interaction.data["name"])
+
+        return True
+
     async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
         if isinstance(error, app_commands.CommandNotFound):
             await interaction.response.send_translated(
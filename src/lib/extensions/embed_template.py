@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import discord
+from discord.app_commands import locale_str
+
+from translation import translate as global_translate
+from .embed import Embed
+
+if TYPE_CHECKING:
+    from main import Plyoox
+
+
+type FieldDefinition = locale_str | tuple[locale_str, bool]
+
+
+class EmbedSkeleton:
+    """The translated static parts of an `EmbedTemplate` for one locale."""
+
+    __slots__ = ("version", "color", "author", "description", "fields", "footer", "strings")
+
+    def __init__(
+        self,
+        *,
+        version: int,
+        color: discord.Color | int,
+        author: str | None,
+        description: str | None,
+        fields: tuple[tuple[str, bool], ...],
+        footer: str | None,
+        strings: Mapping[str, str],
+    ):
+        self.version = version
+        self.color = color
+        self.author = author
+        self.description = description
+        self.fields = fields
+        self.footer = footer
+        self.strings = strings
+
+    def render(
+        self,
+        *,
+        description: Mapping[str, Any] | str | None = None,
+        author: str | None = None,
+        icon_url: Any = None,
+        values: Sequence[str | None] = (),
+        footer: Any = None,
+        color: discord.Color | int | None = None,
+    ) -> Embed:
+        """Creates the embed. `values` are the values of the fields in the order of the template,
+        fields without a value are skipped.
+
+        If `description` is a mapping, it is used to format the description of the template.
+        """
+        if isinstance(description, Mapping):
+            description = self.description.format(**description)
+
+        embed = Embed(color=color or self.color, description=description)
+
+        if (author := author or self.author) is not None:
+            embed.set_author(name=author, icon_url=icon_url)
+
+        for (name, inline), value in zip(self.fields, values):
+            if value is not None:
+                embed.add_field(name=name, value=value, inline=inline)
+
+        if self.footer is not None and footer is not None:
+            embed.set_footer(text=f"{self.footer}: {footer}")
+
+        return embed
+
+
+class EmbedTemplate:
+    """An embed with static strings that are translated once per locale.
+
+    The translated skeleton of each locale is cached until the translations are reloaded,
+    so only the dynamic values have to be set for each embed.
+    """
+
+    __slots__ = ("color", "author", "description", "fields", "footer", "strings", "_skeletons")
+
+    def __init__(
+        self,
+        *,
+        color: discord.Color | int,
+        author: locale_str | None = None,
+        description: locale_str | None = None,
+        fields: Iterable[FieldDefinition] = (),
+        footer: locale_str | None = None,
+        strings: Mapping[str, locale_str] | None = None,
+    ):
+        self.color = color
+        self.author = author
+        self.description = description
+        self.fields = tuple(field if isinstance(field, tuple) else (field, False) for field in fields)
+        self.footer = footer
+        self.strings = strings or {}
+
+        self._skeletons: dict[discord.Locale, EmbedSkeleton] = {}
+
+    def get(self, bot: Plyoox, locale: discord.Locale) -> EmbedSkeleton:
+        """Returns the skeleton of the locale."""
+        version = getattr(bot.tree.translator, "version", 0)
+
+        skeleton = self._skeletons.get(locale)
+        if skeleton is not None and skeleton.version == version:
+            return skeleton
+
+        def translate(string: locale_str | None) -> str | None:
+            return global_translate(string, bot, locale) if string is not None else None
+
+        self._skeletons[locale] = skeleton = EmbedSkeleton(
+            version=version,
+            color=self.color,
+            author=translate(self.author),
+            description=translate(self.description),
+            fields=tuple((translate(name), inline) for name, inline in self.fields),
+            footer=translate(self.footer),
+            strings=MappingProxyType({key: translate(string) for key, string in self.strings.items()}),
+        )
+
+        return skeleton
+
+    def render(self, bot: Plyoox, locale: discord.Locale, **kwargs: Any) -> Embed:
+        """Shorthand for `get(bot, locale).render(...)`."""
+        return self.get(bot, locale).render(**kwargs)
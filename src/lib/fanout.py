@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+
+_log = logging.getLogger(__name__)
+
+type Delivery[T] = tuple[int, Callable[[], Awaitable[T]]]
+# Called with the index of the delivery, the error if it failed and the latency
+type ResultCallback = Callable[[int, Exception | None, float], None]
+
+
+class FanOut:
+    """Delivers a message to many channels concurrently.
+
+    At most `concurrency` deliveries run at the same time. Deliveries to the same channel
+    are run one after another, so a single channel does not run into its rate limit while
+    the other channels are waiting. The latency of each delivery is measured from the start
+    of the fan-out.
+    """
+
+    def __init__(self, *, concurrency: int = 25, latency_samples: int = 1000):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # channel id -> (lock, number of deliveries using it)
+        self._channel_locks: dict[int, tuple[asyncio.Lock, int]] = {}
+        self._latencies: deque[float] = deque(maxlen=latency_samples)
+
+        self.delivered = 0
+        self.failed = 0
+
+    async def run[T](
+        self, name: str, deliveries: Iterable[Delivery[T]], *, on_result: ResultCallback | None = None
+    ) -> list[T | None]:
+        """Runs the deliveries and returns their results in the same order.
+        Failed deliveries are logged and return `None`.
+        """
+        start = time.perf_counter()
+        latencies: list[float] = []
+
+        async def deliver(index: int, channel_id: int, send: Callable[[], Awaitable[T]]) -> T | None:
+            lock, users = self._channel_locks.get(channel_id, (None, 0))
+            if lock is None:
+                lock = asyncio.Lock()
+
+            self._channel_locks[channel_id] = (lock, users + 1)
+
+            try:
+                async with lock, self._semaphore:
+                    result = await send()
+            except Exception as e:
+                self.failed += 1
+                _log.warning(f"Could not deliver {name} to {channel_id}: {e!r}")
+
+                if on_result is not None:
+                    on_result(index, e, time.perf_counter() - start)
+
+                return None
+            finally:
+                lock, users = self._channel_locks[channel_id]
+                if users == 1:
+                    del self._channel_locks[channel_id]
+                else:
+                    self._channel_locks[channel_id] = (lock, users - 1)
+
+            latency = time.perf_counter() - start
+            latencies.append(latency)
+            self.delivered += 1
+
+            if on_result is not None:
+                on_result(index, None, latency)
+
+            return result
+
+        results = await asyncio.gather(
+            *(deliver(index, channel_id, send) for index, (channel_id, send) in enumerate(deliveries))
+        )
+
+        if latencies:
+            self._latencies.extend(latencies)
+            _log.info(
+                f"Delivered {name} to {len(latencies)}/{len(results)} channels "
+                f"(p50 {statistics.median(latencies):.2f}s, max {max(latencies):.2f}s)"
+            )
+
+        return results
+
+    def metrics(self) -> dict[str, float]:
+        latencies = sorted(self._latencies)
+
+        return {
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "latency_p99": latencies[int(len(latencies) * 0.99)] if latencies else 0.0,
+        }
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 import datetime
+import io
 
 import discord
 
@@ -100,3 +101,34 @@ def format_timedelta(delta: datetime.timedelta) -> str:
 
 def italic(string: str) -> str:
     return f"*{string}*"
+
+
+class MessageLog:
+    """Writes messages into an in-memory text file, so the messages themselves do not have to be kept."""
+
+    __slots__ = ("_buffer", "count", "authors")
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+        self.count = 0
+        self.authors: set[int] = set()
+
+    def add(self, message: discord.Message) -> None:
+        created_at = message.created_at.strftime("%Y-%m-%d %H:%M:%S")
+        line = f"[{created_at}] {message.author} ({message.author.id}) [{message.id}]:\t{message.content}"
+
+        if message.attachments:
+            line += " [" + ", ".join(attachment.filename for attachment in message.attachments) + "]"
+
+        line += "\n"
+
+        self._buffer.write(line.encode("utf-8"))
+        self.count += 1
+        self.authors.add(message.author.id)
+
+    def add_many(self, messages: list[discord.Message]) -> None:
+        for message in messages:
+            self.add(message)
+
+    def to_file(self, filename: str) -> discord.File:
+        return discord.File(io.BytesIO(self._buffer.getvalue()), filename=filename)
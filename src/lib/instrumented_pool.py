@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import functools
+import logging
+import re
+import time
+from collections import deque
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncpg
+
+_log = logging.getLogger(__name__)
+
+_WHITESPACE_REGEX = re.compile(r"\s+")
+# String and number literals, but not the $1 parameters
+_LITERAL_REGEX = re.compile(r"'(?:[^']|'')*'|(?<![\w$])\d+(?:\.\d+)?\b")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_query(query: str) -> str:
+    """Collapses the whitespace and replaces the literals, so queries that only differ
+    in inlined values are counted together.
+    """
+    query = _WHITESPACE_REGEX.sub(" ", query).strip()
+    return _LITERAL_REGEX.sub("?", query)
+
+
+def _percentile(samples: Iterable[float], percentile: float) -> float:
+    samples = sorted(samples)
+    if not samples:
+        return 0.0
+
+    return samples[min(int(len(samples) * percentile), len(samples) - 1)]
+
+
+class StatementStats:
+    __slots__ = ("query", "calls", "errors", "total", "rows", "samples")
+
+    def __init__(self, query: str, samples: int):
+        self.query = query
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.rows = 0
+        self.samples: deque[float] = deque(maxlen=samples)
+
+    @property
+    def p99(self) -> float:
+        return _percentile(self.samples, 0.99)
+
+
+class _AcquireContext:
+    __slots__ = ("_pool", "_context")
+
+    def __init__(self, pool: InstrumentedPool, context: Any):
+        self._pool = pool
+        self._context = context
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        start = time.perf_counter()
+        conn = await self._context.__aenter__()
+        self._pool._record_acquire(time.perf_counter() - start)
+
+        return conn
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._context.__aexit__(*exc_info)
+
+
+class InstrumentedPool:
+    """Wraps the connection pool and records the latency of the queries.
+
+    The statistics are kept per normalized query. Queries that take longer than
+    `slow_query_threshold` seconds are logged. The time to acquire a connection is recorded
+    for every acquire, queries run on an acquired connection are not recorded per query.
+    Everything else is passed to the pool.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, *, slow_query_threshold: float = 0.5, samples: int = 500):
+        self._pool = pool
+        self._slow_query_threshold = slow_query_threshold
+        self._samples = samples
+
+        self._statements: dict[str, StatementStats] = {}
+        self._acquire_samples: deque[float] = deque(maxlen=samples)
+        self.acquires = 0
+        self.acquire_total = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    def acquire(self, *, timeout: float | None = None) -> _AcquireContext:
+        return _AcquireContext(self, self._pool.acquire(timeout=timeout))
+
+    async def execute(self, query: str, *args, timeout: float | None = None) -> str:
+        async with self.acquire() as conn:
+            start = time.perf_counter()
+            try:
+                status = await conn.execute(query, *args, timeout=timeout)
+            except Exception:
+                self._record(query, time.perf_counter() - start, 0, failed=True)
+                raise
+
+            # The status contains the number of affected rows, e.g. "DELETE 3"
+            rows = status.rpartition(" ")[2]
+            self._record(query, time.perf_counter() - start, int(rows) if rows.isdigit() else 0)
+
+        return status
+
+    async def executemany(self, command: str, args, *, timeout: float | None = None) -> None:
+        async with self.acquire() as conn:
+            start = time.perf_counter()
+            try:
+                await conn.executemany(command, args, timeout=timeout)
+            except Exception:
+                self._record(command, time.perf_counter() - start, 0, failed=True)
+                raise
+
+            self._record(command, time.perf_counter() - start, 0)
+
+    async def fetch(self, query: str, *args, timeout: float | None = None, record_class=None) -> list:
+        async with self.acquire() as conn:
+            start = time.perf_counter()
+            try:
+                records = await conn.fetch(query, *args, timeout=timeout, record_class=record_class)
+            except Exception:
+                self._record(query, time.perf_counter() - start, 0, failed=True)
+                raise
+
+            self._record(query, time.perf_counter() - start, len(records))
+
+        return records
+
+    async def fetchrow(self, query: str, *args, timeout: float | None = None, record_class=None):
+        async with self.acquire() as conn:
+            start = time.perf_counter()
+            try:
+                record = await conn.fetchrow(query, *args, timeout=timeout, record_class=record_class)
+            except Exception:
+                self._record(query, time.perf_counter() - start, 0, failed=True)
+                raise
+
+            self._record(query, time.perf_counter() - start, int(record is not None))
+
+        return record
+
+    async def fetchval(self, query: str, *args, column: int = 0, timeout: float | None = None):
+        async with self.acquire() as conn:
+            start = time.perf_counter()
+            try:
+                value = await conn.fetchval(query, *args, column=column, timeout=timeout)
+            except Exception:
+                self._record(query, time.perf_counter() - start, 0, failed=True)
+                raise
+
+            self._record(query, time.perf_counter() - start, int(value is not None))
+
+        return value
+
+    def statements(self) -> list[StatementStats]:
+        """Returns the statistics of the queries, the queries with the highest total time first."""
+        return sorted(self._statements.values(), key=lambda statement: statement.total, reverse=True)
+
+    def metrics(self) -> dict[str, float]:
+        return {
+            "statements": len(self._statements),
+            "calls": sum(statement.calls for statement in self._statements.values()),
+            "errors": sum(statement.errors for statement in self._statements.values()),
+            "acquires": self.acquires,
+            "acquire_avg": self.acquire_total / self.acquires if self.acquires else 0.0,
+            "acquire_p99": _percentile(self._acquire_samples, 0.99),
+        }
+
+    def reset(self) -> None:
+        self._statements.clear()
+        self._acquire_samples.clear()
+        self.acquires = 0
+        self.acquire_total = 0.0
+
+    def _record_acquire(self, elapsed: float) -> None:
+        self.acquires += 1
+        self.acquire_total += elapsed
+        self._acquire_samples.append(elapsed)
+
+    def _record(self, query: str, elapsed: float, rows: int, *, failed: bool = False) -> None:
+        normalized = normalize_query(query)
+
+        statement = self._statements.get(normalized)
+        if statement is None:
+            self._statements[normalized] = statement = StatementStats(normalized, self._samples)
+
+        statement.calls += 1
+        statement.total += elapsed
+        statement.rows += rows
+        statement.samples.append(elapsed)
+
+        if failed:
+            statement.errors += 1
+
+        if elapsed >= self._slow_query_threshold:
+            _log.warning(f"Slow query ({elapsed:.2f}s, {rows} rows): {normalized}")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import bisect
+import time
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import discord
+from discord.ext import commands
+
+type Listener = Callable[..., Coroutine[Any, Any, Any]]
+
+# Upper bounds of the histogram buckets in seconds, the last bucket has no upper bound
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class ListenerStats:
+    __slots__ = ("cog", "event", "calls", "errors", "total", "max", "histogram", "shards")
+
+    def __init__(self, cog: str, event: str):
+        self.cog = cog
+        self.event = event
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        # shard id -> total time, events without a guild are counted as shard -1
+        self.shards: defaultdict[int, float] = defaultdict(float)
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the upper bound of the bucket that contains the percentile."""
+        target = self.calls * percentile
+        count = 0
+
+        for index, bucket in enumerate(self.histogram):
+            count += bucket
+            if count >= target:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max
+
+        return self.max
+
+
+class ListenerProfiler:
+    """Measures the time each event listener takes, per cog and event.
+
+    The profiler is disabled by default, while it is disabled the listeners are not wrapped.
+    The time includes everything the listener awaits, e.g. database queries and requests.
+    """
+
+    def __init__(self, *, enabled: bool = False):
+        self.enabled = enabled
+        self._stats: dict[tuple[str, str], ListenerStats] = {}
+
+    def wrap(self, listener: Listener, event_name: str) -> Listener:
+        owner = getattr(listener, "__self__", None)
+        if isinstance(owner, commands.Cog):
+            cog = owner.qualified_name
+        elif owner is not None:
+            cog = type(owner).__name__
+        else:
+            cog = getattr(listener, "__qualname__", "unknown")
+
+        key = (cog, event_name)
+        stats = self._stats.get(key)
+        if stats is None:
+            self._stats[key] = stats = ListenerStats(cog, event_name)
+
+        async def profiled(*args: Any, **kwargs: Any) -> None:
+            start = time.perf_counter()
+
+            try:
+                await listener(*args, **kwargs)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+
+                stats.calls += 1
+                stats.total += elapsed
+                stats.max = max(stats.max, elapsed)
+                stats.histogram[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+                stats.shards[_shard_id(args)] += elapsed
+
+        return profiled
+
+    def stats(self) -> list[ListenerStats]:
+        """Returns the statistics of the listeners, the listeners with the highest total time first."""
+        return sorted(self._stats.values(), key=lambda stats: stats.total, reverse=True)
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+def _shard_id(args: tuple[Any, ...]) -> int:
+    if not args:
+        return -1
+
+    guild = args[0] if isinstance(args[0], discord.Guild) else getattr(args[0], "guild", None)
+    if isinstance(guild, discord.Guild):
+        return guild.shard_id
+
+    return -1
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+_log = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets in seconds, the last bucket has no upper bound
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Number of stack frames that are kept of a blocking callback
+STACK_LIMIT = 15
+
+
+class SlowCallback:
+    __slots__ = ("timestamp", "lag", "task", "stack")
+
+    def __init__(self, timestamp: float, task: str, stack: list[str]):
+        self.timestamp = timestamp
+        self.lag = 0.0
+        self.task = task
+        self.stack = stack
+
+
+class LoopMonitor:
+    """Measures how late the event loop runs its callbacks.
+
+    A task sleeps for `interval` seconds and records how much later than expected it woke up.
+    A watchdog thread checks that the task woke up in time. If the loop is blocked for more than
+    `threshold` seconds, the thread captures the stack of the loop thread and the running task,
+    which is logged once the loop continues. Lags above `alert` seconds are logged as warnings.
+    """
+
+    def __init__(self, *, interval: float = 0.5, threshold: float = 0.25, alert: float = 1.0, samples: int = 1200):
+        self._interval = interval
+        self._threshold = threshold
+        self._alert = alert
+
+        self._samples: deque[float] = deque(maxlen=samples)
+        self.histogram = [0] * (len(LAG_BUCKETS) + 1)
+        self.max_lag = 0.0
+        self.slow_callbacks: deque[SlowCallback] = deque(maxlen=20)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id = 0
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+        # Monotonic time the measuring task should wake up and the report of the current block
+        self._deadline = 0.0
+        self._pending: SlowCallback | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._deadline = time.monotonic() + self._interval
+
+        self._task = self._loop.create_task(self._measure(), name="loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def close(self) -> None:
+        self._stopped.set()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def metrics(self) -> dict[str, float]:
+        samples = sorted(self._samples)
+
+        return {
+            "lag": self._samples[-1] if samples else 0.0,
+            "lag_p50": samples[len(samples) // 2] if samples else 0.0,
+            "lag_p99": samples[int(len(samples) * 0.99)] if samples else 0.0,
+            "lag_max": self.max_lag,
+            "slow_callbacks": len(self.slow_callbacks),
+        }
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            self._deadline = time.monotonic() + self._interval
+            start = loop.time()
+            await asyncio.sleep(self._interval)
+
+            self._record(max(loop.time() - start - self._interval, 0.0))
+
+    def _record(self, lag: float) -> None:
+        self._samples.append(lag)
+        self.histogram[bisect.bisect_left(LAG_BUCKETS, lag)] += 1
+        self.max_lag = max(self.max_lag, lag)
+
+        report, self._pending = self._pending, None
+        if report is not None and lag >= self._threshold:
+            report.lag = lag
+            self.slow_callbacks.append(report)
+
+            stack = "".join(report.stack)
+            if lag >= self._alert:
+                _log.warning(f"Event loop was blocked for {lag:.2f}s by {report.task}\n{stack}")
+            else:
+                _log.info(f"Event loop was blocked for {lag:.2f}s by {report.task}\n{stack}")
+        elif lag >= self._alert:
+            _log.warning(f"Event loop lag of {lag:.2f}s")
+
+    def _watch(self) -> None:
+        """Runs in the watchdog thread."""
+        while not self._stopped.wait(self._threshold / 2):
+            if self._pending is not None or time.monotonic() - self._deadline < self._threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            stack = traceback.format_list(traceback.extract_stack(frame)[-STACK_LIMIT:])
+            self._pending = SlowCallback(time.time(), self._describe_task(frame), stack)
+
+    def _describe_task(self, frame) -> str:
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+
+        if task is None:
+            return f"callback {frame.f_code.co_qualname}"
+
+        return f"task {task.get_name()} ({task.get_coro().__qualname__})"
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Sequence
+
+import discord
+from lru import LRU
+
+_log = logging.getLogger(__name__)
+
+# The gateway accepts at most 100 user ids per member request
+_QUERY_BATCH_SIZE = 100
+
+
+class MemberResolver:
+    """Resolves members of guilds that are not chunked.
+
+    Only the requested members are queried from the gateway, with a fallback to the REST API
+    if the gateway request fails. Resolved members are kept in a TTL cache instead of the
+    member cache of the guild. Members that are not in the guild are cached for a shorter time.
+
+    Requests for the same member are coalesced, so concurrent lookups only query the member once.
+    """
+
+    __slots__ = ("_cache", "_pending", "_ttl", "_negative_ttl")
+
+    def __init__(self, *, cache_size: int = 10_000, ttl: float = 300, negative_ttl: float = 60):
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+
+        # (guild_id, user_id) -> (expires_at, member)
+        self._cache: LRU = LRU(cache_size)
+        self._pending: dict[tuple[int, int], asyncio.Future[discord.Member | None]] = {}
+
+    def _get_cached(self, guild: discord.Guild, user_id: int) -> discord.Member | None | bool:
+        """Returns the cached member, `None` if the member is known to not be in the guild
+        or `False` if the member is not cached.
+        """
+        if (member := guild.get_member(user_id)) is not None:
+            return member
+
+        entry = self._cache.get((guild.id, user_id))
+        if entry is None:
+            return False
+
+        expires_at, member = entry
+        if expires_at < time.monotonic():
+            del self._cache[guild.id, user_id]
+            return False
+
+        return member
+
+    def _store(self, guild_id: int, user_id: int, member: discord.Member | None) -> None:
+        ttl = self._ttl if member is not None else self._negative_ttl
+        self._cache[guild_id, user_id] = (time.monotonic() + ttl, member)
+
+    def invalidate(self, guild_id: int, user_id: int) -> None:
+        """Removes a member from the cache, e.g. after they left the guild."""
+        if (guild_id, user_id) in self._cache:
+            del self._cache[guild_id, user_id]
+
+    async def get_member(self, guild: discord.Guild, user_id: int) -> discord.Member | None:
+        """Returns the member of the guild or `None` if the user is not a member of the guild."""
+        members = await self.get_members(guild, [user_id])
+        return members.get(user_id)
+
+    async def get_members(self, guild: discord.Guild, user_ids: Iterable[int]) -> dict[int, discord.Member]:
+        """Resolves multiple members of the guild. Users that are not members of the guild
+        are not included in the result.
+        """
+        members: dict[int, discord.Member] = {}
+        waiting: dict[int, asyncio.Future[discord.Member | None]] = {}
+        to_query: list[int] = []
+
+        for user_id in dict.fromkeys(user_ids):
+            cached = self._get_cached(guild, user_id)
+
+            if cached is not False:
+                if cached is not None:
+                    members[user_id] = cached
+            elif (future := self._pending.get((guild.id, user_id))) is not None:
+                waiting[user_id] = future
+            else:
+                to_query.append(user_id)
+
+        if to_query:
+            loop = asyncio.get_running_loop()
+            futures = {user_id: loop.create_future() for user_id in to_query}
+
+            for user_id, future in futures.items():
+                self._pending[guild.id, user_id] = future
+
+            try:
+                for index in range(0, len(to_query), _QUERY_BATCH_SIZE):
+                    batch = to_query[index : index + _QUERY_BATCH_SIZE]
+                    queried = await self._query(guild, batch)
+
+                    for user_id in batch:
+                        member = queried.get(user_id)
+                        self._store(guild.id, user_id, member)
+                        futures[user_id].set_result(member)
+            except Exception as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+                        # The exception is raised here, the future might not have any other waiters
+                        future.exception()
+                raise
+            finally:
+                for user_id in to_query:
+                    self._pending.pop((guild.id, user_id), None)
+
+                # The query has been cancelled, the other waiters query the members again
+                for future in futures.values():
+                    if not future.done():
+                        future.cancel()
+
+            waiting.update(futures)
+
+        for user_id, future in waiting.items():
+            try:
+                member = await future
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+                member = await self.get_member(guild, user_id)
+
+            if member is not None:
+                members[user_id] = member
+
+        return members
+
+    async def _query(self, guild: discord.Guild, user_ids: list[int]) -> dict[int, discord.Member]:
+        try:
+            members = await guild.query_members(user_ids=user_ids, limit=len(user_ids), cache=False)
+            return {member.id: member for member in members}
+        except (asyncio.TimeoutError, RuntimeError) as e:
+            _log.warning(f"Could not query {len(user_ids)} members of {guild.id} ({e!r}), falling back to REST")
+
+        members = {}
+        for user_id in user_ids:
+            try:
+                members[user_id] = await guild.fetch_member(user_id)
+            except discord.NotFound:
+                continue
+
+        return members
+
+    @staticmethod
+    async def chunk(guild: discord.Guild) -> Sequence[discord.Member]:
+        """Requests the full member list of the guild. This should only be used by features
+        that require all members, because the members are cached permanently.
+        """
+        if not guild.chunked:
+            _log.info(f"Chunking guild {guild.id} ({guild.member_count} members)")
+            await guild.chunk(cache=True)
+
+        return guild.members
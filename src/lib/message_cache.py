@@ -3,23 +3,41 @@ from typing import Iterable
 
 
 class MessageCache[T]:
+    """Caches the latest messages.
+
+    For every channel, the cache tracks the oldest message id from which on all messages of
+    the channel are cached (the watermark). This allows reading the recent history of a channel
+    from the cache. The watermark is moved when messages are evicted and must be invalidated
+    if messages of the channel are not added to the cache.
+    """
+
     def __init__(self, max_length: int | None):
         self._max_length = max_length
 
         self._items: deque[T] = deque(maxlen=max_length)
         self._lookup: dict[int, T] = dict()
+        self._watermarks: dict[int, int] = dict()
 
     def __len__(self) -> int:
         return len(self._items)
 
     def add_item(self, item: T):
-        if len(self._items) == self._max_length and self._items[0].id in self._lookup:
+        if len(self._items) == self._max_length:
+            evicted = self._items[0]
+
             # If the cache is full, and we need to remove an item from
             # the left of the deque, then remove its reference from the dict as well.
-            del self._lookup[self._items[0].id]
+            if evicted.id in self._lookup:
+                del self._lookup[evicted.id]
+
+            # The cache is only complete for messages newer than the evicted message
+            channel_id = evicted.channel.id
+            if channel_id in self._watermarks:
+                self._watermarks[channel_id] = max(self._watermarks[channel_id], evicted.id + 1)
 
         self._items.append(item)
         self._lookup[item.id] = item
+        self._watermarks.setdefault(item.channel.id, item.id)
 
     def get_item(self, id: int) -> T | None:
         return self._lookup.get(id)
@@ -37,5 +55,27 @@ class MessageCache[T]:
         for id in ids:
             self.remove_item(id)
 
+    def invalidate_channel(self, channel_id: int) -> None:
+        """Marks the cached history of the channel as incomplete, e.g. because a message was not cached."""
+        self._watermarks.pop(channel_id, None)
+
+    def invalidate_history(self) -> None:
+        """Marks the cached history of all channels as incomplete, e.g. after events could have been missed."""
+        self._watermarks.clear()
+
+    def channel_history(self, channel_id: int) -> tuple[int, list[T]] | None:
+        """Returns the watermark of the channel and the cached messages newer than it, newest first.
+
+        Returns `None` if the cache has no complete history of the channel.
+        """
+        watermark = self._watermarks.get(channel_id)
+        if watermark is None:
+            return None
+
+        messages = [item for item in self._items if item.channel.id == channel_id and item.id >= watermark]
+        messages.sort(key=lambda item: item.id, reverse=True)
+
+        return watermark, messages
+
     def is_sync(self):
         return len(self._items) == len(self._lookup)
@@ -0,0 +1,126 @@
+"""The queries that run for most messages, commands and config loads.
+
+The queries in `HOT_QUERIES` are prepared on every connection of the pool when it is created
+(see `lib.database.prepare_queries`), so the first call on a new connection is not slower.
+The statements are looked up by the query text, the helpers pass the exact text to the pool.
+Other code should use the helpers instead of writing the queries inline.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncpg
+
+    from lib.instrumented_pool import InstrumentedPool
+
+    type Pool = asyncpg.Pool | InstrumentedPool
+
+
+LEVEL_USER_SELECT = "SELECT user_id, guild_id, xp FROM level_user WHERE guild_id = $1 AND user_id = $2"
+LEVEL_USER_INSERT = "INSERT INTO level_user (guild_id, user_id, xp, message_count) VALUES ($1, $2, $3, 1)"
+LEVEL_USER_ADD_XP = (
+    "UPDATE level_user SET xp = xp + $1, message_count = message_count + 1 WHERE user_id = $2 AND guild_id = $3"
+)
+
+AUTOMODERATION_USER_INSERT = (
+    "INSERT INTO automoderation_user (guild_id, user_id, expires_at, points, reason) VALUES ($1, $2, $3, $4, $5)"
+)
+AUTOMODERATION_USER_POINTS = (
+    "SELECT SUM(points) FROM automoderation_user WHERE user_id = $1 AND guild_id = $2 "
+    "AND (expires_at IS NULL OR (now() AT TIME ZONE 'utc') < expires_at)"
+)
+
+TIMER_CLAIM = (
+    "DELETE FROM timer WHERE id IN "
+    "(SELECT id FROM timer WHERE expires <= $1 ORDER BY expires LIMIT $2 FOR UPDATE SKIP LOCKED) "
+    "RETURNING *"
+)
+
+WELCOME_CONFIG = "SELECT * FROM welcome_config WHERE id = $1"
+LEVEL_CONFIG = "SELECT * FROM level_config WHERE id = $1"
+MODERATION_CONFIG = (
+    "SELECT m.*, w.id as mwh_id, w.token as mwh_token, w.webhook_channel as mwh_webhook_channel, "
+    "w.guild_id as mwh_guild_id FROM moderation_config m LEFT JOIN public.maybe_webhook w "
+    "ON w.id = m.logging_channel WHERE m.id = $1"
+)
+LOGGING_CONFIG = "SELECT * FROM logging_config WHERE id = $1"
+LOGGING_SETTINGS = (
+    "SELECT l.*, w.id as mwh_id, w.token as mwh_token, w.webhook_channel as mwh_webhook_channel, "
+    " w.guild_id as mwh_guild_id FROM logging_settings l LEFT JOIN maybe_webhook w ON w.id = l.channel "
+    "WHERE l.guild_id = $1 AND active = true"
+)
+MODERATION_PUNISHMENTS = "SELECT id, actions, enabled, name, reason FROM moderation_punishment WHERE guild_id = $1"
+AUTOMODERATION_RULE = "SELECT actions, guild_id, reason FROM automoderation_rule WHERE rule_id = $1"
+
+HOT_QUERIES: dict[str, str] = {
+    "level_user_select": LEVEL_USER_SELECT,
+    "level_user_insert": LEVEL_USER_INSERT,
+    "level_user_add_xp": LEVEL_USER_ADD_XP,
+    "automoderation_user_insert": AUTOMODERATION_USER_INSERT,
+    "automoderation_user_points": AUTOMODERATION_USER_POINTS,
+    "timer_claim": TIMER_CLAIM,
+    "welcome_config": WELCOME_CONFIG,
+    "level_config": LEVEL_CONFIG,
+    "moderation_config": MODERATION_CONFIG,
+    "logging_config": LOGGING_CONFIG,
+    "logging_settings": LOGGING_SETTINGS,
+    "moderation_punishments": MODERATION_PUNISHMENTS,
+    "automoderation_rule": AUTOMODERATION_RULE,
+}
+
+
+async def fetch_level_user(pool: Pool, guild_id: int, user_id: int) -> asyncpg.Record | None:
+    return await pool.fetchrow(LEVEL_USER_SELECT, guild_id, user_id)
+
+
+async def insert_level_user(pool: Pool, guild_id: int, user_id: int, xp: int) -> None:
+    await pool.execute(LEVEL_USER_INSERT, guild_id, user_id, xp)
+
+
+async def add_level_user_xp(pool: Pool, guild_id: int, user_id: int, xp: int) -> None:
+    await pool.execute(LEVEL_USER_ADD_XP, xp, user_id, guild_id)
+
+
+async def insert_automoderation_points(
+    pool: Pool, guild_id: int, user_id: int, points: int, expires_at: datetime.datetime | None, reason: str | None
+) -> None:
+    await pool.execute(AUTOMODERATION_USER_INSERT, guild_id, user_id, expires_at, points, reason)
+
+
+async def fetch_automoderation_points(pool: Pool, guild_id: int, user_id: int) -> int | None:
+    return await pool.fetchval(AUTOMODERATION_USER_POINTS, user_id, guild_id)
+
+
+async def claim_timers(pool: Pool, now: datetime.datetime, limit: int) -> list[asyncpg.Record]:
+    return await pool.fetch(TIMER_CLAIM, now, limit)
+
+
+async def fetch_welcome_config(pool: Pool, guild_id: int) -> asyncpg.Record | None:
+    return await pool.fetchrow(WELCOME_CONFIG, guild_id)
+
+
+async def fetch_level_config(pool: Pool, guild_id: int) -> asyncpg.Record | None:
+    return await pool.fetchrow(LEVEL_CONFIG, guild_id)
+
+
+async def fetch_moderation_config(pool: Pool, guild_id: int) -> asyncpg.Record | None:
+    return await pool.fetchrow(MODERATION_CONFIG, guild_id)
+
+
+async def fetch_logging_config(pool: Pool, guild_id: int) -> asyncpg.Record | None:
+    return await pool.fetchrow(LOGGING_CONFIG, guild_id)
+
+
+async def fetch_logging_settings(pool: Pool, guild_id: int) -> list[asyncpg.Record]:
+    return await pool.fetch(LOGGING_SETTINGS, guild_id)
+
+
+async def fetch_moderation_punishments(pool: Pool, guild_id: int) -> list[asyncpg.Record]:
+    return await pool.fetch(MODERATION_PUNISHMENTS, guild_id)
+
+
+async def fetch_automoderation_rule(pool: Pool, rule_id: int) -> asyncpg.Record | None:
+    return await pool.fetchrow(AUTOMODERATION_RULE, rule_id)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import time
+from collections import Counter, deque
+from typing import TYPE_CHECKING
+
+import asyncpg
+
+if TYPE_CHECKING:
+    from asyncpg import Pool
+
+_log = logging.getLogger(__name__)
+
+# command, guild_id, user_id, executed_at
+type CommandRecord = tuple[str, int | None, int, datetime.datetime]
+
+COLUMNS = ("command", "guild_id", "user_id", "executed_at")
+
+UPSERT_ROLLUP = """
+INSERT INTO command_statistics_hourly (hour, guild_id, command, usage) VALUES ($1, $2, $3, $4)
+ON CONFLICT (hour, guild_id, command) DO UPDATE SET usage = command_statistics_hourly.usage + excluded.usage
+"""
+
+
+class CommandStatisticsWriter:
+    """Writes the command statistics to the database in batches.
+
+    The records are buffered and copied into the table once `flush_size` records are buffered
+    or `flush_interval` seconds passed. In the same transaction, the usage per hour, guild and
+    command is added to the `command_statistics_hourly` rollup table, unless `rollups` is disabled
+    (the table is created by `migrations/command_statistics_hourly.sql`). Only one copy runs at a
+    time, so while the database is slow the records collect in the buffer. If the buffer is full,
+    new records are dropped and counted instead of growing the memory of the bot.
+    """
+
+    def __init__(self, pool: Pool, *, max_records: int = 20000, flush_size: int = 1000, flush_interval: float = 60):
+        self._pool = pool
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+
+        self._records: deque[CommandRecord] = deque()
+        self._max_records = max_records
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.rollups = True
+
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+        self._reported_dropped = 0
+        self.last_flush_duration = 0.0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="command-statistics-writer")
+
+    def add(self, command: str, guild_id: int | None, user_id: int, executed_at: datetime.datetime) -> None:
+        if len(self._records) >= self._max_records:
+            self.dropped += 1
+            return
+
+        self._records.append((command, guild_id, user_id, executed_at))
+
+        if len(self._records) >= self._flush_size:
+            self._flush_event.set()
+
+    def metrics(self) -> dict[str, float]:
+        return {
+            "pending": len(self._records),
+            "written": self.written,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "last_flush_duration": self.last_flush_duration,
+        }
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Stops the writer and writes the buffered records."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        try:
+            async with asyncio.timeout(timeout):
+                while self._records:
+                    if not await self.flush():
+                        break
+        except TimeoutError:
+            pass
+
+        if self._records:
+            _log.warning(f"Could not write {len(self._records)} command statistics before closing")
+
+    async def flush(self) -> bool:
+        """Copies the buffered records into the database. Returns `False` if the copy failed,
+        in which case the records are kept for the next flush.
+        """
+        async with self._flush_lock:
+            if not self._records:
+                return True
+
+            records = list(self._records)
+            self._records.clear()
+            start = time.perf_counter()
+
+            try:
+                async with self._pool.acquire() as conn, conn.transaction():
+                    await conn.copy_records_to_table("command_statistics", records=records, columns=COLUMNS)
+                    if self.rollups:
+                        await conn.executemany(UPSERT_ROLLUP, self._rollups(records))
+            except (asyncpg.PostgresError, asyncpg.InterfaceError, OSError) as e:
+                self.failed += 1
+                self._requeue(records)
+
+                _log.warning(f"Could not write {len(records)} command statistics: {e!r}")
+                return False
+            except asyncio.CancelledError:
+                self._requeue(records)
+                raise
+            finally:
+                self.last_flush_duration = time.perf_counter() - start
+
+            self.written += len(records)
+            return True
+
+    @staticmethod
+    def _rollups(records: list[CommandRecord]) -> list[tuple[datetime.datetime, int, str, int]]:
+        usage: Counter[tuple[datetime.datetime, int, str]] = Counter()
+        for command, guild_id, _user_id, executed_at in records:
+            usage[executed_at.replace(minute=0, second=0, microsecond=0), guild_id or 0, command] += 1
+
+        return [(hour, guild_id, command, count) for (hour, guild_id, command), count in usage.items()]
+
+    def _requeue(self, records: list[CommandRecord]) -> None:
+        """Puts the records back in front of the buffer. Records that do not fit anymore are dropped."""
+        space = self._max_records - len(self._records)
+        if space < len(records):
+            self.dropped += len(records) - space
+            records = records[len(records) - space :] if space > 0 else []
+
+        self._records.extendleft(reversed(records))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self._flush_interval)
+            except TimeoutError:
+                pass
+
+            self._flush_event.clear()
+
+            if self.dropped > self._reported_dropped:
+                _log.warning(f"Dropped {self.dropped - self._reported_dropped} command statistics, the buffer is full")
+                self._reported_dropped = self.dropped
+
+            if not await self.flush():
+                # Do not retry on every new record while the database is unavailable
+                await asyncio.sleep(self._flush_interval)
@@ -1,7 +1,12 @@
 from .database import LevelUserData
 from .types import Translate, Infractions
 from .anilist import AnilistScore, AnilistDetailedResponse
-from .notification import TwitchLiveNotification, TwitchOfflineNotification, YoutubeVideoNotification
+from .notification import (
+    TwitchLiveNotification,
+    TwitchOfflineNotification,
+    YoutubeVideoNotification,
+    NotificationDeliveryStatus,
+)
 
 __all__ = (
     "LevelUserData",
@@ -12,4 +17,5 @@ __all__ = (
     "TwitchLiveNotification",
     "TwitchOfflineNotification",
     "YoutubeVideoNotification",
+    "NotificationDeliveryStatus",
 )
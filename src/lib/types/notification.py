@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 
 class TwitchLiveNotification(TypedDict):
@@ -22,3 +22,13 @@ class TwitchOfflineNotification(TypedDict):
 class YoutubeVideoNotification(TypedDict):
     user_id: str
     video_id: str
+
+
+class NotificationDeliveryStatus(TypedDict):
+    kind: Literal["twitch", "youtube"]
+    id: int | str  # stream id or video id
+    guild_id: int
+    channel_id: int
+    delivered: bool
+    error: str | None
+    latency: float
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+import discord
+from discord import utils
+
+if TYPE_CHECKING:
+    from .webhook_registry import WebhookRegistry
+
+_log = logging.getLogger(__name__)
+
+type Destination = discord.Webhook | discord.abc.Messageable
+type NotFoundCallback = Callable[[], Awaitable[None]]
+
+# Limits of a single message
+MAX_EMBEDS = 10
+MAX_EMBED_LENGTH = 6000
+
+
+class _QueuedMessage:
+    __slots__ = ("embeds", "file", "on_not_found", "length")
+
+    def __init__(self, embeds: list[discord.Embed], file: discord.File, on_not_found: NotFoundCallback | None):
+        self.embeds = embeds
+        self.file = file
+        self.on_not_found = on_not_found
+        self.length = sum(len(embed) for embed in embeds)
+
+
+class _Target:
+    __slots__ = ("destination", "items", "worker")
+
+    def __init__(self, destination: Destination):
+        self.destination = destination
+        self.items: deque[_QueuedMessage] = deque()
+        self.worker: asyncio.Task | None = None
+
+
+class WebhookQueue:
+    """Delivers log messages through a queue per webhook or channel.
+
+    Messages that are queued within the flush window are combined into as few messages as possible,
+    while keeping their order. Each destination is served by a single worker, so a rate limited
+    webhook (the http client waits according to the rate limit headers) collects more embeds
+    for the next message instead of sending more requests.
+
+    If a registry is given, the delivery state of the webhooks is reported to it. Messages to
+    destinations that are marked as dead are dropped and rate limited webhooks are paused.
+    """
+
+    def __init__(self, *, flush_delay: float = 1.0, registry: WebhookRegistry | None = None):
+        self._flush_delay = flush_delay
+        self._registry = registry
+        self._targets: dict[int, _Target] = {}
+
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.rate_limited = 0
+        self.dropped = 0
+
+    def send(
+        self,
+        destination: Destination,
+        *,
+        embeds: list[discord.Embed] = utils.MISSING,
+        file: discord.File = utils.MISSING,
+        on_not_found: NotFoundCallback | None = None,
+    ) -> None:
+        """Queues a message for the destination. `on_not_found` is called if the webhook
+        or channel does not exist anymore.
+        """
+        if self._registry is not None and self._registry.is_dead(destination.id):
+            self.dropped += 1
+            return
+
+        target = self._targets.get(destination.id)
+        if target is None:
+            self._targets[destination.id] = target = _Target(destination)
+            target.worker = asyncio.create_task(
+                self._worker(destination.id, target), name=f"log-queue-{destination.id}"
+            )
+
+        target.items.append(_QueuedMessage(embeds or [], file, on_not_found))
+        self.queued += 1
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "destinations": len(self._targets),
+            "pending": sum(len(target.items) for target in self._targets.values()),
+            "queued": self.queued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+            "dropped": self.dropped,
+        }
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Delivers the queued messages without waiting for the flush window."""
+        self._flush_delay = 0
+
+        workers = [target.worker for target in self._targets.values() if target.worker is not None]
+        if workers:
+            _done, pending = await asyncio.wait(workers, timeout=timeout)
+
+            for task in pending:
+                task.cancel()
+
+    async def _worker(self, id: int, target: _Target) -> None:
+        try:
+            await asyncio.sleep(self._flush_delay)
+
+            while target.items:
+                if self._registry is not None and (delay := self._registry.rate_limit_remaining(id)):
+                    await asyncio.sleep(delay)
+
+                embeds, file, on_not_found = self._next_batch(target.items)
+
+                if not await self._deliver(target.destination, embeds, file):
+                    if on_not_found is not None:
+                        await on_not_found()
+
+                    self.dropped += len(target.items)
+                    target.items.clear()
+        except Exception as e:
+            _log.error(f"Error while delivering log messages to {id}", exc_info=e)
+        finally:
+            self._targets.pop(id, None)
+
+    @staticmethod
+    def _next_batch(items: deque[_QueuedMessage]) -> tuple[list[discord.Embed], discord.File, NotFoundCallback | None]:
+        """Combines the next queued messages into one message. A message with a file closes the batch."""
+        embeds: list[discord.Embed] = []
+        length = 0
+        file = utils.MISSING
+        on_not_found = None
+
+        while items:
+            item = items[0]
+            if embeds and (len(embeds) + len(item.embeds) > MAX_EMBEDS or length + item.length > MAX_EMBED_LENGTH):
+                break
+
+            items.popleft()
+            embeds.extend(item.embeds)
+            length += item.length
+            on_not_found = on_not_found or item.on_not_found
+
+            if item.file:
+                file = item.file
+                break
+
+        return embeds, file, on_not_found
+
+    async def _deliver(self, destination: Destination, embeds: list[discord.Embed], file: discord.File) -> bool:
+        """Sends the message. Returns `False` if the destination does not exist anymore."""
+        try:
+            await destination.send(embeds=embeds or utils.MISSING, file=file)
+            self.sent += 1
+        except discord.NotFound:
+            _log.info(f"Log destination {destination.id} not found")
+            return False
+        except discord.HTTPException as e:
+            self.failed += 1
+
+            retry_after = None
+            if e.status == 429:
+                self.rate_limited += 1
+                retry_after = float(e.response.headers.get("Retry-After", 1))
+
+            if self._registry is not None:
+                self._registry.mark_failed(destination.id, retry_after=retry_after)
+
+            _log.error(f"Error while sending log message in {destination.id} ({type(destination)}): {e}")
+        else:
+            if self._registry is not None:
+                self._registry.mark_delivered(destination.id)
+
+        return True
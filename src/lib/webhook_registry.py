@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from main import Plyoox
+    from cache.models import MaybeWebhook
+
+_log = logging.getLogger(__name__)
+
+type Destination = discord.Webhook | discord.TextChannel
+
+
+class _WebhookState:
+    __slots__ = ("webhook", "token", "failures", "rate_limited_until")
+
+    def __init__(self, webhook: discord.Webhook, token: str):
+        self.webhook = webhook
+        self.token = token
+        self.failures = 0
+        self.rate_limited_until = 0.0
+
+
+class WebhookRegistry:
+    """Resolves the logging destinations of the guilds.
+
+    The webhook clients are kept per webhook id and reused for every log message, together
+    with the delivery state of the webhook. Destinations that do not exist anymore are removed
+    from the database and the cache once, other messages to them are dropped for a while.
+    """
+
+    def __init__(self, bot: Plyoox, *, dead_ttl: float = 60):
+        self._bot = bot
+        self._dead_ttl = dead_ttl
+
+        self._webhooks: dict[int, _WebhookState] = {}
+        # id -> time the destination was marked as dead
+        self._dead: dict[int, float] = {}
+        # The event loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    def resolve(self, guild: discord.Guild, channel: MaybeWebhook) -> Destination | None:
+        """Returns the webhook or text channel of the logging channel. Returns `None` if the
+        destination does not exist, in which case it is removed.
+        """
+        if self.is_dead(channel.id):
+            return None
+
+        if channel.token is not None:
+            return self._get_webhook(channel.id, channel.token)
+
+        # Normally all logging channels should be webhook channels,
+        # but just in case (e.g., manual insertion)
+        text_channel = guild.get_channel(channel.id)
+        if text_channel is None or not text_channel.permissions_for(guild.me).send_messages:
+            _log.info(f"Cannot send log message to {channel.id} ({repr(text_channel)})")
+
+            task = self._bot.loop.create_task(self.mark_dead(guild.id, channel.id))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_task_done)
+            return None
+
+        return text_channel
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _log.error("Could not remove dead log channel", exc_info=exc)
+
+    def _get_webhook(self, id: int, token: str) -> discord.Webhook:
+        state = self._webhooks.get(id)
+
+        if state is None or state.token != token:
+            webhook = discord.Webhook.partial(id, token, session=self._bot.session)
+            self._webhooks[id] = state = _WebhookState(webhook, token)
+
+        return state.webhook
+
+    def is_dead(self, id: int) -> bool:
+        marked_at = self._dead.get(id)
+        if marked_at is None:
+            return False
+
+        if marked_at + self._dead_ttl < time.monotonic():
+            del self._dead[id]
+            return False
+
+        return True
+
+    def rate_limit_remaining(self, id: int) -> float:
+        """Returns the seconds until the webhook can be used again."""
+        state = self._webhooks.get(id)
+        if state is None:
+            return 0.0
+
+        return max(state.rate_limited_until - time.monotonic(), 0.0)
+
+    def mark_delivered(self, id: int) -> None:
+        if (state := self._webhooks.get(id)) is not None:
+            state.failures = 0
+
+    def mark_failed(self, id: int, *, retry_after: float | None = None) -> None:
+        """Records a failed delivery. `retry_after` is set if the webhook is rate limited."""
+        if (state := self._webhooks.get(id)) is None:
+            return
+
+        state.failures += 1
+        if retry_after is not None:
+            state.rate_limited_until = time.monotonic() + retry_after
+
+    async def mark_dead(self, guild_id: int, id: int) -> None:
+        """Removes the logging channel from the database and the cache of the guild.
+        The channel is only removed once, even if multiple messages failed.
+        """
+        if self.is_dead(id):
+            return
+
+        now = time.monotonic()
+        for dead_id, marked_at in list(self._dead.items()):
+            if marked_at + self._dead_ttl < now:
+                del self._dead[dead_id]
+
+        self._dead[id] = now
+        self._webhooks.pop(id, None)
+
+        _log.info(f"Log channel {id} of guild {guild_id} not found, deleting...")
+        await self._bot.db.execute("DELETE FROM maybe_webhook WHERE id = $1 AND guild_id = $2", id, guild_id)
+
+        # Moderation and Logging config can have the same webhook,
+        # so it needs to be removed from both
+        self._bot.cache.edit_cache(guild_id, "mod", logging_channel=None)
+        self._bot.cache.remove_cache(guild_id, "log")
+
+    def metrics(self) -> dict[str, int]:
+        now = time.monotonic()
+
+        return {
+            "webhooks": len(self._webhooks),
+            "failing": sum(1 for state in self._webhooks.values() if state.failures),
+            "rate_limited": sum(1 for state in self._webhooks.values() if state.rate_limited_until > now),
+            "dead": len(self._dead),
+        }
@@ -5,6 +5,7 @@ import copy
 import logging
 import os
 import sys
+import time
 import traceback
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -18,7 +19,13 @@ from discord.ext import commands
 import translation
 from cache import CacheManager
 from lib import database, extensions
+from lib.instrumented_pool import InstrumentedPool
+from lib.listener_profiler import ListenerProfiler
+from lib.loop_monitor import LoopMonitor
+from lib.member_resolver import MemberResolver
 from lib.message_cache import MessageCache
+from lib.webhook_queue import WebhookQueue
+from lib.webhook_registry import WebhookRegistry
 
 if TYPE_CHECKING:
     from extensions.Timers import Timer
@@ -34,17 +41,22 @@ plugins = [
     "extensions.Owner",
     "extensions.Moderation",
     "extensions.Logging",
-    "extensions.Fun",
     "extensions.Timers",
-    "extensions.Anilist",
     "extensions.DataHandler",
     "extensions.Notification",
     "extensions.Statistics",
 ]
 
+# Extensions that are loaded when one of their commands is used for the first time,
+# with the names of their top level commands
+lazy_plugins = {
+    "extensions.Fun": ("fun",),
+    "extensions.Anilist": ("anilist",),
+}
+
 
 class Plyoox(commands.AutoShardedBot):
-    db: asyncpg.Pool
+    db: InstrumentedPool
     cache: CacheManager
     start_time: datetime
     session: aiohttp.ClientSession
@@ -76,32 +88,91 @@ class Plyoox(commands.AutoShardedBot):
         )
 
         self.messages = MessageCache[discord.Message](max_length=2500)
+        self.member_resolver = MemberResolver()
+        self.webhook_registry = WebhookRegistry(self)
+        self.webhook_queue = WebhookQueue(registry=self.webhook_registry)
+        self.loop_monitor = LoopMonitor()
+        self.listener_profiler = ListenerProfiler(enabled=bool(os.getenv("PROFILE_LISTENERS")))
         self.presence_task = None
         self.imager_url = os.getenv("IMAGER_URL")
 
         if self.imager_url is None:
             plugins.remove("extensions.Leveling")
-            plugins.remove("extensions.Anilist")
+            lazy_plugins.pop("extensions.Anilist")
             logger.warning("IMAGER_URL is not set. Level and Anilist extension will not be loaded.")
 
+        # command name -> lazy extension that has not been loaded yet
+        self._lazy_commands = {name: plugin for plugin, names in lazy_plugins.items() for name in names}
+        self._lazy_lock = asyncio.Lock()
+
     async def setup_hook(self) -> None:
+        self.loop_monitor.start()
         await self.tree.set_translator(translation.Translator())
 
-        for plugin in plugins:
-            logger.debug(f"Load plugin '{plugin}'...")
-            await self.load_extension(plugin)
+        start = time.perf_counter()
+
+        # The extensions do not depend on each other, so their setup can run concurrently
+        results = await asyncio.gather(*(self._load_plugin(plugin) for plugin in plugins), return_exceptions=True)
+        errors = [(plugin, result) for plugin, result in zip(plugins, results) if isinstance(result, Exception)]
+        if errors:
+            for plugin, error in errors[1:]:
+                logger.error(f"Could not load plugin '{plugin}'", exc_info=error)
 
-        logger.info("Plugins loaded")
+            raise errors[0][1]
+
+        logger.info(f"Plugins loaded in {(time.perf_counter() - start) * 1000:.0f}ms")
 
         self.presence_task = self.loop.create_task(self._update_status_task())
 
+    async def _load_plugin(self, plugin: str) -> None:
+        start = time.perf_counter()
+        await self.load_extension(plugin)
+
+        logger.debug(f"Loaded plugin '{plugin}' in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    async def load_lazy_plugin(self, command_name: str) -> None:
+        """Loads the lazy extension of the top level command, if it has not been loaded yet."""
+        plugin = self._lazy_commands.get(command_name)
+        if plugin is None:
+            return
+
+        async with self._lazy_lock:
+            # The extension could have been loaded while waiting for the lock
+            if plugin in self.extensions:
+                return
+
+            await self._load_plugin(plugin)
+
+            # An extension that is unloaded later is not loaded again on use
+            for name in lazy_plugins[plugin]:
+                self._lazy_commands.pop(name, None)
+
+    async def load_lazy_plugins(self) -> None:
+        """Loads all lazy extensions that have not been loaded yet, e.g. before syncing the commands."""
+        for command_name in list(self._lazy_commands):
+            await self.load_lazy_plugin(command_name)
+
+    async def _run_event(self, coro, event_name: str, *args, **kwargs) -> None:
+        if self.listener_profiler.enabled:
+            coro = self.listener_profiler.wrap(coro, event_name)
+
+        await super()._run_event(coro, event_name, *args, **kwargs)
+
     async def on_ready(self) -> None:
         logger.info("Ready")
         self.start_time = utils.utcnow()
 
+    async def on_shard_ready(self, shard_id: int) -> None:
+        # Messages sent while the shard was disconnected are missing in the cache
+        self.messages.invalidate_history()
+
     async def _create_db_pool(self) -> None:
         try:
-            self.db = await asyncpg.create_pool(os.getenv("POSTGRES_DSN"), init=database._init_db_connection)
+            # The hot queries are prepared when a connection is created, they must not expire from the statement cache
+            pool = await asyncpg.create_pool(
+                os.getenv("POSTGRES_DSN"), init=database._init_db_connection, max_cached_statement_lifetime=0
+            )
+            self.db = InstrumentedPool(pool)
             self.cache = CacheManager(self.db)
         except asyncpg.ConnectionDoesNotExistError:
             logger.critical(f"Could not connect to the database: {traceback.format_exc()}")
@@ -115,10 +186,14 @@ class Plyoox(commands.AutoShardedBot):
 
     async def close(self):
         logger.info("Stopping bot...")
+        # Unloads the extensions first, they can still write to the database and send log messages
+        await super().close()
+
+        await self.webhook_queue.close()
         await self.session.close()
         await self.db.close()
 
-        await super().close()
+        self.loop_monitor.close()
         logger.info("Plyoox has been successfully stopped.")
 
     @property
@@ -154,6 +229,10 @@ class Plyoox(commands.AutoShardedBot):
         mod_cache = await self.cache.get_moderation(message.guild.id)
         if mod_cache is not None and mod_cache.active:
             self.messages.add_item(message)
+            return
+
+        # The cached history of the channel is missing this message
+        self.messages.invalidate_channel(message.channel.id)
 
     async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
         message = self.messages.get_item(payload.message_id)
@@ -187,3 +266,8 @@ class Plyoox(commands.AutoShardedBot):
         payload.cached_messages = messages
 
         self.dispatch("custom_raw_bulk_message_delete", payload)
+
+    # Member cache events
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        self.member_resolver.invalidate(payload.guild_id, payload.user.id)
@@ -14,17 +14,23 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x63\x61\x63he.proto\x12\x0bUpdateCache\"\x10\n\x02Id\x12\n\n\x02id\x18\x01 \x01(\x03\"\x07\n\x05\x45mpty2\x90\x03\n\x0bUpdateCache\x12>\n\x15\x44\x65leteModerationCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12\x42\n\x19\x44\x65leteAutoModerationCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12;\n\x12\x44\x65leteWelcomeCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12;\n\x12\x44\x65leteLoggingCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12\x39\n\x10\x44\x65leteLevelCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12H\n\x1f\x44\x65leteModerationPunishmentCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x63\x61\x63he.proto\x12\x0bUpdateCache\"B\n\x0cInvalidation\x12&\n\x05store\x18\x01 \x01(\x0e\x32\x17.UpdateCache.CacheStore\x12\n\n\x02id\x18\x02 \x01(\x03\"r\n\x16InvalidateBatchRequest\x12\x30\n\rinvalidations\x18\x01 \x03(\x0b\x32\x19.UpdateCache.Invalidation\x12&\n\x05\x66lush\x18\x02 \x03(\x0e\x32\x17.UpdateCache.CacheStore\"\x10\n\x02Id\x12\n\n\x02id\x18\x01 \x01(\x03\"\x07\n\x05\x45mpty*q\n\nCacheStore\x12\x0e\n\nMODERATION\x10\x00\x12\x13\n\x0f\x41UTO_MODERATION\x10\x01\x12\x0b\n\x07WELCOME\x10\x02\x12\x0b\n\x07LOGGING\x10\x03\x12\t\n\x05LEVEL\x10\x04\x12\x19\n\x15MODERATION_PUNISHMENT\x10\x05\x32\xde\x03\n\x0bUpdateCache\x12>\n\x15\x44\x65leteModerationCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12\x42\n\x19\x44\x65leteAutoModerationCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12;\n\x12\x44\x65leteWelcomeCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12;\n\x12\x44\x65leteLoggingCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12\x39\n\x10\x44\x65leteLevelCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12H\n\x1f\x44\x65leteModerationPunishmentCache\x12\x0f.UpdateCache.Id\x1a\x12.UpdateCache.Empty\"\x00\x12L\n\x0fInvalidateBatch\x12#.UpdateCache.InvalidateBatchRequest\x1a\x12.UpdateCache.Empty\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'cache_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
-  _globals['_ID']._serialized_start=28
-  _globals['_ID']._serialized_end=44
-  _globals['_EMPTY']._serialized_start=46
-  _globals['_EMPTY']._serialized_end=53
-  _globals['_UPDATECACHE']._serialized_start=56
-  _globals['_UPDATECACHE']._serialized_end=456
+  _globals['_CACHESTORE']._serialized_start=239
+  _globals['_CACHESTORE']._serialized_end=352
+  _globals['_INVALIDATION']._serialized_start=28
+  _globals['_INVALIDATION']._serialized_end=94
+  _globals['_INVALIDATEBATCHREQUEST']._serialized_start=96
+  _globals['_INVALIDATEBATCHREQUEST']._serialized_end=210
+  _globals['_ID']._serialized_start=212
+  _globals['_ID']._serialized_end=228
+  _globals['_EMPTY']._serialized_start=230
+  _globals['_EMPTY']._serialized_end=237
+  _globals['_UPDATECACHE']._serialized_start=355
+  _globals['_UPDATECACHE']._serialized_end=833
 # @@protoc_insertion_point(module_scope)
@@ -1,9 +1,42 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class CacheStore(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    MODERATION: _ClassVar[CacheStore]
+    AUTO_MODERATION: _ClassVar[CacheStore]
+    WELCOME: _ClassVar[CacheStore]
+    LOGGING: _ClassVar[CacheStore]
+    LEVEL: _ClassVar[CacheStore]
+    MODERATION_PUNISHMENT: _ClassVar[CacheStore]
+MODERATION: CacheStore
+AUTO_MODERATION: CacheStore
+WELCOME: CacheStore
+LOGGING: CacheStore
+LEVEL: CacheStore
+MODERATION_PUNISHMENT: CacheStore
+
+class Invalidation(_message.Message):
+    __slots__ = ("store", "id")
+    STORE_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    store: CacheStore
+    id: int
+    def __init__(self, store: _Optional[_Union[CacheStore, str]] = ..., id: _Optional[int] = ...) -> None: ...
+
+class InvalidateBatchRequest(_message.Message):
+    __slots__ = ("invalidations", "flush")
+    INVALIDATIONS_FIELD_NUMBER: _ClassVar[int]
+    FLUSH_FIELD_NUMBER: _ClassVar[int]
+    invalidations: _containers.RepeatedCompositeFieldContainer[Invalidation]
+    flush: _containers.RepeatedScalarFieldContainer[CacheStore]
+    def __init__(self, invalidations: _Optional[_Iterable[_Union[Invalidation, _Mapping]]] = ..., flush: _Optional[_Iterable[_Union[CacheStore, str]]] = ...) -> None: ...
+
 class Id(_message.Message):
     __slots__ = ("id",)
     ID_FIELD_NUMBER: _ClassVar[int]
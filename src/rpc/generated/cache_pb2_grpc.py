@@ -44,6 +44,11 @@ class UpdateCacheStub(object):
             request_serializer=cache__pb2.Id.SerializeToString,
             response_deserializer=cache__pb2.Empty.FromString,
         )
+        self.InvalidateBatch = channel.unary_unary(
+            '/UpdateCache.UpdateCache/InvalidateBatch',
+            request_serializer=cache__pb2.InvalidateBatchRequest.SerializeToString,
+            response_deserializer=cache__pb2.Empty.FromString,
+        )
 
 
 class UpdateCacheServicer(object):
@@ -85,6 +90,12 @@ class UpdateCacheServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def InvalidateBatch(self, request, context):
+        """Removes multiple entries and flushes whole stores in one call"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_UpdateCacheServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -118,6 +129,11 @@ def add_UpdateCacheServicer_to_server(servicer, server):
             request_deserializer=cache__pb2.Id.FromString,
             response_serializer=cache__pb2.Empty.SerializeToString,
         ),
+        'InvalidateBatch': grpc.unary_unary_rpc_method_handler(
+            servicer.InvalidateBatch,
+            request_deserializer=cache__pb2.InvalidateBatchRequest.FromString,
+            response_serializer=cache__pb2.Empty.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler('UpdateCache.UpdateCache', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
@@ -300,3 +316,32 @@ class UpdateCache(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def InvalidateBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/UpdateCache.UpdateCache/InvalidateBatch',
+            cache__pb2.InvalidateBatchRequest.SerializeToString,
+            cache__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: diagnostics.proto
+# Protobuf Python Version: 4.25.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x64iagnostics.proto\x12\x0b\x44iagnostics\"*\n\x16StreamSnapshotsRequest\x12\x10\n\x08interval\x18\x01 \x01(\x01\"1\n\x0cShardLatency\x12\x10\n\x08shard_id\x18\x01 \x01(\x05\x12\x0f\n\x07latency\x18\x02 \x01(\x01\"K\n\x0f\x43\x61\x63heStoreStats\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x05\x12\x0c\n\x04hits\x18\x03 \x01(\x03\x12\x0e\n\x06misses\x18\x04 \x01(\x03\"S\n\x11\x44\x61tabasePoolStats\x12\x0c\n\x04size\x18\x01 \x01(\x05\x12\x0c\n\x04idle\x18\x02 \x01(\x05\x12\x10\n\x08min_size\x18\x03 \x01(\x05\x12\x10\n\x08max_size\x18\x04 \x01(\x05\")\n\nQueueDepth\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x64\x65pth\x18\x02 \x01(\x03\"\xab\x02\n\x08Snapshot\x12\x11\n\ttimestamp\x18\x01 \x01(\x01\x12\x10\n\x08loop_lag\x18\x02 \x01(\x01\x12)\n\x06shards\x18\x03 \x03(\x0b\x32\x19.Diagnostics.ShardLatency\x12\x0e\n\x06guilds\x18\x04 \x01(\x05\x12\x0f\n\x07members\x18\x05 \x01(\x03\x12\r\n\x05users\x18\x06 \x01(\x05\x12\x10\n\x08messages\x18\x07 \x01(\x05\x12\x32\n\x0c\x63\x61\x63he_stores\x18\x08 \x03(\x0b\x32\x1c.Diagnostics.CacheStoreStats\x12\x30\n\x08\x64\x61tabase\x18\t \x01(\x0b\x32\x1e.Diagnostics.DatabasePoolStats\x12\'\n\x06queues\x18\n \x03(\x0b\x32\x17.Diagnostics.QueueDepth\"\x07\n\x05\x45mpty2\x9c\x01\n\x0b\x44iagnostics\x12:\n\x0bGetSnapshot\x12\x12.Diagnostics.Empty\x1a\x15.Diagnostics.Snapshot\"\x00\x12Q\n\x0fStreamSnapshots\x12#.Diagnostics.StreamSnapshotsRequest\x1a\x15.Diagnostics.Snapshot\"\x00\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'diagnostics_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_STREAMSNAPSHOTSREQUEST']._serialized_start=34
+  _globals['_STREAMSNAPSHOTSREQUEST']._serialized_end=76
+  _globals['_SHARDLATENCY']._serialized_start=78
+  _globals['_SHARDLATENCY']._serialized_end=127
+  _globals['_CACHESTORESTATS']._serialized_start=129
+  _globals['_CACHESTORESTATS']._serialized_end=204
+  _globals['_DATABASEPOOLSTATS']._serialized_start=206
+  _globals['_DATABASEPOOLSTATS']._serialized_end=289
+  _globals['_QUEUEDEPTH']._serialized_start=291
+  _globals['_QUEUEDEPTH']._serialized_end=332
+  _globals['_SNAPSHOT']._serialized_start=335
+  _globals['_SNAPSHOT']._serialized_end=634
+  _globals['_EMPTY']._serialized_start=636
+  _globals['_EMPTY']._serialized_end=643
+  _globals['_DIAGNOSTICS']._serialized_start=646
+  _globals['_DIAGNOSTICS']._serialized_end=802
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,80 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class StreamSnapshotsRequest(_message.Message):
+    __slots__ = ("interval",)
+    INTERVAL_FIELD_NUMBER: _ClassVar[int]
+    interval: float
+    def __init__(self, interval: _Optional[float] = ...) -> None: ...
+
+class ShardLatency(_message.Message):
+    __slots__ = ("shard_id", "latency")
+    SHARD_ID_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_FIELD_NUMBER: _ClassVar[int]
+    shard_id: int
+    latency: float
+    def __init__(self, shard_id: _Optional[int] = ..., latency: _Optional[float] = ...) -> None: ...
+
+class CacheStoreStats(_message.Message):
+    __slots__ = ("name", "size", "hits", "misses")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    HITS_FIELD_NUMBER: _ClassVar[int]
+    MISSES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    size: int
+    hits: int
+    misses: int
+    def __init__(self, name: _Optional[str] = ..., size: _Optional[int] = ..., hits: _Optional[int] = ..., misses: _Optional[int] = ...) -> None: ...
+
+class DatabasePoolStats(_message.Message):
+    __slots__ = ("size", "idle", "min_size", "max_size")
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    IDLE_FIELD_NUMBER: _ClassVar[int]
+    MIN_SIZE_FIELD_NUMBER: _ClassVar[int]
+    MAX_SIZE_FIELD_NUMBER: _ClassVar[int]
+    size: int
+    idle: int
+    min_size: int
+    max_size: int
+    def __init__(self, size: _Optional[int] = ..., idle: _Optional[int] = ..., min_size: _Optional[int] = ..., max_size: _Optional[int] = ...) -> None: ...
+
+class QueueDepth(_message.Message):
+    __slots__ = ("name", "depth")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    depth: int
+    def __init__(self, name: _Optional[str] = ..., depth: _Optional[int] = ...) -> None: ...
+
+class Snapshot(_message.Message):
+    __slots__ = ("timestamp", "loop_lag", "shards", "guilds", "members", "users", "messages", "cache_stores", "database", "queues")
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    LOOP_LAG_FIELD_NUMBER: _ClassVar[int]
+    SHARDS_FIELD_NUMBER: _ClassVar[int]
+    GUILDS_FIELD_NUMBER: _ClassVar[int]
+    MEMBERS_FIELD_NUMBER: _ClassVar[int]
+    USERS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGES_FIELD_NUMBER: _ClassVar[int]
+    CACHE_STORES_FIELD_NUMBER: _ClassVar[int]
+    DATABASE_FIELD_NUMBER: _ClassVar[int]
+    QUEUES_FIELD_NUMBER: _ClassVar[int]
+    timestamp: float
+    loop_lag: float
+    shards: _containers.RepeatedCompositeFieldContainer[ShardLatency]
+    guilds: int
+    members: int
+    users: int
+    messages: int
+    cache_stores: _containers.RepeatedCompositeFieldContainer[CacheStoreStats]
+    database: DatabasePoolStats
+    queues: _containers.RepeatedCompositeFieldContainer[QueueDepth]
+    def __init__(self, timestamp: _Optional[float] = ..., loop_lag: _Optional[float] = ..., shards: _Optional[_Iterable[_Union[ShardLatency, _Mapping]]] = ..., guilds: _Optional[int] = ..., members: _Optional[int] = ..., users: _Optional[int] = ..., messages: _Optional[int] = ..., cache_stores: _Optional[_Iterable[_Union[CacheStoreStats, _Mapping]]] = ..., database: _Optional[_Union[DatabasePoolStats, _Mapping]] = ..., queues: _Optional[_Iterable[_Union[QueueDepth, _Mapping]]] = ...) -> None: ...
+
+class Empty(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
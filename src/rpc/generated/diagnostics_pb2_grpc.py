@@ -0,0 +1,122 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from . import diagnostics_pb2 as diagnostics__pb2
+
+
+class DiagnosticsStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetSnapshot = channel.unary_unary(
+            "/Diagnostics.Diagnostics/GetSnapshot",
+            request_serializer=diagnostics__pb2.Empty.SerializeToString,
+            response_deserializer=diagnostics__pb2.Snapshot.FromString,
+        )
+        self.StreamSnapshots = channel.unary_stream(
+            "/Diagnostics.Diagnostics/StreamSnapshots",
+            request_serializer=diagnostics__pb2.StreamSnapshotsRequest.SerializeToString,
+            response_deserializer=diagnostics__pb2.Snapshot.FromString,
+        )
+
+
+class DiagnosticsServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def GetSnapshot(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def StreamSnapshots(self, request, context):
+        """Sends a snapshot every interval until the call is cancelled"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+
+def add_DiagnosticsServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+        "GetSnapshot": grpc.unary_unary_rpc_method_handler(
+            servicer.GetSnapshot,
+            request_deserializer=diagnostics__pb2.Empty.FromString,
+            response_serializer=diagnostics__pb2.Snapshot.SerializeToString,
+        ),
+        "StreamSnapshots": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamSnapshots,
+            request_deserializer=diagnostics__pb2.StreamSnapshotsRequest.FromString,
+            response_serializer=diagnostics__pb2.Snapshot.SerializeToString,
+        ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler("Diagnostics.Diagnostics", rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+# This class is part of an EXPERIMENTAL API.
+class Diagnostics(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetSnapshot(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/Diagnostics.Diagnostics/GetSnapshot",
+            diagnostics__pb2.Empty.SerializeToString,
+            diagnostics__pb2.Snapshot.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def StreamSnapshots(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/Diagnostics.Diagnostics/StreamSnapshots",
+            diagnostics__pb2.StreamSnapshotsRequest.SerializeToString,
+            diagnostics__pb2.Snapshot.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0ctwitch.proto\x12\x06Twitch\"\xba\x01\n\x16TwitchLiveNotification\x12\x10\n\x08guild_id\x18\x01 \x01(\x03\x12\x11\n\tstream_id\x18\x02 \x01(\x03\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x14\n\x0cviewer_count\x18\x04 \x01(\x05\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\r\n\x05title\x18\x06 \x01(\t\x12\x15\n\rthumbnail_url\x18\x07 \x01(\t\x12\x0c\n\x04game\x18\x08 \x01(\t\x12\x12\n\nstarted_at\x18\t \x01(\x04\"@\n\x19TwitchOfflineNotification\x12\x11\n\tstream_id\x18\x01 \x01(\x03\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\"K\n\x15\x41\x64\x64TwitchNotification\x12\x10\n\x08guild_id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nchannel_id\x18\x03 \x01(\x03\"=\n\x18RemoveTwitchNotification\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\"/\n\tOAuthCode\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x14\n\x0credirect_uri\x18\x04 \x01(\t\"X\n\nTwitchUser\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05login\x18\x02 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x03 \x01(\t\x12\x19\n\x11profile_image_url\x18\x04 \x01(\t\"\x1f\n\x10OAuthUrlResponse\x12\x0b\n\x03url\x18\x01 \x01(\t\"5\n\x0e\x43reateOAuthUrl\x12\r\n\x05state\x18\x01 \x01(\t\x12\x14\n\x0credirect_uri\x18\x02 \x01(\t\"2\n\rRemoveAccount\x12\x10\n\x08guild_id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\"\x07\n\x05\x45mpty2\xf6\x03\n\x12TwitchNotification\x12\x43\n\x10LiveNotification\x12\x1e.Twitch.TwitchLiveNotification\x1a\r.Twitch.Empty\"\x00\x12I\n\x13OfflineNotification\x12!.Twitch.TwitchOfflineNotification\x1a\r.Twitch.Empty\"\x00\x12=\n\x12OAuthAuthorization\x12\x11.Twitch.OAuthCode\x1a\x12.Twitch.TwitchUser\"\x00\x12\x42\n\x0cOAuthBaseUrl\x12\x16.Twitch.CreateOAuthUrl\x1a\x18.Twitch.OAuthUrlResponse\"\x00\x12<\n\x12RemoveGuildAccount\x12\x15.Twitch.RemoveAccount\x1a\r.Twitch.Empty\"\x00\x12\x46\n\x0f\x41\x64\x64Notification\x12\x1d.Twitch.AddTwitchNotification\x1a\x12.Twitch.TwitchUser\"\x00\x12G\n\x12RemoveNotification\x12 .Twitch.RemoveTwitchNotification\x1a\r.Twitch.Empty\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0ctwitch.proto\x12\x06Twitch\"\xba\x01\n\x16TwitchLiveNotification\x12\x10\n\x08guild_id\x18\x01 \x01(\x03\x12\x11\n\tstream_id\x18\x02 \x01(\x03\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x14\n\x0cviewer_count\x18\x04 \x01(\x05\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\r\n\x05title\x18\x06 \x01(\t\x12\x15\n\rthumbnail_url\x18\x07 \x01(\t\x12\x0c\n\x04game\x18\x08 \x01(\t\x12\x12\n\nstarted_at\x18\t \x01(\x04\"P\n\x17TwitchLiveNotifications\x12\x35\n\rnotifications\x18\x01 \x03(\x0b\x32\x1e.Twitch.TwitchLiveNotification\"!\n\x0fNotificationAck\x12\x0e\n\x06queued\x18\x01 \x01(\x05\"|\n\x0e\x44\x65liveryStatus\x12\x11\n\tstream_id\x18\x01 \x01(\x03\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\x12\x12\n\nchannel_id\x18\x03 \x01(\x03\x12\x11\n\tdelivered\x18\x04 \x01(\x08\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x12\x0f\n\x07latency\x18\x06 \x01(\x01\"@\n\x19TwitchOfflineNotification\x12\x11\n\tstream_id\x18\x01 \x01(\x03\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\"K\n\x15\x41\x64\x64TwitchNotification\x12\x10\n\x08guild_id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nchannel_id\x18\x03 \x01(\x03\"=\n\x18RemoveTwitchNotification\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\"0\n\x1dInvalidateTwitchNotifications\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"/\n\tOAuthCode\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x14\n\x0credirect_uri\x18\x04 \x01(\t\"X\n\nTwitchUser\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05login\x18\x02 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x03 \x01(\t\x12\x19\n\x11profile_image_url\x18\x04 \x01(\t\"\x1f\n\x10OAuthUrlResponse\x12\x0b\n\x03url\x18\x01 \x01(\t\"5\n\x0e\x43reateOAuthUrl\x12\r\n\x05state\x18\x01 \x01(\t\x12\x14\n\x0credirect_uri\x18\x02 \x01(\t\"2\n\rRemoveAccount\x12\x10\n\x08guild_id\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\"\x07\n\x05\x45mpty2\xb8\x06\n\x12TwitchNotification\x12\x43\n\x10LiveNotification\x12\x1e.Twitch.TwitchLiveNotification\x1a\r.Twitch.Empty\"\x00\x12I\n\x13OfflineNotification\x12!.Twitch.TwitchOfflineNotification\x1a\r.Twitch.Empty\"\x00\x12=\n\x12OAuthAuthorization\x12\x11.Twitch.OAuthCode\x1a\x12.Twitch.TwitchUser\"\x00\x12\x42\n\x0cOAuthBaseUrl\x12\x16.Twitch.CreateOAuthUrl\x1a\x18.Twitch.OAuthUrlResponse\"\x00\x12<\n\x12RemoveGuildAccount\x12\x15.Twitch.RemoveAccount\x1a\r.Twitch.Empty\"\x00\x12\x46\n\x0f\x41\x64\x64Notification\x12\x1d.Twitch.AddTwitchNotification\x1a\x12.Twitch.TwitchUser\"\x00\x12G\n\x12RemoveNotification\x12 .Twitch.RemoveTwitchNotification\x1a\r.Twitch.Empty\"\x00\x12Q\n\x17InvalidateNotifications\x12%.Twitch.InvalidateTwitchNotifications\x1a\r.Twitch.Empty\"\x00\x12S\n\x15LiveNotificationBatch\x12\x1f.Twitch.TwitchLiveNotifications\x1a\x17.Twitch.NotificationAck\"\x00\x12U\n\x16LiveNotificationStream\x12\x1e.Twitch.TwitchLiveNotification\x1a\x17.Twitch.NotificationAck\"\x00(\x01\x12\x41\n\x14\x44\x65liveryStatusStream\x12\r.Twitch.Empty\x1a\x16.Twitch.DeliveryStatus\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -23,24 +23,32 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   _globals['_TWITCHLIVENOTIFICATION']._serialized_start=25
   _globals['_TWITCHLIVENOTIFICATION']._serialized_end=211
-  _globals['_TWITCHOFFLINENOTIFICATION']._serialized_start=213
-  _globals['_TWITCHOFFLINENOTIFICATION']._serialized_end=277
-  _globals['_ADDTWITCHNOTIFICATION']._serialized_start=279
-  _globals['_ADDTWITCHNOTIFICATION']._serialized_end=354
-  _globals['_REMOVETWITCHNOTIFICATION']._serialized_start=356
-  _globals['_REMOVETWITCHNOTIFICATION']._serialized_end=417
-  _globals['_OAUTHCODE']._serialized_start=419
-  _globals['_OAUTHCODE']._serialized_end=466
-  _globals['_TWITCHUSER']._serialized_start=468
-  _globals['_TWITCHUSER']._serialized_end=556
-  _globals['_OAUTHURLRESPONSE']._serialized_start=558
-  _globals['_OAUTHURLRESPONSE']._serialized_end=589
-  _globals['_CREATEOAUTHURL']._serialized_start=591
-  _globals['_CREATEOAUTHURL']._serialized_end=644
-  _globals['_REMOVEACCOUNT']._serialized_start=646
-  _globals['_REMOVEACCOUNT']._serialized_end=696
-  _globals['_EMPTY']._serialized_start=698
-  _globals['_EMPTY']._serialized_end=705
-  _globals['_TWITCHNOTIFICATION']._serialized_start=708
-  _globals['_TWITCHNOTIFICATION']._serialized_end=1210
+  _globals['_TWITCHLIVENOTIFICATIONS']._serialized_start=213
+  _globals['_TWITCHLIVENOTIFICATIONS']._serialized_end=293
+  _globals['_NOTIFICATIONACK']._serialized_start=295
+  _globals['_NOTIFICATIONACK']._serialized_end=328
+  _globals['_DELIVERYSTATUS']._serialized_start=330
+  _globals['_DELIVERYSTATUS']._serialized_end=454
+  _globals['_TWITCHOFFLINENOTIFICATION']._serialized_start=456
+  _globals['_TWITCHOFFLINENOTIFICATION']._serialized_end=520
+  _globals['_ADDTWITCHNOTIFICATION']._serialized_start=522
+  _globals['_ADDTWITCHNOTIFICATION']._serialized_end=597
+  _globals['_REMOVETWITCHNOTIFICATION']._serialized_start=599
+  _globals['_REMOVETWITCHNOTIFICATION']._serialized_end=660
+  _globals['_INVALIDATETWITCHNOTIFICATIONS']._serialized_start=662
+  _globals['_INVALIDATETWITCHNOTIFICATIONS']._serialized_end=710
+  _globals['_OAUTHCODE']._serialized_start=712
+  _globals['_OAUTHCODE']._serialized_end=759
+  _globals['_TWITCHUSER']._serialized_start=761
+  _globals['_TWITCHUSER']._serialized_end=849
+  _globals['_OAUTHURLRESPONSE']._serialized_start=851
+  _globals['_OAUTHURLRESPONSE']._serialized_end=882
+  _globals['_CREATEOAUTHURL']._serialized_start=884
+  _globals['_CREATEOAUTHURL']._serialized_end=937
+  _globals['_REMOVEACCOUNT']._serialized_start=939
+  _globals['_REMOVEACCOUNT']._serialized_end=989
+  _globals['_EMPTY']._serialized_start=991
+  _globals['_EMPTY']._serialized_end=998
+  _globals['_TWITCHNOTIFICATION']._serialized_start=1001
+  _globals['_TWITCHNOTIFICATION']._serialized_end=1825
 # @@protoc_insertion_point(module_scope)
@@ -1,6 +1,7 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -26,6 +27,34 @@ class TwitchLiveNotification(_message.Message):
     started_at: int
     def __init__(self, guild_id: _Optional[int] = ..., stream_id: _Optional[int] = ..., user_id: _Optional[int] = ..., viewer_count: _Optional[int] = ..., name: _Optional[str] = ..., title: _Optional[str] = ..., thumbnail_url: _Optional[str] = ..., game: _Optional[str] = ..., started_at: _Optional[int] = ...) -> None: ...
 
+class TwitchLiveNotifications(_message.Message):
+    __slots__ = ("notifications",)
+    NOTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
+    notifications: _containers.RepeatedCompositeFieldContainer[TwitchLiveNotification]
+    def __init__(self, notifications: _Optional[_Iterable[_Union[TwitchLiveNotification, _Mapping]]] = ...) -> None: ...
+
+class NotificationAck(_message.Message):
+    __slots__ = ("queued",)
+    QUEUED_FIELD_NUMBER: _ClassVar[int]
+    queued: int
+    def __init__(self, queued: _Optional[int] = ...) -> None: ...
+
+class DeliveryStatus(_message.Message):
+    __slots__ = ("stream_id", "guild_id", "channel_id", "delivered", "error", "latency")
+    STREAM_ID_FIELD_NUMBER: _ClassVar[int]
+    GUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    CHANNEL_ID_FIELD_NUMBER: _ClassVar[int]
+    DELIVERED_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_FIELD_NUMBER: _ClassVar[int]
+    stream_id: int
+    guild_id: int
+    channel_id: int
+    delivered: bool
+    error: str
+    latency: float
+    def __init__(self, stream_id: _Optional[int] = ..., guild_id: _Optional[int] = ..., channel_id: _Optional[int] = ..., delivered: bool = ..., error: _Optional[str] = ..., latency: _Optional[float] = ...) -> None: ...
+
 class TwitchOfflineNotification(_message.Message):
     __slots__ = ("stream_id", "guild_id")
     STREAM_ID_FIELD_NUMBER: _ClassVar[int]
@@ -52,6 +81,12 @@ class RemoveTwitchNotification(_message.Message):
     guild_id: int
     def __init__(self, user_id: _Optional[int] = ..., guild_id: _Optional[int] = ...) -> None: ...
 
+class InvalidateTwitchNotifications(_message.Message):
+    __slots__ = ("user_id",)
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: int
+    def __init__(self, user_id: _Optional[int] = ...) -> None: ...
+
 class OAuthCode(_message.Message):
     __slots__ = ("code", "redirect_uri")
     CODE_FIELD_NUMBER: _ClassVar[int]
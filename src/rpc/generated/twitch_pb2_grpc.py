@@ -49,6 +49,26 @@ class TwitchNotificationStub(object):
             request_serializer=twitch__pb2.RemoveTwitchNotification.SerializeToString,
             response_deserializer=twitch__pb2.Empty.FromString,
         )
+        self.InvalidateNotifications = channel.unary_unary(
+            "/Twitch.TwitchNotification/InvalidateNotifications",
+            request_serializer=twitch__pb2.InvalidateTwitchNotifications.SerializeToString,
+            response_deserializer=twitch__pb2.Empty.FromString,
+        )
+        self.LiveNotificationBatch = channel.unary_unary(
+            "/Twitch.TwitchNotification/LiveNotificationBatch",
+            request_serializer=twitch__pb2.TwitchLiveNotifications.SerializeToString,
+            response_deserializer=twitch__pb2.NotificationAck.FromString,
+        )
+        self.LiveNotificationStream = channel.stream_unary(
+            "/Twitch.TwitchNotification/LiveNotificationStream",
+            request_serializer=twitch__pb2.TwitchLiveNotification.SerializeToString,
+            response_deserializer=twitch__pb2.NotificationAck.FromString,
+        )
+        self.DeliveryStatusStream = channel.unary_stream(
+            "/Twitch.TwitchNotification/DeliveryStatusStream",
+            request_serializer=twitch__pb2.Empty.SerializeToString,
+            response_deserializer=twitch__pb2.DeliveryStatus.FromString,
+        )
 
 
 class TwitchNotificationServicer(object):
@@ -96,6 +116,30 @@ class TwitchNotificationServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def InvalidateNotifications(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def LiveNotificationBatch(self, request, context):
+        """Queues the notifications and returns before they are delivered"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def LiveNotificationStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def DeliveryStatusStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_TwitchNotificationServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -134,6 +178,26 @@ def add_TwitchNotificationServicer_to_server(servicer, server):
             request_deserializer=twitch__pb2.RemoveTwitchNotification.FromString,
             response_serializer=twitch__pb2.Empty.SerializeToString,
         ),
+        "InvalidateNotifications": grpc.unary_unary_rpc_method_handler(
+            servicer.InvalidateNotifications,
+            request_deserializer=twitch__pb2.InvalidateTwitchNotifications.FromString,
+            response_serializer=twitch__pb2.Empty.SerializeToString,
+        ),
+        "LiveNotificationBatch": grpc.unary_unary_rpc_method_handler(
+            servicer.LiveNotificationBatch,
+            request_deserializer=twitch__pb2.TwitchLiveNotifications.FromString,
+            response_serializer=twitch__pb2.NotificationAck.SerializeToString,
+        ),
+        "LiveNotificationStream": grpc.stream_unary_rpc_method_handler(
+            servicer.LiveNotificationStream,
+            request_deserializer=twitch__pb2.TwitchLiveNotification.FromString,
+            response_serializer=twitch__pb2.NotificationAck.SerializeToString,
+        ),
+        "DeliveryStatusStream": grpc.unary_stream_rpc_method_handler(
+            servicer.DeliveryStatusStream,
+            request_deserializer=twitch__pb2.Empty.FromString,
+            response_serializer=twitch__pb2.DeliveryStatus.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler("Twitch.TwitchNotification", rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
@@ -345,3 +409,119 @@ class TwitchNotification(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def InvalidateNotifications(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/Twitch.TwitchNotification/InvalidateNotifications",
+            twitch__pb2.InvalidateTwitchNotifications.SerializeToString,
+            twitch__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def LiveNotificationBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/Twitch.TwitchNotification/LiveNotificationBatch",
+            twitch__pb2.TwitchLiveNotifications.SerializeToString,
+            twitch__pb2.NotificationAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def LiveNotificationStream(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/Twitch.TwitchNotification/LiveNotificationStream",
+            twitch__pb2.TwitchLiveNotification.SerializeToString,
+            twitch__pb2.NotificationAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def DeliveryStatusStream(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/Twitch.TwitchNotification/DeliveryStatusStream",
+            twitch__pb2.Empty.SerializeToString,
+            twitch__pb2.DeliveryStatus.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
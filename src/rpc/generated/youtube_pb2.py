@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ryoutube.proto\x12\x07Youtube\"8\n\x13YoutubeNotification\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08video_id\x18\x02 \x01(\t\"S\n\x16\x41\x64\x64YoutubeNotification\x12\x13\n\x0byoutube_url\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\x12\x12\n\nchannel_id\x18\x03 \x01(\x03\"A\n\x19RemoveYoutubeNotification\x12\x12\n\nyoutube_id\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\"B\n\x0bYouTubeUser\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x19\n\x11profile_image_url\x18\x03 \x01(\t\"\x07\n\x05\x45mpty2\xe1\x01\n\x07Youtube\x12>\n\x0cVideoPublish\x12\x1c.Youtube.YoutubeNotification\x1a\x0e.Youtube.Empty\"\x00\x12J\n\x0f\x41\x64\x64Notification\x12\x1f.Youtube.AddYoutubeNotification\x1a\x14.Youtube.YouTubeUser\"\x00\x12J\n\x12RemoveNotification\x12\".Youtube.RemoveYoutubeNotification\x1a\x0e.Youtube.Empty\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ryoutube.proto\x12\x07Youtube\"8\n\x13YoutubeNotification\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08video_id\x18\x02 \x01(\t\"K\n\x14YoutubeNotifications\x12\x33\n\rnotifications\x18\x01 \x03(\x0b\x32\x1c.Youtube.YoutubeNotification\"!\n\x0fNotificationAck\x12\x0e\n\x06queued\x18\x01 \x01(\x05\"{\n\x0e\x44\x65liveryStatus\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\x12\x12\n\nchannel_id\x18\x03 \x01(\x03\x12\x11\n\tdelivered\x18\x04 \x01(\x08\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x12\x0f\n\x07latency\x18\x06 \x01(\x01\"S\n\x16\x41\x64\x64YoutubeNotification\x12\x13\n\x0byoutube_url\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\x12\x12\n\nchannel_id\x18\x03 \x01(\x03\"A\n\x19RemoveYoutubeNotification\x12\x12\n\nyoutube_id\x18\x01 \x01(\t\x12\x10\n\x08guild_id\x18\x02 \x01(\x03\"4\n\x1eInvalidateYoutubeNotifications\x12\x12\n\nyoutube_id\x18\x01 \x01(\t\"B\n\x0bYouTubeUser\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x19\n\x11profile_image_url\x18\x03 \x01(\t\"\x07\n\x05\x45mpty2\x9e\x04\n\x07Youtube\x12>\n\x0cVideoPublish\x12\x1c.Youtube.YoutubeNotification\x1a\x0e.Youtube.Empty\"\x00\x12J\n\x0f\x41\x64\x64Notification\x12\x1f.Youtube.AddYoutubeNotification\x1a\x14.Youtube.YouTubeUser\"\x00\x12J\n\x12RemoveNotification\x12\".Youtube.RemoveYoutubeNotification\x1a\x0e.Youtube.Empty\"\x00\x12T\n\x17InvalidateNotifications\x12\'.Youtube.InvalidateYoutubeNotifications\x1a\x0e.Youtube.Empty\"\x00\x12N\n\x11VideoPublishBatch\x12\x1d.Youtube.YoutubeNotifications\x1a\x18.Youtube.NotificationAck\"\x00\x12P\n\x12VideoPublishStream\x12\x1c.Youtube.YoutubeNotification\x1a\x18.Youtube.NotificationAck\"\x00(\x01\x12\x43\n\x14\x44\x65liveryStatusStream\x12\x0e.Youtube.Empty\x1a\x17.Youtube.DeliveryStatus\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -23,14 +23,22 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   _globals['_YOUTUBENOTIFICATION']._serialized_start=26
   _globals['_YOUTUBENOTIFICATION']._serialized_end=82
-  _globals['_ADDYOUTUBENOTIFICATION']._serialized_start=84
-  _globals['_ADDYOUTUBENOTIFICATION']._serialized_end=167
-  _globals['_REMOVEYOUTUBENOTIFICATION']._serialized_start=169
-  _globals['_REMOVEYOUTUBENOTIFICATION']._serialized_end=234
-  _globals['_YOUTUBEUSER']._serialized_start=236
-  _globals['_YOUTUBEUSER']._serialized_end=302
-  _globals['_EMPTY']._serialized_start=304
-  _globals['_EMPTY']._serialized_end=311
-  _globals['_YOUTUBE']._serialized_start=314
-  _globals['_YOUTUBE']._serialized_end=539
+  _globals['_YOUTUBENOTIFICATIONS']._serialized_start=84
+  _globals['_YOUTUBENOTIFICATIONS']._serialized_end=159
+  _globals['_NOTIFICATIONACK']._serialized_start=161
+  _globals['_NOTIFICATIONACK']._serialized_end=194
+  _globals['_DELIVERYSTATUS']._serialized_start=196
+  _globals['_DELIVERYSTATUS']._serialized_end=319
+  _globals['_ADDYOUTUBENOTIFICATION']._serialized_start=321
+  _globals['_ADDYOUTUBENOTIFICATION']._serialized_end=404
+  _globals['_REMOVEYOUTUBENOTIFICATION']._serialized_start=406
+  _globals['_REMOVEYOUTUBENOTIFICATION']._serialized_end=471
+  _globals['_INVALIDATEYOUTUBENOTIFICATIONS']._serialized_start=473
+  _globals['_INVALIDATEYOUTUBENOTIFICATIONS']._serialized_end=525
+  _globals['_YOUTUBEUSER']._serialized_start=527
+  _globals['_YOUTUBEUSER']._serialized_end=593
+  _globals['_EMPTY']._serialized_start=595
+  _globals['_EMPTY']._serialized_end=602
+  _globals['_YOUTUBE']._serialized_start=605
+  _globals['_YOUTUBE']._serialized_end=1147
 # @@protoc_insertion_point(module_scope)
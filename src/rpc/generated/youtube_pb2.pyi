@@ -1,6 +1,7 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -12,6 +13,34 @@ class YoutubeNotification(_message.Message):
     video_id: str
     def __init__(self, user_id: _Optional[str] = ..., video_id: _Optional[str] = ...) -> None: ...
 
+class YoutubeNotifications(_message.Message):
+    __slots__ = ("notifications",)
+    NOTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
+    notifications: _containers.RepeatedCompositeFieldContainer[YoutubeNotification]
+    def __init__(self, notifications: _Optional[_Iterable[_Union[YoutubeNotification, _Mapping]]] = ...) -> None: ...
+
+class NotificationAck(_message.Message):
+    __slots__ = ("queued",)
+    QUEUED_FIELD_NUMBER: _ClassVar[int]
+    queued: int
+    def __init__(self, queued: _Optional[int] = ...) -> None: ...
+
+class DeliveryStatus(_message.Message):
+    __slots__ = ("video_id", "guild_id", "channel_id", "delivered", "error", "latency")
+    VIDEO_ID_FIELD_NUMBER: _ClassVar[int]
+    GUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    CHANNEL_ID_FIELD_NUMBER: _ClassVar[int]
+    DELIVERED_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_FIELD_NUMBER: _ClassVar[int]
+    video_id: str
+    guild_id: int
+    channel_id: int
+    delivered: bool
+    error: str
+    latency: float
+    def __init__(self, video_id: _Optional[str] = ..., guild_id: _Optional[int] = ..., channel_id: _Optional[int] = ..., delivered: bool = ..., error: _Optional[str] = ..., latency: _Optional[float] = ...) -> None: ...
+
 class AddYoutubeNotification(_message.Message):
     __slots__ = ("youtube_url", "guild_id", "channel_id")
     YOUTUBE_URL_FIELD_NUMBER: _ClassVar[int]
@@ -30,6 +59,12 @@ class RemoveYoutubeNotification(_message.Message):
     guild_id: int
     def __init__(self, youtube_id: _Optional[str] = ..., guild_id: _Optional[int] = ...) -> None: ...
 
+class InvalidateYoutubeNotifications(_message.Message):
+    __slots__ = ("youtube_id",)
+    YOUTUBE_ID_FIELD_NUMBER: _ClassVar[int]
+    youtube_id: str
+    def __init__(self, youtube_id: _Optional[str] = ...) -> None: ...
+
 class YouTubeUser(_message.Message):
     __slots__ = ("id", "name", "profile_image_url")
     ID_FIELD_NUMBER: _ClassVar[int]
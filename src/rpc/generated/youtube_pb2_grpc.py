@@ -29,6 +29,26 @@ class YoutubeStub(object):
             request_serializer=youtube__pb2.RemoveYoutubeNotification.SerializeToString,
             response_deserializer=youtube__pb2.Empty.FromString,
         )
+        self.InvalidateNotifications = channel.unary_unary(
+            "/Youtube.Youtube/InvalidateNotifications",
+            request_serializer=youtube__pb2.InvalidateYoutubeNotifications.SerializeToString,
+            response_deserializer=youtube__pb2.Empty.FromString,
+        )
+        self.VideoPublishBatch = channel.unary_unary(
+            "/Youtube.Youtube/VideoPublishBatch",
+            request_serializer=youtube__pb2.YoutubeNotifications.SerializeToString,
+            response_deserializer=youtube__pb2.NotificationAck.FromString,
+        )
+        self.VideoPublishStream = channel.stream_unary(
+            "/Youtube.Youtube/VideoPublishStream",
+            request_serializer=youtube__pb2.YoutubeNotification.SerializeToString,
+            response_deserializer=youtube__pb2.NotificationAck.FromString,
+        )
+        self.DeliveryStatusStream = channel.unary_stream(
+            "/Youtube.Youtube/DeliveryStatusStream",
+            request_serializer=youtube__pb2.Empty.SerializeToString,
+            response_deserializer=youtube__pb2.DeliveryStatus.FromString,
+        )
 
 
 class YoutubeServicer(object):
@@ -52,6 +72,30 @@ class YoutubeServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def InvalidateNotifications(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def VideoPublishBatch(self, request, context):
+        """Queues the notifications and returns before they are delivered"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def VideoPublishStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def DeliveryStatusStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_YoutubeServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -70,6 +114,26 @@ def add_YoutubeServicer_to_server(servicer, server):
             request_deserializer=youtube__pb2.RemoveYoutubeNotification.FromString,
             response_serializer=youtube__pb2.Empty.SerializeToString,
         ),
+        "InvalidateNotifications": grpc.unary_unary_rpc_method_handler(
+            servicer.InvalidateNotifications,
+            request_deserializer=youtube__pb2.InvalidateYoutubeNotifications.FromString,
+            response_serializer=youtube__pb2.Empty.SerializeToString,
+        ),
+        "VideoPublishBatch": grpc.unary_unary_rpc_method_handler(
+            servicer.VideoPublishBatch,
+            request_deserializer=youtube__pb2.YoutubeNotifications.FromString,
+            response_serializer=youtube__pb2.NotificationAck.SerializeToString,
+        ),
+        "VideoPublishStream": grpc.stream_unary_rpc_method_handler(
+            servicer.VideoPublishStream,
+            request_deserializer=youtube__pb2.YoutubeNotification.FromString,
+            response_serializer=youtube__pb2.NotificationAck.SerializeToString,
+        ),
+        "DeliveryStatusStream": grpc.unary_stream_rpc_method_handler(
+            servicer.DeliveryStatusStream,
+            request_deserializer=youtube__pb2.Empty.FromString,
+            response_serializer=youtube__pb2.DeliveryStatus.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler("Youtube.Youtube", rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
@@ -165,3 +229,119 @@ class Youtube(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def InvalidateNotifications(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/Youtube.Youtube/InvalidateNotifications",
+            youtube__pb2.InvalidateYoutubeNotifications.SerializeToString,
+            youtube__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def VideoPublishBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/Youtube.Youtube/VideoPublishBatch",
+            youtube__pb2.YoutubeNotifications.SerializeToString,
+            youtube__pb2.NotificationAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def VideoPublishStream(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/Youtube.Youtube/VideoPublishStream",
+            youtube__pb2.YoutubeNotification.SerializeToString,
+            youtube__pb2.NotificationAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def DeliveryStatusStream(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/Youtube.Youtube/DeliveryStatusStream",
+            youtube__pb2.Empty.SerializeToString,
+            youtube__pb2.DeliveryStatus.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
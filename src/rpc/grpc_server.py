@@ -4,8 +4,8 @@ from typing import TYPE_CHECKING
 
 import grpc
 
-from rpc.generated import cache_pb2_grpc, twitch_pb2_grpc, youtube_pb2_grpc
-from rpc.service import TwitchService, UpdateCacheService, YoutubeService
+from rpc.generated import cache_pb2_grpc, diagnostics_pb2_grpc, twitch_pb2_grpc, youtube_pb2_grpc
+from rpc.service import DiagnosticsService, TwitchService, UpdateCacheService, YoutubeService
 
 if TYPE_CHECKING:
     from main import Plyoox
@@ -17,6 +17,7 @@ async def start_server(bot: Plyoox, url: str) -> grpc.aio.Server:
     cache_pb2_grpc.add_UpdateCacheServicer_to_server(UpdateCacheService(bot), server)
     twitch_pb2_grpc.add_TwitchNotificationServicer_to_server(TwitchService(bot), server)
     youtube_pb2_grpc.add_YoutubeServicer_to_server(YoutubeService(bot), server)
+    diagnostics_pb2_grpc.add_DiagnosticsServicer_to_server(DiagnosticsService(bot), server)
 
     server.add_insecure_port(url)
 
@@ -1,5 +1,6 @@
 from .cache import UpdateCacheService
+from .diagnostics import DiagnosticsService
 from .twitch import TwitchService
 from .youtube import YoutubeService
 
-__all__ = ("UpdateCacheService", "TwitchService", "YoutubeService")
+__all__ = ("UpdateCacheService", "DiagnosticsService", "TwitchService", "YoutubeService")
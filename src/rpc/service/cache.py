@@ -1,45 +1,79 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
-from rpc.generated.cache_pb2 import Empty, Id
+import grpc
+
+from rpc.generated.cache_pb2 import CacheStore, Empty, Id, InvalidateBatchRequest
 
 from rpc.generated.cache_pb2_grpc import UpdateCacheServicer
 
 if TYPE_CHECKING:
     from main import Plyoox
+    from cache.manager import CacheType
+
+
+STORES: dict[int, CacheType] = {
+    CacheStore.MODERATION: "mod",
+    CacheStore.AUTO_MODERATION: "automod",
+    CacheStore.WELCOME: "wel",
+    CacheStore.LOGGING: "log",
+    CacheStore.LEVEL: "lvl",
+    CacheStore.MODERATION_PUNISHMENT: "punishment",
+}
 
 
 class UpdateCacheService(UpdateCacheServicer):
+    """The handlers are coroutines, so the caches are only modified on the event loop."""
+
     def __init__(self, bot: Plyoox):
         self.bot = bot
 
-    def DeleteModerationCache(self, request: Id, context):
+    async def DeleteModerationCache(self, request: Id, context):
         self.bot.cache.remove_cache(request.id, "mod")
 
         return Empty()
 
-    def DeleteAutoModerationCache(self, request: Id, context):
+    async def DeleteAutoModerationCache(self, request: Id, context):
         self.bot.cache.remove_cache(request.id, "automod")
 
         return Empty()
 
-    def DeleteWelcomeCache(self, request: Id, context):
+    async def DeleteWelcomeCache(self, request: Id, context):
         self.bot.cache.remove_cache(request.id, "wel")
 
         return Empty()
 
-    def DeleteLoggingCache(self, request: Id, context):
+    async def DeleteLoggingCache(self, request: Id, context):
         self.bot.cache.remove_cache(request.id, "log")
 
         return Empty()
 
-    def DeleteLevelCache(self, request: Id, context):
+    async def DeleteLevelCache(self, request: Id, context):
         self.bot.cache.remove_cache(request.id, "lvl")
 
         return Empty()
 
-    def DeleteModerationPunishmentCache(self, request, context):
+    async def DeleteModerationPunishmentCache(self, request: Id, context):
         self.bot.cache.remove_cache(request.id, "punishment")
 
         return Empty()
+
+    async def InvalidateBatch(self, request: InvalidateBatchRequest, context: grpc.aio.ServicerContext):
+        unknown = {store for store in request.flush if store not in STORES}
+        unknown.update(invalidation.store for invalidation in request.invalidations if invalidation.store not in STORES)
+        if unknown:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Unknown cache stores: {sorted(unknown)}")
+
+        for store in request.flush:
+            self.bot.cache.flush(STORES[store])
+
+        ids: defaultdict[CacheType, list[int]] = defaultdict(list)
+        for invalidation in request.invalidations:
+            ids[STORES[invalidation.store]].append(invalidation.id)
+
+        for store, store_ids in ids.items():
+            self.bot.cache.remove_many(store_ids, store)
+
+        return Empty()
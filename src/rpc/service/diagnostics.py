@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import grpc
+
+from rpc.generated.diagnostics_pb2 import (
+    CacheStoreStats,
+    DatabasePoolStats,
+    Empty,
+    QueueDepth,
+    ShardLatency,
+    Snapshot,
+    StreamSnapshotsRequest,
+)
+from rpc.generated.diagnostics_pb2_grpc import DiagnosticsServicer
+
+if TYPE_CHECKING:
+    from main import Plyoox
+
+# Lower bound of the streaming interval, so a client cannot keep the loop busy
+MIN_STREAM_INTERVAL = 1.0
+
+
+class DiagnosticsService(DiagnosticsServicer):
+    """Exposes the runtime state of the bot. All values are read on the event loop
+    and are only approximations, nothing is locked while the snapshot is taken.
+    """
+
+    def __init__(self, bot: Plyoox):
+        self.bot = bot
+
+    async def GetSnapshot(self, request: Empty, context):
+        return await self._snapshot()
+
+    async def StreamSnapshots(self, request: StreamSnapshotsRequest, context: grpc.aio.ServicerContext):
+        if request.interval < MIN_STREAM_INTERVAL:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, f"The interval must be at least {MIN_STREAM_INTERVAL} seconds"
+            )
+
+        while True:
+            yield await self._snapshot()
+            await asyncio.sleep(request.interval)
+
+    async def _snapshot(self) -> Snapshot:
+        bot = self.bot
+
+        return Snapshot(
+            timestamp=time.time(),
+            loop_lag=await self._measure_loop_lag(),
+            shards=[ShardLatency(shard_id=shard_id, latency=latency) for shard_id, latency in bot.latencies],
+            guilds=len(bot.guilds),
+            members=sum(len(guild.members) for guild in bot.guilds),
+            users=len(bot.users),
+            messages=len(bot.messages),
+            cache_stores=[
+                CacheStoreStats(name=name, size=size, hits=hits, misses=misses)
+                for name, (size, hits, misses) in bot.cache.stats().items()
+            ],
+            database=DatabasePoolStats(
+                size=bot.db.get_size(),
+                idle=bot.db.get_idle_size(),
+                min_size=bot.db.get_min_size(),
+                max_size=bot.db.get_max_size(),
+            ),
+            queues=[QueueDepth(name=name, depth=depth) for name, depth in self._queue_depths().items()],
+        )
+
+    async def _measure_loop_lag(self) -> float:
+        """Returns the time a callback scheduled now waits until it is run."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        start = loop.time()
+        loop.call_soon(future.set_result, None)
+        await future
+
+        return loop.time() - start
+
+    def _queue_depths(self) -> dict[str, int]:
+        bot = self.bot
+        depths = {"webhooks": bot.webhook_queue.metrics()["pending"]}
+
+        if (statistics := bot.get_cog("Statistics")) is not None:
+            depths["command_statistics"] = statistics.queue_depth
+
+        if (timers := bot.get_cog("Timer")) is not None:
+            timer_metrics = timers.metrics()
+            depths["timers_scheduled"] = timer_metrics["scheduled"]
+            depths["timers_running"] = timer_metrics["running"]
+
+        if (event_handler := bot.get_cog("EventHandlerCog")) is not None:
+            depths["log_records"] = event_handler.queue_depth
+
+        if (notification := bot.get_cog("Notification")) is not None:
+            depths["notifications"] = notification.queue_depth
+
+        return depths
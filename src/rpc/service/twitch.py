@@ -3,7 +3,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import datetime
 
-from rpc.generated.twitch_pb2 import TwitchLiveNotification, TwitchOfflineNotification, Empty
+from rpc.generated.twitch_pb2 import (
+    DeliveryStatus,
+    Empty,
+    InvalidateTwitchNotifications,
+    NotificationAck,
+    TwitchLiveNotification,
+    TwitchLiveNotifications,
+    TwitchOfflineNotification,
+)
 from rpc.generated.twitch_pb2_grpc import TwitchNotificationServicer
 
 
@@ -16,6 +24,20 @@ if TYPE_CHECKING:
     )
 
 
+def _to_live_notification(request: TwitchLiveNotification) -> TwitchLiveNotificationType:
+    return {
+        "game": request.game,
+        "name": request.name,
+        "title": request.title,
+        "viewer_count": request.viewer_count,
+        "user_id": request.user_id,
+        "thumbnail_url": request.thumbnail_url,
+        "guild_id": request.guild_id,
+        "started_at": datetime.datetime.fromtimestamp(request.started_at),
+        "stream_id": request.stream_id,
+    }
+
+
 class TwitchService(TwitchNotificationServicer):
     def __init__(self, bot: Plyoox):
         self.bot = bot
@@ -23,22 +45,41 @@ class TwitchService(TwitchNotificationServicer):
     async def LiveNotification(self, request: TwitchLiveNotification, context):
         notification = self.bot.notification
 
-        data: TwitchLiveNotificationType = {
-            "game": request.game,
-            "name": request.name,
-            "title": request.title,
-            "viewer_count": request.viewer_count,
-            "user_id": request.user_id,
-            "thumbnail_url": request.thumbnail_url,
-            "guild_id": request.guild_id,
-            "started_at": datetime.datetime.fromtimestamp(request.started_at),
-            "stream_id": request.stream_id,
-        }
-
-        await notification.send_twitch_notification(data)
+        await notification.send_twitch_notification(_to_live_notification(request))
 
         return Empty()
 
+    async def LiveNotificationBatch(self, request: TwitchLiveNotifications, context):
+        notification = self.bot.notification
+
+        for live_notification in request.notifications:
+            await notification.enqueue_notification(("twitch", _to_live_notification(live_notification)))
+
+        return NotificationAck(queued=len(request.notifications))
+
+    async def LiveNotificationStream(self, request_iterator, context):
+        notification = self.bot.notification
+
+        queued = 0
+        async for live_notification in request_iterator:
+            await notification.enqueue_notification(("twitch", _to_live_notification(live_notification)))
+            queued += 1
+
+        return NotificationAck(queued=queued)
+
+    async def DeliveryStatusStream(self, request: Empty, context):
+        notification = self.bot.notification
+
+        async for status in notification.listen_delivery_status("twitch"):
+            yield DeliveryStatus(
+                stream_id=status["id"],
+                guild_id=status["guild_id"],
+                channel_id=status["channel_id"],
+                delivered=status["delivered"],
+                error=status["error"] or "",
+                latency=status["latency"],
+            )
+
     async def OfflineNotification(self, request: TwitchOfflineNotification, context):
         notification = self.bot.notification
 
@@ -50,3 +91,10 @@ class TwitchService(TwitchNotificationServicer):
         await notification.twitch_offline_edit(data)
 
         return Empty()
+
+    async def InvalidateNotifications(self, request: InvalidateTwitchNotifications, context):
+        notification = self.bot.notification
+        if notification is not None:
+            notification.invalidate_twitch_subscriptions(request.user_id)
+
+        return Empty()
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from rpc.generated.youtube_pb2 import Empty, YoutubeNotification
+from rpc.generated.youtube_pb2 import (
+    DeliveryStatus,
+    Empty,
+    InvalidateYoutubeNotifications,
+    NotificationAck,
+    YoutubeNotification,
+    YoutubeNotifications,
+)
 from rpc.generated.youtube_pb2_grpc import YoutubeServicer
 
 
@@ -11,6 +18,13 @@ if TYPE_CHECKING:
     from lib.types import YoutubeVideoNotification
 
 
+def _to_video_notification(request: YoutubeNotification) -> YoutubeVideoNotification:
+    return {
+        "user_id": request.user_id,
+        "video_id": request.video_id,
+    }
+
+
 class YoutubeService(YoutubeServicer):
     def __init__(self, bot: Plyoox):
         self.bot = bot
@@ -18,11 +32,44 @@ class YoutubeService(YoutubeServicer):
     async def VideoPublish(self, request: YoutubeNotification, context):
         notification = self.bot.notification
 
-        data: YoutubeVideoNotification = {
-            "user_id": request.user_id,
-            "video_id": request.video_id,
-        }
+        await notification.send_youtube_notification(_to_video_notification(request))
+
+        return Empty()
+
+    async def VideoPublishBatch(self, request: YoutubeNotifications, context):
+        notification = self.bot.notification
+
+        for video_notification in request.notifications:
+            await notification.enqueue_notification(("youtube", _to_video_notification(video_notification)))
+
+        return NotificationAck(queued=len(request.notifications))
+
+    async def VideoPublishStream(self, request_iterator, context):
+        notification = self.bot.notification
+
+        queued = 0
+        async for video_notification in request_iterator:
+            await notification.enqueue_notification(("youtube", _to_video_notification(video_notification)))
+            queued += 1
+
+        return NotificationAck(queued=queued)
+
+    async def DeliveryStatusStream(self, request: Empty, context):
+        notification = self.bot.notification
+
+        async for status in notification.listen_delivery_status("youtube"):
+            yield DeliveryStatus(
+                video_id=status["id"],
+                guild_id=status["guild_id"],
+                channel_id=status["channel_id"],
+                delivered=status["delivered"],
+                error=status["error"] or "",
+                latency=status["latency"],
+            )
 
-        await notification.send_youtube_notification(data)
+    async def InvalidateNotifications(self, request: InvalidateYoutubeNotifications, context):
+        notification = self.bot.notification
+        if notification is not None:
+            notification.invalidate_youtube_subscriptions(request.youtube_id)
 
         return Empty()
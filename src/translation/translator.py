@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import gettext
 import importlib.resources
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Iterator
 
 import discord
@@ -62,13 +64,64 @@ class EmptyTranslations(gettext.NullTranslations):
         return msgid1 if n == 1 else msgid2
 
 
+def load_catalogs() -> MappingProxyType[str, gettext.NullTranslations]:
+    """Loads the compiled catalogs of all locales. Every catalog falls back to `en_US`
+    and then to the original message.
+    """
+    translations: dict[str, gettext.GNUTranslations] = {}
+
+    for path in yield_mo_paths():
+        if path.stem != DOMAIN:
+            continue
+
+        with path.open("rb") as file:
+            translations[path.parent.parent.name] = gettext.GNUTranslations(file)
+
+    fallback: gettext.NullTranslations = EmptyTranslations()
+    if (default := translations.get("en_US")) is not None:
+        default.add_fallback(fallback)
+        fallback = default
+
+    for locale, t in translations.items():
+        if locale != "en_US":
+            t.add_fallback(fallback)
+
+    # Locales without a catalog use the default catalog
+    translations.setdefault("en_US", fallback)
+
+    return MappingProxyType(translations)
+
+
 class GettextTranslator(app_commands.Translator):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-        if not any(yield_mo_paths()):
+        # Incremented on every reload, so translations cached elsewhere can be invalidated
+        self.version = 0
+        self._catalogs = load_catalogs()
+        self._translate_message = functools.lru_cache(maxsize=8192)(self._translate_message_uncached)
+
+        if len(self._catalogs) == 1 and isinstance(self._catalogs["en_US"], EmptyTranslations):
             _log.warning("No compiled localizations detected")
 
+    def reload(self) -> None:
+        """Reloads the catalogs from the disk and clears the cached translations."""
+        self._catalogs = load_catalogs()
+        self._translate_message.cache_clear()
+        self.version += 1
+
+        _log.info(f"Reloaded translations for {len(self._catalogs)} locales")
+
+    def _translate_message_uncached(self, message: str, plural: str | None, locale: str, n: int | None) -> str:
+        t = self._catalogs.get(locale) or self._catalogs.get("en_US")
+        if t is None:
+            raise TranslationError(f"Failed to load locale {locale}")
+
+        if plural is not None:
+            return t.ngettext(message, plural, n)
+
+        return t.gettext(message)
+
     def translate(
         self,
         string: app_commands.locale_str,
@@ -79,24 +132,12 @@ class GettextTranslator(app_commands.Translator):
             if locale not in AVAILABLE_LOCALES:
                 return None
 
-        try:
-            t = gettext.translation(
-                domain=DOMAIN,
-                localedir=str(_LOCALES_PATH),
-                languages=(get_locale(locale), "en_US"),
-            )
-        except OSError as e:
-            _log.error(f"Failed to load locale {locale}", e)
-            raise TranslationError(f"Failed to load locale {locale}") from e
-
-        t.add_fallback(EmptyTranslations())
-
         plural: str | None = string.extras.get("plural")
         if plural is not None:
             assert isinstance(context.data, int)
-            translated = t.ngettext(string.message, plural, context.data)
+            translated = self._translate_message(string.message, plural, get_locale(locale), context.data)
         else:
-            translated = t.gettext(string.message)
+            translated = self._translate_message(string.message, None, get_locale(locale), None)
 
         if context.location is TranslationContextLocation.other and isinstance(context.data, dict):
             translated = translated.format(**context.data)